@@ -0,0 +1,406 @@
+"""Benchmarks for the isodate parse and format functions.
+
+Usage:
+  python benchmarks/bench.py [-k PATTERN] [-o RESULTS.json]
+  python benchmarks/bench.py --compare BASELINE.json [RESULTS.json]
+
+Every benchmark runs one function over a generated corpus (see corpus.py) and
+reports the best and the median time per call in nanoseconds. The import
+benchmarks time importing isodate in a new interpreter instead. The results can
+be written to a JSON file and compared against the results of another commit.
+When comparing, the exit status is 1 if any benchmark got slower by more than
+--threshold percent.
+
+APIs added after the parse and format functions of the first release are
+looked up at run time, and their benchmarks are skipped if the installed
+isodate does not provide them, so the suite runs against earlier commits too.
+
+Only the standard library is needed to run the benchmarks.
+"""
+
+import argparse
+import json
+import operator
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Callable, NamedTuple, Optional
+
+import corpus
+
+import isodate
+from isodate import (
+    D_DEFAULT,
+    D_WEEK,
+    DATE_BAS_COMPLETE,
+    DATE_EXT_COMPLETE,
+    DATE_EXT_ORD_COMPLETE,
+    DATE_EXT_WEEK_COMPLETE,
+    TIME_EXT_COMPLETE,
+    TZ_EXT,
+    Duration,
+    parse_date,
+    parse_datetime,
+    parse_duration,
+    parse_time,
+    parse_tzinfo,
+    strftime,
+)
+
+FORMAT_VERSION = 1
+# version of the JSON result format.
+
+IMPORT_BENCHMARKS = {
+    "import.isodate": "import isodate",
+    "import.parse_datetime": "from isodate import parse_datetime",
+    "import.first_parse_datetime": (
+        "from isodate import parse_datetime; parse_datetime('2012-06-15T10:20:30Z')"
+    ),
+    "import.warmup": "import isodate; isodate.warmup()",
+}
+# code timed in a fresh interpreter to catch import time regressions.
+
+IMPORT_TIMER = (
+    "import time; start = time.perf_counter_ns(); %s; print(time.perf_counter_ns() - start)"
+)
+# wraps the code of an import benchmark to print its duration in nanoseconds.
+
+
+class Benchmark(NamedTuple):
+    """A function run over a corpus of values."""
+
+    name: str
+    func: Callable[..., Any]
+    values: list[Any]
+    per_value: bool = True
+    # False if func is called once with the whole corpus.
+
+
+def _optional(name: str) -> Any:
+    """Return the isodate API name, or None if this version does not have it."""
+    return getattr(isodate, name, None)
+
+
+def _accepts(func: Callable[..., Any], *args: Any, **kwargs: Any) -> bool:
+    """Return whether this version of func accepts the arguments."""
+    try:
+        func(*args, **kwargs)
+    except TypeError:
+        return False
+    return True
+
+
+def _parse_benchmarks(
+    prefix: str, func: Callable[..., Any], corpora: dict[str, list[str]], **kwargs: Any
+) -> list[Benchmark]:
+    """Return one benchmark per corpus for a parse function."""
+    benchmarks = []
+    for family, values in corpora.items():
+        call = (lambda value, func=func, kwargs=kwargs: func(value, **kwargs)) if kwargs else func
+        benchmarks.append(Benchmark("%s.%s" % (prefix, family), call, values))
+    return benchmarks
+
+
+def _fromisoformat_benchmarks(
+    prefix: str, func: Callable[[str], Any], corpora: dict[str, list[str]]
+) -> list[Benchmark]:
+    """Return benchmarks for the corpora fromisoformat accepts on this Python."""
+    benchmarks = []
+    for family, values in corpora.items():
+        try:
+            for value in values:
+                func(value)
+        except ValueError:
+            continue
+        benchmarks.append(Benchmark("%s.%s" % (prefix, family), func, values))
+    return benchmarks
+
+
+def build_benchmarks(size: int = corpus.SIZE) -> list[Benchmark]:
+    """Return all benchmarks with corpora of the given size."""
+    dates = corpus.date_corpora(size)
+    expanded = {"expanded": dates.pop("expanded")}
+    times = corpus.time_corpora(size)
+    datetimes = corpus.datetime_corpora(size)
+    dt_values = corpus.datetime_values(size)
+    durations = corpus.duration_values(size)
+    timedeltas = corpus.timedelta_values(size)
+    naive_values = [dt.replace(tzinfo=None) for dt in dt_values]
+    duration_pairs = list(zip(durations, durations[1:] + durations[:1]))
+    dt_duration_pairs = list(zip(naive_values, durations))
+
+    benchmarks = []
+    benchmarks += _parse_benchmarks("parse_date", parse_date, dates)
+    benchmarks += _parse_benchmarks("parse_date", parse_date, expanded, yeardigits=6, expanded=True)
+    benchmarks += _parse_benchmarks("parse_time", parse_time, times)
+    benchmarks += _parse_benchmarks("parse_datetime", parse_datetime, datetimes)
+    if _accepts(parse_datetime, "2012-06-15T10:20Z", to_utc=True):
+        benchmarks += _parse_benchmarks(
+            "parse_datetime.to_utc",
+            parse_datetime,
+            {"fraction_tz": datetimes["fraction_tz"]},
+            to_utc=True,
+        )
+    for name, corpora in (("date", dates), ("time", times), ("datetime", datetimes)):
+        parse_fields = _optional("parse_%s_fields" % name)
+        if parse_fields is not None:
+            benchmarks += _parse_benchmarks("parse_%s_fields" % name, parse_fields, corpora)
+    benchmarks += _parse_benchmarks("parse_duration", parse_duration, corpus.duration_corpora(size))
+    parse_interval = _optional("parse_interval")
+    if parse_interval is not None:
+        intervals = corpus.interval_corpus(size)
+        benchmarks.append(Benchmark("parse_interval", parse_interval, intervals))
+        index = isodate.IntervalIndex(parse_interval(value) for value in intervals)
+        instants = [value.replace(tzinfo=timezone.utc) for value in naive_values]
+        benchmarks.append(Benchmark("interval_index.containing", index.containing, instants))
+    recurring_interval = _optional("RecurringInterval")
+    if recurring_interval is not None:
+        recurring = recurring_interval(datetime(1900, 1, 31, 10), Duration(months=1, hours=1))
+        benchmarks.append(
+            Benchmark(
+                "recurring_interval.occurrences_between",
+                lambda instant: list(
+                    recurring.occurrences_between(instant, instant + timedelta(days=62))
+                ),
+                naive_values,
+            )
+        )
+    benchmarks.append(Benchmark("parse_tzinfo", parse_tzinfo, corpus.tzinfo_corpus(size)))
+    adaptive_parser = _optional("AdaptiveParser")
+    if adaptive_parser is not None:
+        for kind, corpora in (("date", dates), ("time", times), ("datetime", datetimes)):
+            for family, values in corpora.items():
+                name = "adaptive.%s.%s" % (kind, family)
+                benchmarks.append(Benchmark(name, adaptive_parser(kind), values))
+
+    find_datetimes = _optional("find_datetimes")
+    if find_datetimes is not None:
+        benchmarks.append(
+            Benchmark(
+                "find_datetimes.log",
+                lambda lines: find_datetimes("\n".join(lines)),
+                corpus.log_lines(size),
+                per_value=False,
+            )
+        )
+
+    benchmarks += _fromisoformat_benchmarks("fromisoformat.date", date.fromisoformat, dates)
+    benchmarks += _fromisoformat_benchmarks("fromisoformat.time", time.fromisoformat, times)
+    benchmarks += _fromisoformat_benchmarks(
+        "fromisoformat.datetime", datetime.fromisoformat, datetimes
+    )
+
+    for name, format, values in [
+        ("date_ext", DATE_EXT_COMPLETE, dt_values),
+        ("date_bas", DATE_BAS_COMPLETE, dt_values),
+        ("week", DATE_EXT_WEEK_COMPLETE, dt_values),
+        ("ordinal", DATE_EXT_ORD_COMPLETE, dt_values),
+        ("datetime_ext", DATE_EXT_COMPLETE + "T" + TIME_EXT_COMPLETE + TZ_EXT, dt_values),
+        ("datetime_bas", "%Y%m%dT%H%M%S.%f%z", dt_values),
+        ("duration", D_DEFAULT, durations),
+        ("timedelta", D_DEFAULT, timedeltas),
+        ("timedelta_week", D_WEEK, timedeltas),
+    ]:
+        benchmarks.append(
+            Benchmark(
+                "strftime." + name, lambda value, format=format: strftime(value, format), values
+            )
+        )
+    format_many = _optional("format_many")
+    if format_many is not None:
+        benchmarks.append(
+            Benchmark(
+                "format_many.datetime_ext",
+                lambda values: format_many(values, DATE_EXT_COMPLETE + "T" + TIME_EXT_COMPLETE),
+                naive_values,
+                per_value=False,
+            )
+        )
+    benchmarks.append(Benchmark("isoformat.datetime", datetime.isoformat, dt_values))
+
+    encoder, decoder = _optional("ISOJSONEncoder"), _optional("ISOJSONDecoder")
+    if encoder is not None and decoder is not None:
+        records = [
+            {"id": index, "name": "record %d" % index, "created": value, "ttl": duration}
+            for index, (value, duration) in enumerate(zip(dt_values, durations))
+        ]
+        document = json.dumps(records, cls=encoder)
+        benchmarks.append(
+            Benchmark(
+                "json.encode",
+                lambda values: json.dumps(values, cls=encoder),
+                records,
+                per_value=False,
+            )
+        )
+        benchmarks.append(
+            Benchmark(
+                "json.decode",
+                lambda values, document=document: decoder(
+                    keys=["created"], paths={"*.ttl": "duration"}
+                ).decode(document),
+                records,
+                per_value=False,
+            )
+        )
+
+    for name, func, values in [
+        ("add_datetime", lambda pair: pair[0] + pair[1], dt_duration_pairs),
+        ("sub_datetime", lambda pair: pair[0] - pair[1], dt_duration_pairs),
+        ("add_duration", lambda pair: pair[0] + pair[1], duration_pairs),
+        ("eq", lambda pair: pair[0] == pair[1], duration_pairs),
+        ("hash", hash, durations),
+        ("totimedelta", lambda pair: pair[1].totimedelta(pair[0]), dt_duration_pairs),
+    ]:
+        benchmarks.append(Benchmark("duration." + name, func, values))
+    return benchmarks
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int) -> dict[str, Any]:
+    """Run a benchmark repeat times and return its timings per call."""
+    func, values = benchmark.func, benchmark.values
+    if benchmark.per_value:
+
+        def loop() -> None:
+            for value in values:
+                func(value)
+
+    else:
+
+        def loop() -> None:
+            func(values)
+
+    loop()  # warm up caches and fail early
+    timings = timeit.Timer(loop).repeat(repeat=repeat, number=1)
+    per_call = [timing * 1e9 / len(values) for timing in timings]
+    return {
+        "calls": len(values),
+        "best_ns": round(min(per_call), 1),
+        "median_ns": round(statistics.median(per_call), 1),
+    }
+
+
+def run_import_benchmark(code: str, repeat: int) -> Optional[dict[str, Any]]:
+    """Time code repeat times, each time in a new interpreter.
+
+    Returns None if code fails, e.g. as this version of isodate lacks an API.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    timings = []
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-c", IMPORT_TIMER % code],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if process.returncode:
+            return None
+        timings.append(int(process.stdout))
+    return {
+        "calls": 1,
+        "best_ns": float(min(timings)),
+        "median_ns": float(statistics.median(timings)),
+    }
+
+
+def run(pattern: Optional[str], size: int, repeat: int) -> dict[str, Any]:
+    """Run all benchmarks whose name contains pattern and return the results."""
+    results = {}
+    for benchmark in build_benchmarks(size):
+        if pattern and pattern not in benchmark.name:
+            continue
+        results[benchmark.name] = result = run_benchmark(benchmark, repeat)
+        print("%-40s %12.1f ns" % (benchmark.name, result["best_ns"]), flush=True)
+    for name, code in IMPORT_BENCHMARKS.items():
+        if pattern and pattern not in name:
+            continue
+        result = run_import_benchmark(code, repeat)
+        if result is None:
+            print("%-40s %15s" % (name, "skipped"), flush=True)
+            continue
+        results[name] = result
+        print("%-40s %12.1f ns" % (name, result["best_ns"]), flush=True)
+    return {
+        "format": FORMAT_VERSION,
+        "meta": {
+            "isodate": isodate.__version__,
+            "python": sys.version,
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "created": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "size": size,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict[str, Any], results: dict[str, Any], threshold: float) -> list[str]:
+    """Print the change of every benchmark against the baseline.
+
+    Returns the names of the benchmarks which got slower by more than
+    threshold percent.
+    """
+    regressions = []
+    print("%-40s %12s %12s %8s" % ("benchmark", "baseline", "current", "change"))
+    for name, result in sorted(results["results"].items(), key=operator.itemgetter(0)):
+        base = baseline["results"].get(name)
+        if base is None:
+            print("%-40s %12s %12.1f %8s" % (name, "-", result["best_ns"], "new"))
+            continue
+        change = (result["best_ns"] / base["best_ns"] - 1) * 100
+        marker = ""
+        if change > threshold:
+            regressions.append(name)
+            marker = "  <-- slower"
+        print(
+            "%-40s %12.1f %12.1f %+7.1f%%%s"
+            % (name, base["best_ns"], result["best_ns"], change, marker)
+        )
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("-k", dest="pattern", help="only run benchmarks containing PATTERN")
+    parser.add_argument("-o", "--output", help="write the results as JSON to OUTPUT")
+    parser.add_argument("--size", type=int, default=corpus.SIZE, help="values per corpus")
+    parser.add_argument("--repeat", type=int, default=7, help="timing repetitions")
+    parser.add_argument(
+        "--compare",
+        nargs="+",
+        metavar="JSON",
+        help="compare against BASELINE.json, using RESULTS.json instead of a new run if given",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=10.0, help="allowed slow down in percent"
+    )
+    args = parser.parse_args(argv)
+
+    if args.compare and len(args.compare) > 2:
+        parser.error("--compare takes at most two result files")
+    if args.compare and len(args.compare) == 2:
+        with open(args.compare[1]) as stream:
+            results = json.load(stream)
+    else:
+        results = run(args.pattern, args.size, args.repeat)
+    if args.output:
+        with open(args.output, "w") as stream:
+            json.dump(results, stream, indent=2, sort_keys=True)
+            stream.write("\n")
+    if args.compare:
+        with open(args.compare[0]) as stream:
+            baseline = json.load(stream)
+        if compare(baseline, results, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
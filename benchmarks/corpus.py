@@ -0,0 +1,230 @@
+"""Generated input corpora for the isodate benchmarks.
+
+All corpora are built from a seeded random generator, so every run (and every
+commit) benchmarks exactly the same strings and values.
+"""
+
+import random
+from datetime import date, datetime, time, timedelta, timezone
+
+from isodate import Duration
+
+SEED = 8601
+# seed of the random generator, change it only together with the baseline.
+
+SIZE = 1000
+# default number of values per corpus.
+
+TZ_DESIGNATORS = ["Z", "+01:00", "-05:30", "+0200", "-0800", "+05", "-11"]
+# time zone designators mixed into time and datetime corpora.
+
+
+def _random_dates(rng: random.Random, size: int) -> list[date]:
+    """Return size random dates between 1900 and 2100."""
+    start = date(1900, 1, 1).toordinal()
+    end = date(2100, 12, 31).toordinal()
+    return [date.fromordinal(rng.randint(start, end)) for _ in range(size)]
+
+
+def _random_times(rng: random.Random, size: int) -> list[time]:
+    """Return size random times with microseconds."""
+    return [
+        time(rng.randrange(24), rng.randrange(60), rng.randrange(60), rng.randrange(1000000))
+        for _ in range(size)
+    ]
+
+
+def date_corpora(size: int = SIZE) -> dict[str, list[str]]:
+    """Return ISO date strings grouped by format family.
+
+    The expanded corpus has to be parsed with yeardigits=6 and expanded=True.
+    """
+    rng = random.Random(SEED)
+    dates = _random_dates(rng, size)
+    weeks = [d.isocalendar() for d in dates]
+    return {
+        "complete_ext": [d.strftime("%Y-%m-%d") for d in dates],
+        "complete_bas": [d.strftime("%Y%m%d") for d in dates],
+        "week_ext": ["%04d-W%02d-%d" % tuple(w) for w in weeks],
+        "week_bas": ["%04dW%02d%d" % tuple(w) for w in weeks],
+        "ordinal_ext": ["%04d-%03d" % (d.year, d.timetuple().tm_yday) for d in dates],
+        "ordinal_bas": ["%04d%03d" % (d.year, d.timetuple().tm_yday) for d in dates],
+        "reduced": [
+            rng.choice(
+                [
+                    "%04d-%02d" % (d.year, d.month),
+                    "%04d" % d.year,
+                    "%02d" % (d.year // 100),
+                    "%04d-W%02d" % (w[0], w[1]),
+                ]
+            )
+            for d, w in zip(dates, weeks)
+        ],
+        "expanded": ["+%06d-%02d-%02d" % (d.year, d.month, d.day) for d in dates],
+    }
+
+
+def time_corpora(size: int = SIZE) -> dict[str, list[str]]:
+    """Return ISO time strings grouped by format family."""
+    rng = random.Random(SEED + 1)
+    times = _random_times(rng, size)
+    return {
+        "complete_ext": [t.strftime("%H:%M:%S") for t in times],
+        "complete_bas": [t.strftime("%H%M%S") for t in times],
+        "fraction": [t.strftime("%H:%M:%S.%f") for t in times],
+        "reduced": [
+            rng.choice(
+                [t.strftime("%H:%M"), t.strftime("%H%M"), t.strftime("%H"), "%02d,5" % t.hour]
+            )
+            for t in times
+        ],
+        "tz": [t.strftime("%H:%M:%S") + rng.choice(TZ_DESIGNATORS) for t in times],
+    }
+
+
+def datetime_corpora(size: int = SIZE) -> dict[str, list[str]]:
+    """Return ISO datetime strings grouped by format family."""
+    rng = random.Random(SEED + 2)
+    dates = _random_dates(rng, size)
+    times = _random_times(rng, size)
+    values = [datetime.combine(d, t) for d, t in zip(dates, times)]
+    return {
+        "complete_ext": [dt.strftime("%Y-%m-%dT%H:%M:%S") for dt in values],
+        "complete_bas": [dt.strftime("%Y%m%dT%H%M%S") for dt in values],
+        "fraction_tz": [
+            dt.strftime("%Y-%m-%dT%H:%M:%S.%f") + rng.choice(TZ_DESIGNATORS) for dt in values
+        ],
+        "week": [
+            "%04d-W%02d-%dT" % tuple(dt.isocalendar()) + dt.strftime("%H:%M") for dt in values
+        ],
+        "ordinal": [dt.strftime("%Y-%jT%H:%M:%SZ") for dt in values],
+    }
+
+
+def duration_corpora(size: int = SIZE) -> dict[str, list[str]]:
+    """Return ISO duration strings grouped by format family."""
+    rng = random.Random(SEED + 3)
+
+    def component(value: int, designator: str) -> str:
+        return "%d%s" % (value, designator) if value else ""
+
+    full = []
+    for _ in range(size):
+        date_part = (
+            component(rng.randrange(10), "Y")
+            + component(rng.randrange(12), "M")
+            + component(rng.randrange(31), "D")
+        )
+        time_part = (
+            component(rng.randrange(24), "H")
+            + component(rng.randrange(60), "M")
+            + component(rng.randrange(60), "S")
+        )
+        full.append("P" + (date_part or "0D") + ("T" + time_part if time_part else ""))
+    return {
+        "full": full,
+        "time": ["PT%dH%dM%d.%06dS" % _time_fields(rng) for _ in range(size)],
+        "week": ["P%dW" % rng.randrange(1, 520) for _ in range(size)],
+        "fraction": ["P%d.%dD" % (rng.randrange(1000), rng.randrange(10)) for _ in range(size)],
+        "alternative": [
+            "P%04d-%02d-%02dT%02d:%02d:%02d"
+            % (
+                rng.randrange(1, 10),
+                rng.randrange(1, 13),
+                rng.randrange(1, 29),
+                rng.randrange(24),
+                rng.randrange(60),
+                rng.randrange(60),
+            )
+            for _ in range(size)
+        ],
+    }
+
+
+def interval_corpus(size: int = SIZE) -> list[str]:
+    """Return ISO intervals as start/end, start/duration and duration/end."""
+    rng = random.Random(SEED + 6)
+    starts = datetime_corpora(size)["complete_ext"]
+    durations = duration_corpora(size)["time"]
+    values = []
+    for start, duration in zip(starts, durations):
+        form = rng.randrange(3)
+        if form == 0:
+            end = datetime.fromisoformat(start) + timedelta(minutes=rng.randrange(1, 600))
+            values.append("%sZ/%sZ" % (start, end.isoformat()))
+        elif form == 1:
+            values.append("%sZ/%s" % (start, duration))
+        else:
+            values.append("%s/%sZ" % (duration, start))
+    return values
+
+
+LOG_MESSAGES = [
+    "GET /index.html 200",
+    "worker 7 restarted after %s",
+    "cache miss for key user:1024, retrying",
+    "job 2012 finished in %s with 3 warnings",
+    "connection from 10.0.0.1:8080 closed",
+]
+# messages of the log lines, %s is replaced by a duration.
+
+
+def log_lines(size: int = SIZE) -> list[str]:
+    """Return log lines starting with a date-time, some with a duration or a
+    date in the message.
+    """
+    rng = random.Random(SEED + 5)
+    durations = duration_corpora(size)["full"]
+    lines = []
+    for value, duration in zip(datetime_corpora(size)["fraction_tz"], durations):
+        message = rng.choice(LOG_MESSAGES)
+        if "%s" in message:
+            message %= duration
+        elif rng.random() < 0.2:
+            message += " since " + value[:10]
+        lines.append("%s INFO [main] %s" % (value, message))
+    return lines
+
+
+def _time_fields(rng: random.Random) -> tuple[int, int, int, int]:
+    """Return random hours, minutes, seconds and microseconds."""
+    return rng.randrange(100), rng.randrange(60), rng.randrange(60), rng.randrange(1000000)
+
+
+def tzinfo_corpus(size: int = SIZE) -> list[str]:
+    """Return ISO time zone designators."""
+    rng = random.Random(SEED + 4)
+    return [rng.choice(TZ_DESIGNATORS) for _ in range(size)]
+
+
+def datetime_values(size: int = SIZE) -> list[datetime]:
+    """Return datetime values with and without time zone for formatting."""
+    rng = random.Random(SEED + 5)
+    zones = [None, timezone.utc, timezone(timedelta(hours=5, minutes=30))]
+    return [
+        datetime.combine(d, t, rng.choice(zones))
+        for d, t in zip(_random_dates(rng, size), _random_times(rng, size))
+    ]
+
+
+def duration_values(size: int = SIZE) -> list[Duration]:
+    """Return Duration values with years and months for arithmetic and formatting."""
+    rng = random.Random(SEED + 6)
+    return [
+        Duration(
+            days=rng.randrange(-400, 400),
+            seconds=rng.randrange(86400),
+            months=rng.randrange(-24, 24),
+            years=rng.randrange(-5, 5),
+        )
+        for _ in range(size)
+    ]
+
+
+def timedelta_values(size: int = SIZE) -> list[timedelta]:
+    """Return timedelta values for formatting."""
+    rng = random.Random(SEED + 7)
+    return [
+        timedelta(days=rng.randrange(-400, 400), microseconds=rng.randrange(86400 * 10**6))
+        for _ in range(size)
+    ]
@@ -0,0 +1,108 @@
+"""Measure how parse_many scales with the number of threads.
+
+Usage:
+  python benchmarks/scaling.py [--threads 1,2,4,8] [-o RESULTS.json]
+
+Parses a generated datetime corpus with parse_many on 1, 2, 4, ... threads
+and reports the throughput and the speedup against one thread. Threads only
+run in parallel on free-threaded builds (python3.13t and later); with the
+global interpreter lock the speedup stays at about 1.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import corpus
+
+import isodate
+
+
+def gil_enabled() -> bool:
+    """Return whether the interpreter runs with the global interpreter lock."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def measure(values: list[str], threads: int, chunksize: int, repeat: int) -> float:
+    """Return the best time in seconds to parse values on threads threads."""
+    timings = []
+    with ThreadPoolExecutor(threads) as executor:
+        # warm up the pool and the caches
+        isodate.parse_many(values[: chunksize * threads], chunksize=chunksize, executor=executor)
+        for _ in range(repeat):
+            start = time.perf_counter()
+            isodate.parse_many(values, chunksize=chunksize, executor=executor)
+            timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(thread_counts: list[int], size: int, chunksize: int, repeat: int) -> dict[str, Any]:
+    """Measure all thread counts and return the results."""
+    values = corpus.datetime_corpora(size)["fraction_tz"]
+    results = {}
+    base = None
+    for threads in thread_counts:
+        seconds = measure(values, threads, chunksize, repeat)
+        # without a run on one thread, assume linear scaling up to the first count
+        base = base or seconds * threads
+        results[str(threads)] = result = {
+            "values_per_second": round(len(values) / seconds),
+            "speedup": round(base / seconds, 2),
+        }
+        result["efficiency"] = round(result["speedup"] / threads, 2)
+        print(
+            "%3d threads %12d values/s  speedup %5.2f  efficiency %4.2f"
+            % (threads, result["values_per_second"], result["speedup"], result["efficiency"]),
+            flush=True,
+        )
+    return {
+        "meta": {
+            "isodate": isodate.__version__,
+            "python": sys.version,
+            "implementation": platform.python_implementation(),
+            "gil_enabled": gil_enabled(),
+            "cpus": os.cpu_count(),
+            "created": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "size": size,
+            "chunksize": chunksize,
+        },
+        "results": results,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command line entry point."""
+    cpus = os.cpu_count() or 1
+    default_threads = [n for n in (1, 2, 4, 8, 16, 32, 64) if n <= cpus] or [1]
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--threads",
+        type=lambda text: [int(n) for n in text.split(",")],
+        default=default_threads,
+        help="comma separated thread counts",
+    )
+    parser.add_argument("--size", type=int, default=50000, help="values to parse")
+    parser.add_argument("--chunksize", type=int, default=isodate.isobatch.BATCH_CHUNK_SIZE)
+    parser.add_argument("--repeat", type=int, default=3, help="timing repetitions")
+    parser.add_argument("-o", "--output", help="write the results as JSON to OUTPUT")
+    args = parser.parse_args(argv)
+
+    if gil_enabled():
+        print("note: the GIL is enabled, threads do not parse in parallel", file=sys.stderr)
+    results = run(args.threads, args.size, args.chunksize, args.repeat)
+    if args.output:
+        with open(args.output, "w") as stream:
+            json.dump(results, stream, indent=2, sort_keys=True)
+            stream.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,52 +3,233 @@ Import all essential functions and constants to re-export them here for easy
 access.
 
 This module contains also various pre-defined ISO 8601 format strings.
+
+The submodules are imported lazily, when one of their names is accessed the
+first time, so that importing isodate is cheap. Use warmup to import and
+prepare everything in advance.
 """
 
-from isodate.duration import Duration
-from isodate.isodates import date_isoformat, parse_date
-from isodate.isodatetime import datetime_isoformat, parse_datetime
-from isodate.isoduration import duration_isoformat, parse_duration
-from isodate.isoerror import ISO8601Error
-from isodate.isostrf import (
-    D_ALT_BAS,
-    D_ALT_BAS_ORD,
-    D_ALT_EXT,
-    D_ALT_EXT_ORD,
-    D_DEFAULT,
-    D_WEEK,
-    DATE_BAS_COMPLETE,
-    DATE_BAS_MONTH,
-    DATE_BAS_ORD_COMPLETE,
-    DATE_BAS_WEEK,
-    DATE_BAS_WEEK_COMPLETE,
-    DATE_CENTURY,
-    DATE_EXT_COMPLETE,
-    DATE_EXT_MONTH,
-    DATE_EXT_ORD_COMPLETE,
-    DATE_EXT_WEEK,
-    DATE_EXT_WEEK_COMPLETE,
-    DATE_YEAR,
-    DT_BAS_COMPLETE,
-    DT_BAS_ORD_COMPLETE,
-    DT_BAS_WEEK_COMPLETE,
-    DT_EXT_COMPLETE,
-    DT_EXT_ORD_COMPLETE,
-    DT_EXT_WEEK_COMPLETE,
-    TIME_BAS_COMPLETE,
-    TIME_BAS_MINUTE,
-    TIME_EXT_COMPLETE,
-    TIME_EXT_MINUTE,
-    TIME_HOUR,
-    TZ_BAS,
-    TZ_EXT,
-    TZ_HOUR,
-    strftime,
-)
-from isodate.isotime import parse_time, time_isoformat
-from isodate.isotzinfo import parse_tzinfo, tz_isoformat
-from isodate.tzinfo import LOCAL, UTC, FixedOffset
-from isodate.version import version as __version__
+from __future__ import annotations
+
+import importlib
+
+TYPE_CHECKING = False
+# typing.TYPE_CHECKING without importing typing, which is slow to import.
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from isodate.duration import Duration
+    from isodate.isoadaptive import AdaptiveParser
+    from isodate.isobatch import parse_many
+    from isodate.isodates import date_isoformat, parse_date
+    from isodate.isodatetime import datetime_isoformat, parse_datetime
+    from isodate.isodetect import ISOFormat, detect_format
+    from isodate.isoduration import (
+        duration_isoformat,
+        parse_duration,
+        parse_duration_ints,
+    )
+    from isodate.isoerror import ISO8601Error
+    from isodate.isofields import (
+        ISOFields,
+        parse_date_fields,
+        parse_datetime_fields,
+        parse_time_fields,
+    )
+    from isodate.isointerval import (
+        Interval,
+        IntervalIndex,
+        RecurringInterval,
+        parse_interval,
+        parse_recurring_interval,
+    )
+    from isodate.isojson import ISOJSONDecoder, ISOJSONEncoder
+    from isodate.isonumpy import parse_duration_array
+    from isodate.isoscan import find_datetimes, iter_datetimes
+    from isodate.isostats import enable_stats, get_stats, reset_stats
+    from isodate.isostrf import (
+        D_ALT_BAS,
+        D_ALT_BAS_ORD,
+        D_ALT_EXT,
+        D_ALT_EXT_ORD,
+        D_DEFAULT,
+        D_WEEK,
+        DATE_BAS_COMPLETE,
+        DATE_BAS_MONTH,
+        DATE_BAS_ORD_COMPLETE,
+        DATE_BAS_WEEK,
+        DATE_BAS_WEEK_COMPLETE,
+        DATE_CENTURY,
+        DATE_EXT_COMPLETE,
+        DATE_EXT_MONTH,
+        DATE_EXT_ORD_COMPLETE,
+        DATE_EXT_WEEK,
+        DATE_EXT_WEEK_COMPLETE,
+        DATE_YEAR,
+        DT_BAS_COMPLETE,
+        DT_BAS_ORD_COMPLETE,
+        DT_BAS_WEEK_COMPLETE,
+        DT_EXT_COMPLETE,
+        DT_EXT_ORD_COMPLETE,
+        DT_EXT_WEEK_COMPLETE,
+        TIME_BAS_COMPLETE,
+        TIME_BAS_MINUTE,
+        TIME_EXT_COMPLETE,
+        TIME_EXT_MINUTE,
+        TIME_HOUR,
+        TZ_BAS,
+        TZ_EXT,
+        TZ_HOUR,
+        format_many,
+        strftime,
+        strftime_into,
+        write_formatted,
+    )
+    from isodate.isotime import parse_time, time_isoformat
+    from isodate.isotzinfo import parse_tzinfo, tz_isoformat
+    from isodate.isovalid import (
+        ERROR_FORMAT,
+        ERROR_RANGE,
+        ERROR_TYPE,
+        is_valid_date,
+        is_valid_datetime,
+        is_valid_duration,
+        is_valid_time,
+        try_parse_date,
+        try_parse_datetime,
+        try_parse_duration,
+        try_parse_time,
+        valid_mask,
+    )
+    from isodate.isowarmup import warmup
+    from isodate.tzinfo import LOCAL, UTC, FixedOffset, fixed_offset
+    from isodate.version import version as __version__
+
+_LAZY_EXPORTS: dict[str, tuple[str, ...]] = {
+    "isodate.duration": ("Duration",),
+    "isodate.isoadaptive": ("AdaptiveParser",),
+    "isodate.isobatch": ("parse_many",),
+    "isodate.isodates": (
+        "date_isoformat",
+        "parse_date",
+    ),
+    "isodate.isodatetime": (
+        "datetime_isoformat",
+        "parse_datetime",
+    ),
+    "isodate.isodetect": (
+        "ISOFormat",
+        "detect_format",
+    ),
+    "isodate.isofields": (
+        "ISOFields",
+        "parse_date_fields",
+        "parse_datetime_fields",
+        "parse_time_fields",
+    ),
+    "isodate.isoduration": (
+        "duration_isoformat",
+        "parse_duration",
+        "parse_duration_ints",
+    ),
+    "isodate.isoerror": ("ISO8601Error",),
+    "isodate.isointerval": (
+        "Interval",
+        "IntervalIndex",
+        "RecurringInterval",
+        "parse_interval",
+        "parse_recurring_interval",
+    ),
+    "isodate.isojson": (
+        "ISOJSONDecoder",
+        "ISOJSONEncoder",
+    ),
+    "isodate.isonumpy": ("parse_duration_array",),
+    "isodate.isoscan": (
+        "find_datetimes",
+        "iter_datetimes",
+    ),
+    "isodate.isostats": (
+        "enable_stats",
+        "get_stats",
+        "reset_stats",
+    ),
+    "isodate.isostrf": (
+        "D_ALT_BAS",
+        "D_ALT_BAS_ORD",
+        "D_ALT_EXT",
+        "D_ALT_EXT_ORD",
+        "D_DEFAULT",
+        "D_WEEK",
+        "DATE_BAS_COMPLETE",
+        "DATE_BAS_MONTH",
+        "DATE_BAS_ORD_COMPLETE",
+        "DATE_BAS_WEEK",
+        "DATE_BAS_WEEK_COMPLETE",
+        "DATE_CENTURY",
+        "DATE_EXT_COMPLETE",
+        "DATE_EXT_MONTH",
+        "DATE_EXT_ORD_COMPLETE",
+        "DATE_EXT_WEEK",
+        "DATE_EXT_WEEK_COMPLETE",
+        "DATE_YEAR",
+        "DT_BAS_COMPLETE",
+        "DT_BAS_ORD_COMPLETE",
+        "DT_BAS_WEEK_COMPLETE",
+        "DT_EXT_COMPLETE",
+        "DT_EXT_ORD_COMPLETE",
+        "DT_EXT_WEEK_COMPLETE",
+        "TIME_BAS_COMPLETE",
+        "TIME_BAS_MINUTE",
+        "TIME_EXT_COMPLETE",
+        "TIME_EXT_MINUTE",
+        "TIME_HOUR",
+        "TZ_BAS",
+        "TZ_EXT",
+        "TZ_HOUR",
+        "format_many",
+        "strftime",
+        "strftime_into",
+        "write_formatted",
+    ),
+    "isodate.isotime": (
+        "parse_time",
+        "time_isoformat",
+    ),
+    "isodate.isotzinfo": (
+        "parse_tzinfo",
+        "tz_isoformat",
+    ),
+    "isodate.isovalid": (
+        "ERROR_FORMAT",
+        "ERROR_RANGE",
+        "ERROR_TYPE",
+        "is_valid_date",
+        "is_valid_datetime",
+        "is_valid_duration",
+        "is_valid_time",
+        "try_parse_date",
+        "try_parse_datetime",
+        "try_parse_duration",
+        "try_parse_time",
+        "valid_mask",
+    ),
+    "isodate.isowarmup": ("warmup",),
+    "isodate.tzinfo": (
+        "LOCAL",
+        "UTC",
+        "FixedOffset",
+        "fixed_offset",
+    ),
+}
+# the names re-exported by this package, grouped by the module defining them.
+
+_LAZY_ATTRIBUTES = {name: module for module, names in _LAZY_EXPORTS.items() for name in names}
+# maps each re-exported name to the module it is imported from on first access.
+
+_SUBMODULES = frozenset(module.rsplit(".", 1)[1] for module in _LAZY_EXPORTS) | {"version"}
+# submodules, which are accessible as attributes without importing them explicitly.
 
 __all__ = [
     "parse_date",
@@ -58,15 +239,53 @@ __all__ = [
     "parse_datetime",
     "datetime_isoformat",
     "parse_duration",
+    "parse_duration_ints",
+    "parse_duration_array",
+    "parse_many",
+    "AdaptiveParser",
+    "is_valid_date",
+    "is_valid_time",
+    "is_valid_datetime",
+    "is_valid_duration",
+    "valid_mask",
+    "try_parse_date",
+    "try_parse_time",
+    "try_parse_datetime",
+    "try_parse_duration",
+    "ERROR_TYPE",
+    "ERROR_FORMAT",
+    "ERROR_RANGE",
+    "detect_format",
+    "ISOFormat",
+    "parse_date_fields",
+    "parse_time_fields",
+    "parse_datetime_fields",
+    "ISOFields",
+    "find_datetimes",
+    "iter_datetimes",
+    "ISOJSONEncoder",
+    "ISOJSONDecoder",
+    "parse_interval",
+    "parse_recurring_interval",
+    "Interval",
+    "IntervalIndex",
+    "RecurringInterval",
+    "enable_stats",
+    "get_stats",
+    "reset_stats",
     "duration_isoformat",
     "ISO8601Error",
     "parse_tzinfo",
     "tz_isoformat",
     "UTC",
     "FixedOffset",
+    "fixed_offset",
     "LOCAL",
     "Duration",
     "strftime",
+    "strftime_into",
+    "format_many",
+    "write_formatted",
     "DATE_BAS_COMPLETE",
     "DATE_BAS_ORD_COMPLETE",
     "DATE_BAS_WEEK",
@@ -99,5 +318,25 @@ __all__ = [
     "D_ALT_BAS",
     "D_ALT_BAS_ORD",
     "D_ALT_EXT_ORD",
+    "warmup",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module defining name on first access (PEP 562)."""
+    if name == "__version__":
+        value = importlib.import_module("isodate.version").version
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name in _SUBMODULES:
+        return importlib.import_module("isodate." + name)
+    else:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include the lazily imported names."""
+    return sorted(set(globals()) | set(__all__))
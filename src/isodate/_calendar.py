@@ -0,0 +1,41 @@
+"""This module provides the calendar arithmetic shared by the parsers,
+validators and formatters.
+
+Days are counted with proleptic Gregorian ordinals like date.toordinal, where
+ordinal 1 is Monday 0001-01-01. Working on integers avoids building date
+objects for values which may not be representable.
+"""
+
+from isodate.duration import max_days_in_month
+
+MAX_ORDINAL = 3652059
+# proleptic Gregorian ordinal of 9999-12-31, the last day datetime.date supports.
+
+
+def valid_day(year: int, month: int, day: int) -> bool:
+    """Return whether datetime.date accepts year, month and day."""
+    return 1 <= year <= 9999 and 1 <= month <= 12 and 1 <= day <= max_days_in_month(year, month)
+
+
+def first_ordinal(year: int) -> int:
+    """Return the ordinal of the 1st of January of year."""
+    year -= 1
+    return year * 365 + year // 4 - year // 100 + year // 400 + 1
+
+
+def week1_ordinal(year: int) -> int:
+    """Return the ordinal of the Monday of ISO week 1 of year."""
+    # ISO week 1 is the week containing January 4th.
+    jan4 = first_ordinal(year) + 3
+    return jan4 - (jan4 - 1) % 7
+
+
+def week_ordinal(year: int, week: int, weekday: int = 1) -> int:
+    """Return the ordinal of an ISO week date.
+
+    Weeks and weekdays out of range are counted on into the neighbouring
+    weeks and years, like parse_date does.
+
+    @param weekday: the day of the week, 1 for Monday to 7 for Sunday
+    """
+    return week1_ordinal(year) + (week - 1) * 7 + weekday - 1
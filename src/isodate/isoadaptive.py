@@ -0,0 +1,188 @@
+"""This module provides a parser, which adapts to the ISO 8601 representation
+used by a stream of strings.
+
+parse_date and parse_time try their regular expressions in a fixed order, so
+an ordinal date needs five match attempts and a time with minute precision
+three. Columns of real data almost always use a single representation.
+AdaptiveParser remembers which regular expression matched the last value and
+tries it first for the next one. Only when it does not match, all regular
+expressions are tried. As the regular expressions of a set never match the
+same string, the results are always the same as those of the parse functions.
+"""
+
+import re
+from datetime import date, datetime, time, tzinfo
+from typing import Any, Optional, Union
+
+from isodate.isodates import _date_from_match, build_date_regexps
+from isodate.isodatetime import _datetime_to_utc
+from isodate.isoerror import ISO8601Error
+from isodate.isotime import (
+    _time_fields_from_match,
+    _time_from_fields,
+    build_time_regexps,
+)
+
+ADAPTIVE_KINDS = ("date", "time", "datetime")
+# the kinds of values an AdaptiveParser can parse.
+
+DATE, TIME = 0, 1
+# indices of the date and time regular expressions in the state of AdaptiveParser.
+
+
+class AdaptiveParser:
+    """A parser for a stream of ISO 8601 dates, times or date-times.
+
+    Calling the instance parses a string like parse_date, parse_time or
+    parse_datetime with the options given to the constructor would. The
+    instance keeps state between calls, so use one instance per stream and
+    thread.
+
+    Example:
+        parser = AdaptiveParser("datetime", to_utc=True)
+        values = [parser(value) for value in column]
+        print(parser.get_stats())
+    """
+
+    __slots__ = (
+        "kind",
+        "yeardigits",
+        "expanded",
+        "defaultmonth",
+        "defaultday",
+        "to_utc",
+        "default_tz",
+        "_regexps",
+        "_last",
+        "_counts",
+    )
+
+    def __init__(
+        self,
+        kind: str = "datetime",
+        yeardigits: int = 4,
+        expanded: bool = False,
+        defaultmonth: int = 1,
+        defaultday: int = 1,
+        to_utc: bool = False,
+        default_tz: Optional[tzinfo] = None,
+    ) -> None:
+        """Initialise a parser for values of the given kind.
+
+        @param kind: "date", "time" or "datetime"
+        @param yeardigits, expanded, defaultmonth, defaultday: see parse_date
+        @param to_utc, default_tz: see parse_time and parse_datetime
+        """
+        if kind not in ADAPTIVE_KINDS:
+            raise ValueError("unknown kind %r" % kind)
+        self.kind = kind
+        self.yeardigits = yeardigits
+        self.expanded = expanded
+        self.defaultmonth = defaultmonth
+        self.defaultday = defaultday
+        self.to_utc = to_utc
+        self.default_tz = default_tz
+        self._regexps = (
+            build_date_regexps(yeardigits, expanded) if kind != "time" else [],
+            build_time_regexps() if kind != "date" else [],
+        )
+        self._last = [0, 0]
+        # per group the number of hits (the last pattern matched), misses
+        # (another pattern matched) and failures (no pattern matched).
+        self._counts = ([0, 0, 0], [0, 0, 0])
+
+    def _match(self, group: int, isostring: str) -> Optional[re.Match[str]]:
+        """Match isostring, trying the last matching pattern first."""
+        patterns = self._regexps[group]
+        last = self._last[group]
+        match = patterns[last].match(isostring)
+        if match is not None:
+            self._counts[group][0] += 1
+            return match
+        for index, pattern in enumerate(patterns):
+            if index != last:
+                match = pattern.match(isostring)
+                if match is not None:
+                    self._last[group] = index
+                    self._counts[group][1] += 1
+                    return match
+        self._counts[group][2] += 1
+        return None
+
+    def _parse_date(self, datestring: str) -> date:
+        """Parse a date like parse_date."""
+        match = self._match(DATE, datestring)
+        if match is None:
+            raise ISO8601Error("Unrecognised ISO 8601 date format: %r" % datestring)
+        return _date_from_match(match, self.defaultmonth, self.defaultday)
+
+    def _parse_time(self, timestring: str) -> time:
+        """Parse a time like parse_time."""
+        match = self._match(TIME, timestring)
+        if match is None:
+            raise ISO8601Error("Unrecognised ISO 8601 time format: %r" % timestring)
+        return _time_from_fields(_time_fields_from_match(match), self.to_utc, self.default_tz)
+
+    def _parse_datetime(self, datetimestring: str) -> datetime:
+        """Parse a date-time like parse_datetime."""
+        try:
+            datestring, timestring = datetimestring.split("T")
+        except ValueError:
+            raise ISO8601Error(
+                "ISO 8601 time designator 'T' missing. Unable to"
+                " parse datetime string %r" % datetimestring
+            )
+        tmpdate = self._parse_date(datestring)
+        match = self._match(TIME, timestring)
+        if match is None:
+            raise ISO8601Error("Unrecognised ISO 8601 time format: %r" % timestring)
+        fields = _time_fields_from_match(match)
+        if self.to_utc:
+            return _datetime_to_utc(tmpdate, fields, self.default_tz)
+        return datetime.combine(tmpdate, _time_from_fields(fields, False, self.default_tz))
+
+    def __call__(self, isostring: str) -> Union[date, time, datetime]:
+        """Parse isostring.
+
+        @raise ISO8601Error: if isostring can not be parsed
+        @raise ValueError: if isostring can not be represented by the result type
+        """
+        if self.kind == "datetime":
+            return self._parse_datetime(isostring)
+        if self.kind == "date":
+            return self._parse_date(isostring)
+        return self._parse_time(isostring)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return the statistics of the regular expression lookups.
+
+        For dates and times (as far as parsed) a dictionary with the keys:
+          hits     ... the last matching pattern matched again
+          misses   ... another pattern matched
+          failures ... no pattern matched
+          hit_rate ... hits per lookup
+          last     ... index of the last matching pattern in the list returned
+                       by build_date_regexps or build_time_regexps
+        """
+        stats = {}
+        for name, group in (("date", DATE), ("time", TIME)):
+            if self._regexps[group]:
+                hits, misses, failures = self._counts[group]
+                lookups = hits + misses + failures
+                stats[name] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "failures": failures,
+                    "hit_rate": hits / lookups if lookups else 0.0,
+                    "last": self._last[group],
+                }
+        return stats
+
+    def reset_stats(self) -> None:
+        """Reset the statistics, but keep the last matching patterns."""
+        for counts in self._counts:
+            counts[:] = [0, 0, 0]
+
+    def __repr__(self) -> str:
+        """Return a string representation of this parser."""
+        return "<AdaptiveParser %r>" % self.kind
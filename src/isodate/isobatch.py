@@ -0,0 +1,84 @@
+"""This module provides a function to parse many ISO 8601 strings on a pool of
+threads.
+
+All parse functions of isodate are safe to call from several threads at the
+same time. Their caches are filled without locks, concurrent first use at
+worst builds an entry twice. On CPython with the global interpreter lock the
+threads take turns, so parse_many only speeds up parsing on free-threaded
+builds (3.13t and later) and other implementations without such a lock.
+"""
+
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from itertools import chain
+from os import cpu_count
+from typing import Any, Callable, Optional, TypeVar
+
+from isodate.isodatetime import parse_datetime
+
+T = TypeVar("T")
+
+BATCH_CHUNK_SIZE = 2048
+# default number of strings parsed by a worker thread in one task.
+
+
+def _parse_chunk(parser: Callable[..., T], chunk: Sequence[str], kwargs: dict[str, Any]) -> list[T]:
+    """Parse all strings of chunk."""
+    if kwargs:
+        return [parser(value, **kwargs) for value in chunk]
+    return [parser(value) for value in chunk]
+
+
+def parse_many(
+    values: Iterable[str],
+    parser: Callable[..., T] = parse_datetime,  # type: ignore [assignment]
+    workers: Optional[int] = None,
+    chunksize: int = BATCH_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+    **kwargs: Any,
+) -> list[T]:
+    """Parse ISO 8601 strings on several threads.
+
+    Returns a list with the results in the same order as values. Additional
+    keyword arguments are passed to the parser, e.g. to_utc=True for
+    parse_datetime.
+
+    @param values: the ISO strings to parse
+    @param parser: one of the isodate parse functions
+    @param workers: number of threads, defaults to the number of CPUs. With
+                    1 worker, or with less values than chunksize, the values
+                    are parsed in the calling thread.
+    @param chunksize: number of values parsed per task
+    @param executor: an existing executor to run the tasks on instead of a
+                     new thread pool. workers is ignored in this case.
+    @raise ISO8601Error: the error raised for the first value (in the order
+                         of values) which can not be parsed
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    if not isinstance(values, Sequence):
+        values = list(values)
+    if workers is None:
+        workers = cpu_count() or 1
+    if len(values) <= chunksize or (executor is None and workers < 2):
+        return _parse_chunk(parser, values, kwargs)
+    chunks = [values[slice(start, start + chunksize)] for start in range(0, len(values), chunksize)]
+    if executor is not None:
+        return _run(executor, parser, chunks, kwargs)
+    with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        return _run(pool, parser, chunks, kwargs)
+
+
+def _run(
+    executor: Executor,
+    parser: Callable[..., T],
+    chunks: list[Sequence[str]],
+    kwargs: dict[str, Any],
+) -> list[T]:
+    """Parse chunks on executor and concatenate the results."""
+    futures = [executor.submit(_parse_chunk, parser, chunk, kwargs) for chunk in chunks]
+    try:
+        return list(chain.from_iterable(future.result() for future in futures))
+    finally:
+        for future in futures:
+            future.cancel()
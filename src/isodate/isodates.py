@@ -8,8 +8,9 @@ implementation, which does not support dates before 0001-01-01.
 
 import re
 from datetime import date, time, timedelta
-from typing import Union
+from typing import Optional, Union
 
+from isodate import isostats
 from isodate.duration import Duration
 from isodate.isoerror import ISO8601Error
 from isodate.isostrf import DATE_EXT_COMPLETE, strftime
@@ -99,10 +100,83 @@ def build_date_regexps(yeardigits: int = 4, expanded: bool = False) -> list[re.P
         #    YY or +-YYYY ... reduced accuracy specific century
         add_re(r"(?P<sign>[+-]){%d}" r"(?P<century>[0-9]{%d})" % (sign, yeardigits - 2))
 
-        DATE_REGEX_CACHE[(yeardigits, expanded)] = cache_entry
+        # threads building the same entry concurrently all use the first one stored.
+        DATE_REGEX_CACHE.setdefault((yeardigits, expanded), cache_entry)
     return DATE_REGEX_CACHE[(yeardigits, expanded)]
 
 
+def match_date(
+    datestring: str, yeardigits: int = 4, expanded: bool = False
+) -> tuple[int, Optional[re.Match[str]]]:
+    """Match datestring against the regular expressions for ISO dates.
+
+    Returns the index of the first matching expression in the list returned
+    by build_date_regexps and its match object, or (-1, None) if no
+    expression matches. The parameters are the same as for parse_date.
+    """
+    if yeardigits != 4:
+        expanded = True
+    isodates = build_date_regexps(yeardigits, expanded)
+    for index, pattern in enumerate(isodates):
+        match = pattern.match(datestring)
+        if match:
+            if isostats.ENABLED:
+                isostats.record_pattern("date", index, len(isodates))
+            return index, match
+    if isostats.ENABLED:
+        isostats.record_pattern("date", -1, len(isodates))
+    return -1, None
+
+
+def _parse_date(
+    datestring: str,
+    yeardigits: int = 4,
+    expanded: bool = False,
+    defaultmonth: int = 1,
+    defaultday: int = 1,
+) -> date:
+    """Implementation of parse_date, see there."""
+    _, match = match_date(datestring, yeardigits, expanded)
+    if match is None:
+        raise ISO8601Error("Unrecognised ISO 8601 date format: %r" % datestring)
+    return _date_from_match(match, defaultmonth, defaultday)
+
+
+def _date_from_match(match: re.Match[str], defaultmonth: int = 1, defaultday: int = 1) -> date:
+    """Build the date for a match of one of the regular expressions of
+    build_date_regexps.
+    """
+    groups = match.groupdict()
+    # sign, century, year, month, week, day,
+    # FIXME: negative dates not possible with python standard types
+    sign = (groups["sign"] == "-" and -1) or 1
+    if "century" in groups:
+        return date(sign * (int(groups["century"]) * 100 + 1), defaultmonth, defaultday)
+    if "month" not in groups:  # weekdate or ordinal date
+        ret = date(sign * int(groups["year"]), 1, 1)
+        if "week" in groups:
+            isotuple = ret.isocalendar()
+            if "day" in groups:
+                days = int(groups["day"] or 1)
+            else:
+                days = 1
+            # if first week in year, do weeks-1
+            return ret + timedelta(
+                weeks=int(groups["week"]) - (((isotuple[1] == 1) and 1) or 0),
+                days=-isotuple[2] + days,
+            )
+        elif "day" in groups:  # ordinal date
+            return ret + timedelta(days=int(groups["day"]) - 1)
+        else:  # year date
+            return ret.replace(month=defaultmonth, day=defaultday)
+    # year-, month-, or complete date
+    if "day" not in groups or groups["day"] is None:
+        day = defaultday
+    else:
+        day = int(groups["day"])
+    return date(sign * int(groups["year"]), int(groups["month"]) or defaultmonth, day)
+
+
 def parse_date(
     datestring: str,
     yeardigits: int = 4,
@@ -143,42 +217,11 @@ def parse_date(
     @raise ISO8601Error: if this function can not parse the datestring
     @raise ValueError: if datestring can not be represented by datetime.date
     """
-    if yeardigits != 4:
-        expanded = True
-    isodates = build_date_regexps(yeardigits, expanded)
-    for pattern in isodates:
-        match = pattern.match(datestring)
-        if match:
-            groups = match.groupdict()
-            # sign, century, year, month, week, day,
-            # FIXME: negative dates not possible with python standard types
-            sign = (groups["sign"] == "-" and -1) or 1
-            if "century" in groups:
-                return date(sign * (int(groups["century"]) * 100 + 1), defaultmonth, defaultday)
-            if "month" not in groups:  # weekdate or ordinal date
-                ret = date(sign * int(groups["year"]), 1, 1)
-                if "week" in groups:
-                    isotuple = ret.isocalendar()
-                    if "day" in groups:
-                        days = int(groups["day"] or 1)
-                    else:
-                        days = 1
-                    # if first week in year, do weeks-1
-                    return ret + timedelta(
-                        weeks=int(groups["week"]) - (((isotuple[1] == 1) and 1) or 0),
-                        days=-isotuple[2] + days,
-                    )
-                elif "day" in groups:  # ordinal date
-                    return ret + timedelta(days=int(groups["day"]) - 1)
-                else:  # year date
-                    return ret.replace(month=defaultmonth, day=defaultday)
-            # year-, month-, or complete date
-            if "day" not in groups or groups["day"] is None:
-                day = defaultday
-            else:
-                day = int(groups["day"])
-            return date(sign * int(groups["year"]), int(groups["month"]) or defaultmonth, day)
-    raise ISO8601Error("Unrecognised ISO 8601 date format: %r" % datestring)
+    if isostats.ENABLED:
+        return isostats.timed(
+            "parse_date", _parse_date, datestring, yeardigits, expanded, defaultmonth, defaultday
+        )
+    return _parse_date(datestring, yeardigits, expanded, defaultmonth, defaultday)
 
 
 def date_isoformat(
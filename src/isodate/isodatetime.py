@@ -6,22 +6,27 @@ and time module.
 
 from __future__ import annotations
 
-from datetime import date, datetime, time, timedelta
+from datetime import date, datetime, time, timedelta, tzinfo
 
 import isodate
+from isodate import isostats
 from isodate.isodates import parse_date
 from isodate.isoerror import ISO8601Error
 from isodate.isostrf import DATE_EXT_COMPLETE, TIME_EXT_COMPLETE, TZ_EXT, strftime
-from isodate.isotime import parse_time
+from isodate.isotime import (
+    TimeFields,
+    _check_time_fields,
+    _parse_time_fields,
+    _utc_offset_minutes,
+    parse_time,
+)
+from isodate.tzinfo import UTC
 
 
-def parse_datetime(datetimestring: str) -> datetime:
-    """Parses ISO 8601 date-times into datetime.datetime objects.
-
-    This function uses parse_date and parse_time to do the job, so it allows
-    more combinations of date and time representations, than the actual
-    ISO 8601:2004 standard allows.
-    """
+def _parse_datetime(
+    datetimestring: str, to_utc: bool = False, default_tz: tzinfo | None = None
+) -> datetime:
+    """Implementation of parse_datetime, see there."""
     try:
         datestring, timestring = datetimestring.split("T")
     except ValueError:
@@ -30,8 +35,56 @@ def parse_datetime(datetimestring: str) -> datetime:
             " parse datetime string %r" % datetimestring
         )
     tmpdate = parse_date(datestring)
-    tmptime = parse_time(timestring)
-    return datetime.combine(tmpdate, tmptime)
+    if not to_utc:
+        tmptime = parse_time(timestring, default_tz=default_tz)
+        return datetime.combine(tmpdate, tmptime)
+    return _datetime_to_utc(tmpdate, _parse_time_fields(timestring), default_tz)
+
+
+def _datetime_to_utc(tmpdate: date, fields: TimeFields, default_tz: tzinfo | None) -> datetime:
+    """Combine a date and the fields of a parsed time into a UTC datetime, see
+    parse_datetime.
+    """
+    hour, minute, second, microsecond, groups = fields
+    offset = _utc_offset_minutes(groups)
+    if offset is None:
+        if default_tz is None:
+            return datetime.combine(tmpdate, time(hour, minute, second, microsecond))
+        if default_tz is not UTC:
+            tmptime = time(hour, minute, second, microsecond, default_tz)
+            return datetime.combine(tmpdate, tmptime).astimezone(UTC)
+        offset = 0
+    if offset:
+        _check_time_fields(hour, minute, second)
+        days, minute = divmod(hour * 60 + minute - offset, 24 * 60)
+        hour, minute = divmod(minute, 60)
+        if days:
+            tmpdate += timedelta(days=days)
+    return datetime(
+        tmpdate.year, tmpdate.month, tmpdate.day, hour, minute, second, microsecond, UTC
+    )
+
+
+def parse_datetime(
+    datetimestring: str, to_utc: bool = False, default_tz: tzinfo | None = None
+) -> datetime:
+    """Parses ISO 8601 date-times into datetime.datetime objects.
+
+    This function uses parse_date and parse_time to do the job, so it allows
+    more combinations of date and time representations, than the actual
+    ISO 8601:2004 standard allows.
+
+    default_tz is used as time zone for date-times without designator. The
+    default None leaves them naive, UTC or LOCAL assume UTC or local time.
+
+    If to_utc is True, the parsed offset is applied directly and the result
+    carries the UTC instance as tzinfo, which is the same as, but cheaper
+    than calling astimezone(UTC) on the result. Naive date-times stay naive,
+    if there is no default_tz.
+    """
+    if isostats.ENABLED:
+        return isostats.timed("parse_datetime", _parse_datetime, datetimestring, to_utc, default_tz)
+    return _parse_datetime(datetimestring, to_utc, default_tz)
 
 
 def datetime_isoformat(
@@ -0,0 +1,263 @@
+"""This module provides a function to detect which ISO 8601 representation a
+string uses.
+
+detect_format classifies a string with the same regular expressions the
+parse functions use, and returns an ISOFormat descriptor with the matching
+representation and strftime format. This allows sniffing a sample of values
+once, e.g. to pick a specialised parser or a format for writing values back.
+"""
+
+from typing import NamedTuple, Optional
+
+from isodate import isostrf
+from isodate.isodates import match_date
+from isodate.isoduration import ISO8601_PERIOD_REGEX
+from isodate.isostrf import (
+    D_DEFAULT,
+    D_WEEK,
+    DATE_BAS_COMPLETE,
+    DATE_BAS_MONTH,
+    DATE_BAS_ORD_COMPLETE,
+    DATE_BAS_WEEK,
+    DATE_BAS_WEEK_COMPLETE,
+    DATE_CENTURY,
+    DATE_EXT_COMPLETE,
+    DATE_EXT_MONTH,
+    DATE_EXT_ORD_COMPLETE,
+    DATE_EXT_WEEK,
+    DATE_EXT_WEEK_COMPLETE,
+    DATE_YEAR,
+    TIME_BAS_COMPLETE,
+    TIME_BAS_MINUTE,
+    TIME_EXT_COMPLETE,
+    TIME_EXT_MINUTE,
+    TIME_HOUR,
+    TZ_BAS,
+    TZ_EXT,
+    TZ_HOUR,
+)
+from isodate.isotime import match_time
+
+DATE_REPRESENTATIONS: tuple[tuple[str, Optional[bool], str], ...] = (
+    ("complete", True, DATE_EXT_COMPLETE),
+    ("complete", False, DATE_BAS_COMPLETE),
+    ("week_complete", True, DATE_EXT_WEEK_COMPLETE),
+    ("week_complete", False, DATE_BAS_WEEK_COMPLETE),
+    ("ordinal", True, DATE_EXT_ORD_COMPLETE),
+    ("ordinal", False, DATE_BAS_ORD_COMPLETE),
+    ("week", True, DATE_EXT_WEEK),
+    ("week", False, DATE_BAS_WEEK),
+    ("month", True, DATE_EXT_MONTH),
+    ("month", False, DATE_BAS_MONTH),
+    ("year", None, DATE_YEAR),
+    ("century", None, DATE_CENTURY),
+)
+# representation, extended format and strftime format of the date regular
+# expressions in the order of build_date_regexps.
+
+TIME_REPRESENTATIONS: tuple[tuple[str, Optional[bool], str], ...] = (
+    ("complete", True, TIME_EXT_COMPLETE),
+    ("complete", False, TIME_BAS_COMPLETE),
+    ("minute", True, TIME_EXT_MINUTE),
+    ("minute", False, TIME_BAS_MINUTE),
+    ("hour", None, TIME_HOUR),
+)
+# representation, extended format and strftime format of the time regular
+# expressions in the order of build_time_regexps.
+
+TIME_FRACTION_GROUPS = {"complete": "second", "minute": "minute", "hour": "hour"}
+# the match group holding the (possibly fractional) least significant component.
+
+FORMAT_NAMES = {
+    value: name
+    for name, value in vars(isostrf).items()
+    if name.startswith(("DATE_", "TIME_", "TZ_", "DT_", "D_")) and isinstance(value, str)
+}
+# maps the format strings defined in isostrf to the names of their constants.
+
+
+class ISOFormat(NamedTuple):
+    """Descriptor of the ISO 8601 representation of a string.
+
+    kind       ... "date", "time", "datetime" or "duration"
+    format     ... strftime format producing the same representation, None if
+                   there is none (fractions of hours or minutes)
+    name       ... name of the isostrf constant equal to format, if any
+    date       ... date representation: "complete", "week_complete",
+                   "ordinal", "week", "month", "year" or "century"
+    time       ... time representation: "complete", "minute" or "hour"
+    extended   ... True for the extended format (with - and : separators),
+                   False for the basic format, None if the representation
+                   does not distinguish them
+    fraction   ... whether the least significant time component has a
+                   fraction (for durations, any component)
+    tz         ... time zone designator: "Z", "hour" (+hh), "basic" (+hhmm),
+                   "extended" (+hh:mm) or None
+    date_index ... index of the matching regular expression in the list
+                   returned by build_date_regexps
+    time_index ... index of the matching regular expression in the list
+                   returned by build_time_regexps
+    """
+
+    kind: str
+    format: Optional[str]
+    name: Optional[str] = None
+    date: Optional[str] = None
+    time: Optional[str] = None
+    extended: Optional[bool] = None
+    fraction: bool = False
+    tz: Optional[str] = None
+    date_index: Optional[int] = None
+    time_index: Optional[int] = None
+
+
+def _detect_date(datestring: str, yeardigits: int, expanded: bool) -> Optional[ISOFormat]:
+    """Detect the representation of an ISO date."""
+    index, match = match_date(datestring, yeardigits, expanded)
+    if match is None:
+        return None
+    representation, extended, format = DATE_REPRESENTATIONS[index]
+    if match.group("sign") and yeardigits == 4:
+        # strftime renders the sign only for years with more than 4 digits
+        format = match.group("sign") + format
+    return ISOFormat("date", format, None, representation, None, extended, date_index=index)
+
+
+def _detect_time(timestring: str) -> Optional[ISOFormat]:
+    """Detect the representation of an ISO time."""
+    index, match = match_time(timestring)
+    if match is None:
+        return None
+    representation, extended, timeformat = TIME_REPRESENTATIONS[index]
+    format: Optional[str] = timeformat
+    value = match.group(TIME_FRACTION_GROUPS[representation])
+    fraction = len(value) > 2
+    if fraction:
+        # strftime can render fractions of seconds only
+        format = timeformat + value[2] + "%f" if representation == "complete" else None
+    if timestring.startswith("T") and format is not None:
+        format = "T" + format
+    tzname = match.group("tzname")
+    if not tzname:
+        tz = None
+    elif tzname == "Z":
+        tz = "Z"
+        if format is not None:
+            format += TZ_BAS if extended is False else TZ_EXT
+    elif match.group("tzmin") is None:
+        tz = "hour"
+        if format is not None:
+            format += TZ_HOUR
+    elif ":" in tzname:
+        tz = "extended"
+        if format is not None:
+            format += TZ_EXT
+    else:
+        tz = "basic"
+        if format is not None:
+            format += TZ_BAS
+    return ISOFormat(
+        "time", format, None, None, representation, extended, fraction, tz, None, index
+    )
+
+
+def _detect_datetime(
+    datetimestring: str, yeardigits: int, expanded: bool, kind: str = "datetime"
+) -> Optional[ISOFormat]:
+    """Detect the representation of an ISO date-time."""
+    if datetimestring.count("T") != 1:
+        return None
+    datestring, timestring = datetimestring.split("T")
+    dateformat = _detect_date(datestring, yeardigits, expanded)
+    timeformat = _detect_time(timestring)
+    if dateformat is None or timeformat is None:
+        return None
+    if timeformat.format is None:
+        format = None
+    else:
+        format = dateformat.format + "T" + timeformat.format  # type: ignore [operator]
+    if dateformat.extended is None or timeformat.extended is None:
+        extended = timeformat.extended if dateformat.extended is None else dateformat.extended
+    else:
+        extended = dateformat.extended or timeformat.extended
+    return timeformat._replace(
+        kind=kind,
+        format=format,
+        date=dateformat.date,
+        extended=extended,
+        date_index=dateformat.date_index,
+    )
+
+
+def _detect_duration(durationstring: str) -> Optional[ISOFormat]:
+    """Detect the representation of an ISO duration."""
+    match = ISO8601_PERIOD_REGEX.match(durationstring)
+    if match is None:
+        if not durationstring.startswith("P"):
+            return None
+        descriptor = _detect_datetime(durationstring[1:], 4, False, "duration")
+        if descriptor is None or descriptor.format is None:
+            return descriptor
+        return descriptor._replace(format="P" + descriptor.format)
+    groups = match.groupdict()
+    fraction = any(
+        "," in value or "." in value
+        for key, value in groups.items()
+        if value and key not in ("sign", "separator")
+    )
+    if groups["weeks"] and not any(
+        groups[key] for key in ("years", "months", "days", "hours", "minutes", "seconds")
+    ):
+        format = D_WEEK
+    else:
+        format = D_DEFAULT
+    return ISOFormat("duration", format, fraction=fraction)
+
+
+def detect_format(
+    isostring: str, kind: Optional[str] = None, yeardigits: int = 4, expanded: bool = False
+) -> Optional[ISOFormat]:
+    """Detect which ISO 8601 representation isostring uses.
+
+    The string is classified with the regular expressions of the parse
+    functions. The values of the fields are not range checked, use the
+    is_valid_* functions for that.
+
+    Without kind, strings starting with P (optionally signed) are classified
+    as durations, strings with a T time designator (not at the start) as
+    date-times, and other strings as dates or, if they are no dates, as times.
+    As the basic formats are ambiguous (1020 is a year and a time), pass kind
+    if the kind of the values is known.
+
+    @param isostring: the ISO string to classify
+    @param kind: "date", "time", "datetime" or "duration" to only try this kind
+    @param yeardigits: how many digits are used to represent a year
+    @param expanded: if True then +/- signs are allowed for dates
+    @return: an ISOFormat descriptor, None if the string is not an ISO 8601
+             representation (of the given kind)
+    """
+    if kind is None:
+        if isostring.lstrip("+-").startswith("P"):
+            kind = "duration"
+        elif "T" in isostring[1:]:
+            kind = "datetime"
+        else:
+            return _named(_detect_date(isostring, yeardigits, expanded) or _detect_time(isostring))
+    if kind == "date":
+        descriptor = _detect_date(isostring, yeardigits, expanded)
+    elif kind == "time":
+        descriptor = _detect_time(isostring)
+    elif kind == "datetime":
+        descriptor = _detect_datetime(isostring, yeardigits, expanded)
+    elif kind == "duration":
+        descriptor = _detect_duration(isostring)
+    else:
+        raise ValueError("unknown kind %r" % kind)
+    return _named(descriptor)
+
+
+def _named(descriptor: Optional[ISOFormat]) -> Optional[ISOFormat]:
+    """Fill in the name of the isostrf constant matching the format."""
+    if descriptor is None or descriptor.format not in FORMAT_NAMES:
+        return descriptor
+    return descriptor._replace(name=FORMAT_NAMES[descriptor.format])
@@ -5,14 +5,15 @@ format timedelta or Duration instances as ISO conforming strings.
 """
 
 import re
-from datetime import date, time, timedelta
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
-from typing import Union, Optional
+from typing import Union
 
+from isodate import isostats
 from isodate.duration import Duration
 from isodate.isodatetime import parse_datetime
 from isodate.isoerror import ISO8601Error
-from isodate.isostrf import D_DEFAULT, strftime
+from isodate.isostrf import D_DEFAULT, D_WEEK, _strfduration_p, strftime
 
 ISO8601_PERIOD_REGEX = re.compile(
     r"^(?P<sign>[+-])?"
@@ -27,37 +28,31 @@ ISO8601_PERIOD_REGEX = re.compile(
 )
 # regular expression to parse ISO duration strings.
 
+DURATION_UNITS = {"us": 10**6, "ns": 10**9}
+# number of ticks per second for the units supported by parse_duration_ints.
 
-def parse_duration(
-    datestring: str, as_timedelta_if_possible: bool = True
-) -> Union[timedelta, Duration]:
-    """Parses an ISO 8601 durations into datetime.timedelta or Duration objects.
+DURATION_FIELDS = (
+    ("weeks", 7 * 24 * 60 * 60),
+    ("days", 24 * 60 * 60),
+    ("hours", 60 * 60),
+    ("minutes", 60),
+    ("seconds", 1),
+)
+# the exact (not calendar dependent) duration components and their length in seconds.
 
-    If the ISO date string does not contain years or months, a timedelta
-    instance is returned, else a Duration instance is returned.
+DURATION_FORMAT_CACHE: dict[str, dict[timedelta, str]] = {D_DEFAULT: {}, D_WEEK: {}}
+# A dictionary to cache formatted timedelta instances for the default duration
+# formats. Each per format cache is cleared, when it reaches
+# DURATION_FORMAT_CACHE_SIZE entries, so it never holds more than that many
+# strings however many distinct durations are formatted.
 
-    The following duration formats are supported:
-      -PnnW                  duration in weeks
-      -PnnYnnMnnDTnnHnnMnnS  complete duration specification
-      -PYYYYMMDDThhmmss      basic alternative complete date format
-      -PYYYY-MM-DDThh:mm:ss  extended alternative complete date format
-      -PYYYYDDDThhmmss       basic alternative ordinal date format
-      -PYYYY-DDDThh:mm:ss    extended alternative ordinal date format
-
-    The '-' is optional.
+DURATION_FORMAT_CACHE_SIZE = 1024
 
-    Limitations:  ISO standard defines some restrictions about where to use
-      fractional numbers and which component and format combinations are
-      allowed. This parser implementation ignores all those restrictions and
-      returns something when it is able to find all necessary components.
-      In detail:
-        it does not check, whether only the last component has fractions.
-        it allows weeks specified with all other combinations
 
-      The alternative format does not support durations with years, months or
-      days set to 0.
-    """
-    ret: Optional[Union[timedelta, Duration]] = None
+def _parse_duration(
+    datestring: str, as_timedelta_if_possible: bool = True
+) -> Union[timedelta, Duration]:
+    """Implementation of parse_duration, see there."""
     if not isinstance(datestring, str):
         raise TypeError("Expecting a string %r" % datestring)
     match = ISO8601_PERIOD_REGEX.match(datestring)
@@ -65,29 +60,44 @@ def parse_duration(
         # try alternative format:
         if datestring.startswith("P"):
             durdt = parse_datetime(datestring[1:])
-            if as_timedelta_if_possible and durdt.year == 0 and durdt.month == 0:
-                # FIXME: currently not possible in alternative format
-                # create timedelta
-                ret = timedelta(
-                    days=durdt.day,
-                    seconds=durdt.second,
-                    microseconds=durdt.microsecond,
-                    minutes=durdt.minute,
-                    hours=durdt.hour,
-                )
-            else:
-                # create Duration
-                ret = Duration(
-                    days=durdt.day,
-                    seconds=durdt.second,
-                    microseconds=durdt.microsecond,
-                    minutes=durdt.minute,
-                    hours=durdt.hour,
-                    months=durdt.month,
-                    years=durdt.year,
-                )
-            return ret
+            return _duration_from_datetime(durdt, as_timedelta_if_possible)
         raise ISO8601Error("Unable to parse duration string %r" % datestring)
+    return _duration_from_match(match, as_timedelta_if_possible)
+
+
+def _duration_from_datetime(
+    durdt: datetime, as_timedelta_if_possible: bool = True
+) -> Union[timedelta, Duration]:
+    """Build the duration for a duration in the alternative format, which has
+    been parsed as date-time.
+    """
+    if as_timedelta_if_possible and durdt.year == 0 and durdt.month == 0:
+        # FIXME: currently not possible in alternative format
+        # create timedelta
+        return timedelta(
+            days=durdt.day,
+            seconds=durdt.second,
+            microseconds=durdt.microsecond,
+            minutes=durdt.minute,
+            hours=durdt.hour,
+        )
+    # create Duration
+    return Duration(
+        days=durdt.day,
+        seconds=durdt.second,
+        microseconds=durdt.microsecond,
+        minutes=durdt.minute,
+        hours=durdt.hour,
+        months=durdt.month,
+        years=durdt.year,
+    )
+
+
+def _duration_from_match(
+    match: re.Match[str], as_timedelta_if_possible: bool = True
+) -> Union[timedelta, Duration]:
+    """Build the duration for a match of ISO8601_PERIOD_REGEX."""
+    ret: Union[timedelta, Duration]
     groups = match.groupdict()
     for key, val in groups.items():
         if key not in ("separator", "sign"):
@@ -127,20 +137,169 @@ def parse_duration(
     return ret
 
 
+def parse_duration(
+    datestring: str, as_timedelta_if_possible: bool = True
+) -> Union[timedelta, Duration]:
+    """Parses an ISO 8601 durations into datetime.timedelta or Duration objects.
+
+    If the ISO date string does not contain years or months, a timedelta
+    instance is returned, else a Duration instance is returned.
+
+    The following duration formats are supported:
+      -PnnW                  duration in weeks
+      -PnnYnnMnnDTnnHnnMnnS  complete duration specification
+      -PYYYYMMDDThhmmss      basic alternative complete date format
+      -PYYYY-MM-DDThh:mm:ss  extended alternative complete date format
+      -PYYYYDDDThhmmss       basic alternative ordinal date format
+      -PYYYY-DDDThh:mm:ss    extended alternative ordinal date format
+
+    The '-' is optional.
+
+    Limitations:  ISO standard defines some restrictions about where to use
+      fractional numbers and which component and format combinations are
+      allowed. This parser implementation ignores all those restrictions and
+      returns something when it is able to find all necessary components.
+      In detail:
+        it does not check, whether only the last component has fractions.
+        it allows weeks specified with all other combinations
+
+      The alternative format does not support durations with years, months or
+      days set to 0.
+    """
+    if isostats.ENABLED:
+        return isostats.timed(
+            "parse_duration", _parse_duration, datestring, as_timedelta_if_possible
+        )
+    return _parse_duration(datestring, as_timedelta_if_possible)
+
+
+def _decimal_ratio(value: str) -> tuple[int, int]:
+    """Split a decimal number string into an integer numerator and a power of ten
+    denominator.
+    """
+    intpart, _, fraction = value.replace(",", ".").partition(".")
+    return int(intpart + fraction), 10 ** len(fraction)
+
+
+def _parse_duration_ints(datestring: str, unit: str = "us") -> tuple[int, int]:
+    """Implementation of parse_duration_ints, see there."""
+    if not isinstance(datestring, str):
+        raise TypeError("Expecting a string %r" % datestring)
+    try:
+        tickspersecond = DURATION_UNITS[unit]
+    except KeyError:
+        raise ValueError("unknown duration unit %r" % unit)
+    match = ISO8601_PERIOD_REGEX.match(datestring)
+    if not match:
+        # try alternative format:
+        if datestring.startswith("P"):
+            durdt = parse_datetime(datestring[1:])
+            seconds = ((durdt.day * 24 + durdt.hour) * 60 + durdt.minute) * 60 + durdt.second
+            return (
+                durdt.year * 12 + durdt.month,
+                seconds * tickspersecond + durdt.microsecond * (tickspersecond // 10**6),
+            )
+        raise ISO8601Error("Unable to parse duration string %r" % datestring)
+    groups = match.groupdict()
+    # sum up all components as exact fractions with a common power of ten
+    # denominator.
+    months, monthsdenom = 0, 1
+    for key, factor in (("years", 12), ("months", 1)):
+        if groups[key] is not None:
+            num, denom = _decimal_ratio(groups[key][:-1])
+            if denom > monthsdenom:
+                months, monthsdenom = months * (denom // monthsdenom), denom
+            months += num * factor * (monthsdenom // denom)
+    if months % monthsdenom:
+        raise ValueError("fractional months can not be represented as integer")
+    ticks, ticksdenom = 0, 1
+    for key, factor in DURATION_FIELDS:
+        if groups[key] is not None:
+            num, denom = _decimal_ratio(groups[key][:-1])
+            if denom > ticksdenom:
+                ticks, ticksdenom = ticks * (denom // ticksdenom), denom
+            ticks += num * factor * (ticksdenom // denom)
+    months //= monthsdenom
+    ticks = ticks * tickspersecond // ticksdenom
+    if groups["sign"] == "-":
+        return -months, -ticks
+    return months, ticks
+
+
+def parse_duration_ints(datestring: str, unit: str = "us") -> tuple[int, int]:
+    """Parses an ISO 8601 duration into a (months, ticks) tuple of plain ints.
+
+    The calendar part (years and months) is returned as number of months, the
+    exact part (weeks, days, hours, minutes and seconds) as number of
+    microseconds (unit='us') or nanoseconds (unit='ns').
+
+    The same formats as for parse_duration are supported. All calculations are
+    done with integers, so no float rounding happens. Fractions smaller than
+    the requested unit are truncated toward zero, the same way parse_time
+    handles fractional seconds, so -PT0.0000019S gives -1 microsecond. This
+    differs from parse_duration, which rounds to the nearest microsecond
+    (PT0.0000019S is 2 microseconds there, but 1 tick here). The alternative
+    format is limited to microsecond precision, as it is parsed with
+    parse_datetime.
+
+    @raise ISO8601Error: if datestring can not be parsed
+    @raise ValueError: if the calendar part is not a whole number of months
+    """
+    if isostats.ENABLED:
+        return isostats.timed("parse_duration_ints", _parse_duration_ints, datestring, unit)
+    return _parse_duration_ints(datestring, unit)
+
+
+def _default_isoformat(tduration: Union[timedelta, Duration], format: str) -> str:
+    """Format a timedelta or Duration in the D_DEFAULT or D_WEEK format.
+
+    The string is built from the integer months, days and microseconds instead
+    of going through strftime. The output is the same.
+    """
+    if isinstance(tduration, Duration):
+        days = tduration.tdelta.days
+        negative = tduration.years < 0 or tduration.months < 0 or days < 0
+    else:
+        days = tduration.days
+        negative = days < 0
+    if format == D_WEEK:
+        ret = "P%dW" % abs(days // 7)
+    else:
+        ret = "P" + _strfduration_p(tduration)
+    return "-" + ret if negative else ret
+
+
 def duration_isoformat(
     tduration: Union[timedelta, Duration, time, date], format: str = D_DEFAULT
 ) -> str:
     """Format duration strings.
 
     This method is just a wrapper around isodate.isostrf.strftime and uses
-    P%P (D_DEFAULT) as default format.
+    P%P (D_DEFAULT) as default format. timedelta and Duration instances in the
+    D_DEFAULT and D_WEEK formats are rendered directly from their integer
+    fields, and timedelta renderings are cached in DURATION_FORMAT_CACHE.
     """
+    if format in DURATION_FORMAT_CACHE:
+        if type(tduration) is timedelta:
+            cache = DURATION_FORMAT_CACHE[format]
+            try:
+                return cache[tduration]
+            except KeyError:
+                pass
+            ret = _default_isoformat(tduration, format)
+            if len(cache) >= DURATION_FORMAT_CACHE_SIZE:
+                cache.clear()
+            cache[tduration] = ret
+            return ret
+        if isinstance(tduration, (timedelta, Duration)):
+            return _default_isoformat(tduration, format)
     # TODO: implement better decision for negative Durations.
     #       should be done in Duration class in consistent way with timedelta.
+    # a normalised timedelta is negative, if and only if its days are negative.
     if (
         isinstance(tduration, Duration)
-        and (tduration.years < 0 or tduration.months < 0 or tduration.tdelta < timedelta(0))
-    ) or (isinstance(tduration, timedelta) and (tduration < timedelta(0))):
+        and (tduration.years < 0 or tduration.months < 0 or tduration.tdelta.days < 0)
+    ) or (isinstance(tduration, timedelta) and tduration.days < 0):
         ret = "-"
     else:
         ret = ""
@@ -0,0 +1,214 @@
+"""This module provides functions to parse ISO 8601 dates, times and date-times
+into their fields.
+
+parse_date_fields, parse_time_fields and parse_datetime_fields accept the
+same strings as parse_date, parse_time and parse_datetime and raise the same
+exceptions, but return an ISOFields named tuple instead of building date,
+time, datetime and tzinfo objects. Fields a reduced accuracy representation
+does not give are None instead of being filled with defaults.
+"""
+
+from datetime import date
+from typing import NamedTuple, Optional
+
+from isodate._calendar import MAX_ORDINAL, first_ordinal, valid_day, week_ordinal
+from isodate.isodates import _date_from_match, match_date
+from isodate.isoerror import ISO8601Error
+from isodate.isotime import (
+    _check_time_fields,
+    _time_fields_from_match,
+    match_time,
+)
+
+PRECISIONS = ("century", "year", "month", "week", "day", "hour", "minute", "second")
+# the values of ISOFields.precision from the least to the most precise.
+
+DATE_PRECISIONS = (
+    "day",
+    "day",
+    "day",
+    "day",
+    "day",
+    "day",
+    "week",
+    "week",
+    "month",
+    "month",
+    "year",
+    "century",
+)
+# precision of the date regular expressions in the order of build_date_regexps.
+
+TIME_PRECISIONS = ("second", "second", "minute", "minute", "hour")
+# precision of the time regular expressions in the order of build_time_regexps,
+# which is also the name of the match group holding the least significant field.
+
+
+class ISOFields(NamedTuple):
+    """Fields of a parsed ISO 8601 date, time or date-time.
+
+    year, month, day ... the date, None for times. Week and ordinal dates
+                         are converted to month and day, week dates without
+                         a day give the Monday of the week and centuries the
+                         first year of the century, like parse_date does
+    hour, minute, second, microsecond
+                     ... the time, None for dates. If the least significant
+                         component has a fraction, it is carried into the
+                         following fields like parse_time does
+    tz_offset        ... UTC offset in minutes, 0 for Z, None if the string
+                         has no time zone designator
+    precision        ... the least significant component of the
+                         representation, one of PRECISIONS
+
+    Fields after the precision are None, unless they are carried from a
+    fraction.
+    """
+
+    year: Optional[int] = None
+    month: Optional[int] = None
+    day: Optional[int] = None
+    hour: Optional[int] = None
+    minute: Optional[int] = None
+    second: Optional[int] = None
+    microsecond: Optional[int] = None
+    tz_offset: Optional[int] = None
+    precision: Optional[str] = None
+
+
+def _date_fields(
+    datestring: str, yeardigits: int, expanded: bool
+) -> tuple[int, Optional[int], Optional[int], str]:
+    """Return year, month, day and precision of an ISO date."""
+    index, match = match_date(datestring, yeardigits, expanded)
+    if match is None:
+        raise ISO8601Error("Unrecognised ISO 8601 date format: %r" % datestring)
+    precision = DATE_PRECISIONS[index]
+    groups = match.groupdict()
+    sign = -1 if groups["sign"] == "-" else 1
+    if "month" not in groups and precision in ("week", "day"):
+        # week and ordinal dates may fall into the previous or next year
+        year = sign * int(groups["year"])
+        if "week" in groups:
+            ordinal = week_ordinal(year, int(groups["week"]), int(groups.get("day") or 1))
+        else:
+            ordinal = first_ordinal(year) + int(groups["day"]) - 1
+        if not (1 <= year <= 9999 and 1 <= ordinal <= MAX_ORDINAL):
+            _date_from_match(match)  # raises the exception of parse_date
+        value = date.fromordinal(ordinal)
+        return value.year, value.month, value.day, precision
+    month: Optional[int] = None
+    day: Optional[int] = None
+    if precision == "century":
+        year = sign * (int(groups["century"]) * 100 + 1)
+    else:
+        year = sign * int(groups["year"])
+        if precision != "year":
+            month = int(groups["month"]) or 1
+            if precision == "day":
+                day = int(groups["day"])
+    if not valid_day(year, 1 if month is None else month, 1 if day is None else day):
+        _date_from_match(match)  # raises the exception of parse_date
+    return year, month, day, precision
+
+
+def _offset_minutes(groups: dict[str, Optional[str]]) -> Optional[int]:
+    """Return the UTC offset in minutes of the time zone groups of a time.
+
+    Offsets of 24 hours and more are not rejected, as parse_time rejects them
+    only with to_utc.
+    """
+    tzname = groups["tzname"]
+    if not tzname:
+        return None
+    if tzname == "Z":
+        return 0
+    minutes = int(groups["tzhour"] or 0) * 60 + int(groups["tzmin"] or 0)
+    return -minutes if groups["tzsign"] == "-" else minutes
+
+
+def _time_fields(
+    timestring: str,
+) -> tuple[int, Optional[int], Optional[int], Optional[int], Optional[int], str]:
+    """Return hour, minute, second, microsecond, UTC offset and precision of
+    an ISO time.
+    """
+    index, match = match_time(timestring)
+    if match is None:
+        raise ISO8601Error("Unrecognised ISO 8601 time format: %r" % timestring)
+    precision = TIME_PRECISIONS[index]
+    groups = match.groupdict()
+    minute: Optional[int]
+    second: Optional[int]
+    microsecond: Optional[int]
+    value = groups[precision]
+    if len(value) == 2:
+        # no fraction, so the fields are the digits
+        hour = int(groups["hour"])
+        minute = int(groups["minute"]) if precision != "hour" else None
+        second = int(value) if precision == "second" else None
+        microsecond = None
+        _check_time_fields(hour, minute or 0, second or 0)
+    elif precision == "second":
+        # parse_time truncates fractions of seconds to microseconds
+        hour, minute, second = int(groups["hour"]), int(groups["minute"]), int(value[:2])
+        microsecond = int(value[3:9].ljust(6, "0"))
+        _check_time_fields(hour, minute, second)
+    else:
+        hour, minute, second, microsecond, _ = _time_fields_from_match(match)
+        _check_time_fields(hour, minute, second)
+        if microsecond > 999999:
+            raise ValueError("microsecond must be in 0..999999")
+    return hour, minute, second, microsecond, _offset_minutes(groups), precision
+
+
+def parse_date_fields(datestring: str, yeardigits: int = 4, expanded: bool = False) -> ISOFields:
+    """Parse an ISO 8601 date into its fields.
+
+    @param datestring: the ISO date, any representation parse_date accepts
+    @param yeardigits, expanded: see parse_date
+    @return: an ISOFields with the date fields and precision
+    @raise ISO8601Error: if datestring is not an ISO 8601 date
+    @raise ValueError: if parse_date would raise it for the date
+    """
+    if not isinstance(datestring, str):
+        raise TypeError("Expecting a string %r" % datestring)
+    year, month, day, precision = _date_fields(datestring, yeardigits, expanded)
+    return ISOFields(year, month, day, precision=precision)
+
+
+def parse_time_fields(timestring: str) -> ISOFields:
+    """Parse an ISO 8601 time into its fields.
+
+    @param timestring: the ISO time, any representation parse_time accepts
+    @return: an ISOFields with the time fields, UTC offset and precision
+    @raise ISO8601Error: if timestring is not an ISO 8601 time
+    @raise ValueError: if parse_time would raise it for the time
+    """
+    if not isinstance(timestring, str):
+        raise TypeError("Expecting a string %r" % timestring)
+    return ISOFields(None, None, None, *_time_fields(timestring))
+
+
+def parse_datetime_fields(datetimestring: str) -> ISOFields:
+    """Parse an ISO 8601 date-time into its fields.
+
+    The precision is the one of the time.
+
+    @param datetimestring: the ISO date-time, any representation
+                           parse_datetime accepts
+    @return: an ISOFields with the date and time fields, UTC offset and
+             precision
+    @raise ISO8601Error: if datetimestring is not an ISO 8601 date-time
+    @raise ValueError: if parse_datetime would raise it for the date-time
+    """
+    if not isinstance(datetimestring, str):
+        raise TypeError("Expecting a string %r" % datetimestring)
+    try:
+        datestring, timestring = datetimestring.split("T")
+    except ValueError:
+        raise ISO8601Error(
+            "ISO 8601 time designator 'T' missing. Unable to"
+            " parse datetime string %r" % datetimestring
+        )
+    year, month, day, _ = _date_fields(datestring, 4, False)
+    return ISOFields(year, month, day, *_time_fields(timestring))
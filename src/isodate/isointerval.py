@@ -0,0 +1,388 @@
+"""This module provides parsers for ISO 8601 time intervals and recurring
+intervals, and an index to find the intervals containing an instant or
+overlapping a range.
+
+Following ISO 8601 interval formats are supported:
+  start/end        e.g. 2012-06-15T10:00Z/2012-06-15T12:30Z
+  start/duration   e.g. 2012-06-15T10:00Z/PT2H30M
+  duration/end     e.g. PT2H30M/2012-06-15T12:30Z
+
+The start and end are parsed with parse_datetime and the duration with
+parse_duration. Abbreviated ends (like 2012-06-15T10:00/12:30), date only
+intervals and durations without start or end are not supported.
+
+Recurring intervals are supported with a start:
+  Rn/start/duration  e.g. R5/2012-06-15T10:00Z/P1M
+  Rn/start/end       e.g. R5/2012-06-15T10:00Z/2012-06-15T12:30Z
+where n is the number of occurrences, or omitted for unbounded recurrences
+(R/2012-06-15T10:00Z/P1W).
+
+Intervals are treated as half open, i.e. an interval contains an instant t
+if start <= t < end.
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import NamedTuple, Optional, Union
+
+from isodate.duration import Duration, max_days_in_month
+from isodate.isodatetime import parse_datetime
+from isodate.isoduration import parse_duration
+from isodate.isoerror import ISO8601Error
+
+EPOCH = datetime(1970, 1, 1)
+# the epoch of the integer keys of naive datetimes in IntervalIndex.
+
+EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# the epoch of the integer keys of aware datetimes in IntervalIndex.
+
+MICROSECOND = timedelta(microseconds=1)
+# the unit of the integer keys in IntervalIndex.
+
+NO_END = -(2**63)
+# the end of the padding leaves of the tree in IntervalIndex, before any key.
+
+AVERAGE_MONTH = timedelta(days=365.2425 / 12)
+# the average length of a Gregorian month, to estimate occurrence indices.
+
+RECURRENCE_REGEX = re.compile(r"R([0-9]*)")
+# the recurrence part of a recurring interval, with the number of occurrences.
+
+
+class Interval(NamedTuple):
+    """A time interval from start (inclusive) to end (exclusive)."""
+
+    start: datetime
+    end: datetime
+
+
+def _parse_part(
+    part: str, to_utc: bool, default_tz: Optional[tzinfo]
+) -> Union[datetime, timedelta, Duration]:
+    """Parse the start or end of an interval into a datetime or duration."""
+    if part.lstrip("+-").startswith("P"):
+        return parse_duration(part)
+    return parse_datetime(part, to_utc, default_tz)
+
+
+def _check_aware(start: datetime, end: datetime, intervalstring: str) -> None:
+    """Raise ValueError if only one of start and end has a time zone."""
+    if (start.utcoffset() is None) != (end.utcoffset() is None):
+        raise ValueError("start and end must be both naive or both aware: %r" % intervalstring)
+
+
+def parse_interval(
+    intervalstring: str, to_utc: bool = False, default_tz: Optional[tzinfo] = None
+) -> Interval:
+    """Parse an ISO 8601 time interval.
+
+    @param intervalstring: the interval as start/end, start/duration or
+                           duration/end
+    @param to_utc, default_tz: see parse_datetime
+    @return: the Interval with the start and end of the interval
+    @raise ISO8601Error: if intervalstring is not a supported ISO 8601 interval
+    @raise ValueError: if a part can not be parsed, only one of start and end
+                       has a time zone or the end is before the start
+    """
+    if not isinstance(intervalstring, str):
+        raise TypeError("Expecting a string %r" % intervalstring)
+    parts = intervalstring.split("/")
+    if len(parts) != 2:
+        raise ISO8601Error("ISO 8601 interval needs exactly one '/': %r" % intervalstring)
+    first = _parse_part(parts[0], to_utc, default_tz)
+    second = _parse_part(parts[1], to_utc, default_tz)
+    if isinstance(first, datetime):
+        start = first
+        if isinstance(second, datetime):
+            _check_aware(first, second, intervalstring)
+            end = second
+        else:
+            end = first + second  # type: ignore [assignment]
+    elif isinstance(second, datetime):
+        start = second - first  # type: ignore [assignment]
+        end = second
+    else:
+        raise ISO8601Error("ISO 8601 interval without start or end: %r" % intervalstring)
+    if end < start:
+        raise ValueError("end of interval before start: %r" % intervalstring)
+    return Interval(start, end)
+
+
+class IntervalIndex:
+    """An index of time intervals for containment and overlap queries.
+
+    The intervals are sorted by start and augmented with a tree holding the
+    latest end of every subrange. A query visits only subranges which can
+    hold matching intervals, so it takes O((m + 1) log n) time for m matches
+    out of n intervals. Starts and ends are stored as integer microseconds
+    since the epoch, as comparing aware datetimes calls their tzinfo.
+
+    The queries return the positions of the matching intervals in the
+    sequence the index was built from, in ascending order.
+
+    Example:
+        index = IntervalIndex(parse_interval(value) for value in windows)
+        for position in index.containing(event_time):
+            ...
+    """
+
+    __slots__ = ("intervals", "_epoch", "_order", "_starts", "_size", "_tree")
+
+    def __init__(self, intervals: Iterable[tuple[datetime, datetime]]) -> None:
+        """Build the index.
+
+        @param intervals: (start, end) pairs like Interval, with comparable
+                          start and end values (all naive or all aware)
+        """
+        self.intervals = [Interval(*interval) for interval in intervals]
+        aware = bool(self.intervals) and self.intervals[0].start.utcoffset() is not None
+        self._epoch = EPOCH_UTC if aware else EPOCH
+        keys = [(self._key(start), self._key(end)) for start, end in self.intervals]
+        self._order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._starts = [keys[position][0] for position in self._order]
+        # the latest end of every subrange: leaves at size + i, parents at i // 2.
+        size = 1
+        while size < len(keys):
+            size *= 2
+        tree = [NO_END] * 2 * size
+        for index, position in enumerate(self._order):
+            tree[size + index] = keys[position][1]
+        for node in range(size - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self._size = size
+        self._tree = tree
+
+    def _key(self, value: datetime) -> int:
+        """Return the integer key of a datetime.
+
+        @raise TypeError: if value is naive and the intervals are aware or vice
+                          versa, like comparing them would
+        """
+        return (value - self._epoch) // MICROSECOND
+
+    def __len__(self) -> int:
+        """Return the number of intervals."""
+        return len(self.intervals)
+
+    def _ending_after(self, count: int, key: int) -> list[int]:
+        """Return the positions of the first count intervals (by start) ending
+        after the instant with the given key.
+        """
+        result = []
+        tree, size = self._tree, self._size
+        stack = [(1, 0, size)]
+        while stack:
+            node, low, high = stack.pop()
+            if low >= count or tree[node] <= key:
+                continue
+            if node >= size:
+                result.append(self._order[low])
+                continue
+            middle = (low + high) // 2
+            if middle < count:
+                stack.append((2 * node + 1, middle, high))
+            stack.append((2 * node, low, middle))
+        result.sort()
+        return result
+
+    def containing(self, instant: datetime) -> list[int]:
+        """Return the positions of the intervals with start <= instant < end."""
+        if not self.intervals:
+            return []
+        key = self._key(instant)
+        return self._ending_after(bisect_right(self._starts, key), key)
+
+    def overlapping(self, start: datetime, end: datetime) -> list[int]:
+        """Return the positions of the intervals overlapping [start, end).
+
+        An empty range (start == end) overlaps the intervals containing start.
+        """
+        if start == end or not self.intervals:
+            return self.containing(start)
+        return self._ending_after(bisect_left(self._starts, self._key(end)), self._key(start))
+
+
+class RecurringInterval:
+    """A recurring time interval, a sequence of consecutive intervals of equal
+    duration.
+
+    Occurrence k (counted from 0) is the interval from start + k * duration to
+    start + (k + 1) * duration. Every occurrence is computed from the start
+    instead of adding the duration to the previous one, so calendar durations
+    do not drift to the end of shorter months: P1M from 2012-01-31 recurs on
+    2012-02-29, 2012-03-31, 2012-04-30, ...
+
+    nth and occurrences_between do not iterate over the preceding occurrences.
+    The index of an instant is computed with a division for durations without
+    years and months, and with a search taking O(log k) additions otherwise.
+
+    Example:
+        schedule = parse_recurring_interval("R/2012-06-15T10:00Z/P1M")
+        for start, end in schedule.occurrences_between(now, now + horizon):
+            ...
+    """
+
+    __slots__ = ("start", "duration", "recurrences", "_step", "_months", "_tdelta")
+
+    def __init__(
+        self,
+        start: datetime,
+        duration: Union[timedelta, Duration],
+        recurrences: Optional[int] = None,
+    ) -> None:
+        """Initialise the recurring interval.
+
+        @param start: the start of the first occurrence
+        @param duration: the positive duration of every occurrence
+        @param recurrences: the number of occurrences, None for unbounded
+        @raise ValueError: if duration is not positive or has fractional years
+                           or months, or if recurrences is negative
+        """
+        # the duration as timedelta if it has no years and months, otherwise
+        # as months and timedelta to compute the starts like Duration addition
+        self._step: Optional[timedelta] = None
+        self._months = 0
+        self._tdelta = timedelta(0)
+        if isinstance(duration, Duration):
+            months = duration.years * 12 + duration.months
+            if not float(months).is_integer():
+                raise ValueError("fractional years or months not supported for recurrences")
+            if months == 0:
+                self._step = duration.tdelta
+            elif months < 0 or duration.tdelta < timedelta(0):
+                raise ValueError("duration of recurring interval must be positive")
+            self._months = int(months)
+            self._tdelta = duration.tdelta
+        else:
+            self._step = duration
+        if self._step is not None and self._step <= timedelta(0):
+            raise ValueError("duration of recurring interval must be positive")
+        if recurrences is not None and recurrences < 0:
+            raise ValueError("number of recurrences must not be negative")
+        self.start = start
+        self.duration = duration
+        self.recurrences = recurrences
+
+    def _start_of(self, index: int) -> datetime:
+        """Return the start of an occurrence."""
+        if self._step is not None:
+            return self.start + self._step * index
+        start = self.start
+        year, month = divmod(start.month - 1 + self._months * index, 12)
+        year += start.year
+        day = min(start.day, max_days_in_month(year, month + 1))
+        return start.replace(year=year, month=month + 1, day=day) + self._tdelta * index
+
+    def _starts_before(self, index: int, instant: datetime) -> bool:
+        """Return whether an occurrence starts before instant, where occurrences
+        beyond the datetime range start after every instant.
+        """
+        try:
+            return self._start_of(index) < instant
+        except (OverflowError, ValueError):
+            return False
+
+    def _first_from(self, instant: datetime) -> int:
+        """Return the index of the first occurrence starting at or after instant,
+        regardless of the number of recurrences.
+        """
+        if self._step is not None:
+            return max(0, -((self.start - instant) // self._step))
+        average = AVERAGE_MONTH * self._months + self._tdelta
+        low = high = max(0, (instant - self.start) // average)
+        # widen the estimate until the first occurrence lies within [low, high]
+        step = 1
+        while low > 0 and not self._starts_before(low, instant):
+            low, high = max(0, low - step), low
+            step *= 2
+        step = 1
+        while self._starts_before(high, instant):
+            low, high = high, high + step
+            step *= 2
+        while low < high:
+            middle = (low + high) // 2
+            if self._starts_before(middle, instant):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _occurrences(self, index: int, stop: Optional[int]) -> Iterator[Interval]:
+        """Yield the occurrences from index up to stop (exclusive), or up to the
+        end of the datetime range if stop is None.
+        """
+        if stop is not None and index >= stop:
+            return
+        start = self._start_of(index)
+        while stop is None or index < stop:
+            try:
+                end = self._start_of(index + 1)
+            except (OverflowError, ValueError):
+                return
+            yield Interval(start, end)
+            start = end
+            index += 1
+
+    def __iter__(self) -> Iterator[Interval]:
+        """Return a lazy iterator over the occurrences.
+
+        Unbounded recurrences end with the last occurrence ending within the
+        datetime range.
+        """
+        return self._occurrences(0, self.recurrences)
+
+    def nth(self, index: int) -> Interval:
+        """Return an occurrence without iterating over the preceding ones.
+
+        @param index: the index of the occurrence, counted from 0
+        @raise IndexError: if index is negative or not less than recurrences
+        """
+        if index < 0 or (self.recurrences is not None and index >= self.recurrences):
+            raise IndexError("occurrence %d of recurring interval out of range" % index)
+        return Interval(self._start_of(index), self._start_of(index + 1))
+
+    def occurrences_between(self, start: datetime, end: datetime) -> Iterator[Interval]:
+        """Return a lazy iterator over the occurrences starting in [start, end).
+
+        The first occurrence is located directly, the preceding ones are not
+        computed.
+        """
+        first = self._first_from(start)
+        stop = self._first_from(end)
+        if self.recurrences is not None:
+            stop = min(stop, self.recurrences)
+        return self._occurrences(first, stop)
+
+
+def parse_recurring_interval(
+    intervalstring: str, to_utc: bool = False, default_tz: Optional[tzinfo] = None
+) -> RecurringInterval:
+    """Parse an ISO 8601 recurring time interval.
+
+    @param intervalstring: the recurring interval as Rn/start/duration or
+                           Rn/start/end, with n omitted for unbounded
+                           recurrences
+    @param to_utc, default_tz: see parse_datetime
+    @return: the RecurringInterval
+    @raise ISO8601Error: if intervalstring is not a supported ISO 8601
+                         recurring interval
+    @raise ValueError: if a part can not be parsed, only one of start and end
+                       has a time zone or the duration is not positive
+    """
+    if not isinstance(intervalstring, str):
+        raise TypeError("Expecting a string %r" % intervalstring)
+    parts = intervalstring.split("/")
+    match = RECURRENCE_REGEX.fullmatch(parts[0])
+    if len(parts) != 3 or match is None:
+        raise ISO8601Error("Unable to parse ISO 8601 recurring interval %r" % intervalstring)
+    recurrences = int(match.group(1)) if match.group(1) else None
+    start = _parse_part(parts[1], to_utc, default_tz)
+    if not isinstance(start, datetime):
+        raise ISO8601Error("ISO 8601 recurring interval without start: %r" % intervalstring)
+    second = _parse_part(parts[2], to_utc, default_tz)
+    if isinstance(second, datetime):
+        _check_aware(start, second, intervalstring)
+        return RecurringInterval(start, second - start, recurrences)
+    return RecurringInterval(start, second, recurrences)
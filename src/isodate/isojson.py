@@ -0,0 +1,217 @@
+"""This module provides a JSON encoder and decoder for ISO 8601 values.
+
+ISOJSONEncoder serializes date, time, datetime, timedelta and Duration
+instances with the isoformat functions. ISOJSONDecoder parses the values of
+configured keys or key paths only, with a memoized parse function per kind,
+instead of trying to parse every string of a document.
+"""
+
+import json
+from collections.abc import Iterable, Mapping
+from copy import copy
+from datetime import date, datetime, time, timedelta, tzinfo
+from functools import lru_cache, partial
+from typing import Any, Callable, Optional, Union
+
+from isodate.duration import Duration
+from isodate.isodates import date_isoformat, parse_date
+from isodate.isodatetime import datetime_isoformat, parse_datetime
+from isodate.isoduration import duration_isoformat, parse_duration
+from isodate.isostrf import D_DEFAULT, DATE_EXT_COMPLETE, TIME_EXT_COMPLETE, TZ_EXT
+from isodate.isotime import parse_time, time_isoformat
+
+JSON_KINDS = ("date", "time", "datetime", "duration")
+# the kinds of values ISOJSONDecoder can parse.
+
+JSON_CACHE_SIZE = 4096
+# default number of parsed strings ISOJSONDecoder caches per kind.
+
+KeyPath = Union[str, tuple[str, ...]]
+# a path of keys from the top level value, as tuple or dotted string. A key
+# "*" matches every item of an array and every value of an object.
+
+
+class ISOJSONEncoder(json.JSONEncoder):
+    """A JSON encoder rendering ISO 8601 strings for dates, times and durations.
+
+    The formats default to the ones of date_isoformat, time_isoformat,
+    datetime_isoformat and duration_isoformat, which do not render
+    microseconds. Pass formats with %f to keep them.
+
+    Example:
+        json.dumps(document, cls=ISOJSONEncoder)
+    """
+
+    def __init__(
+        self,
+        *,
+        date_format: str = DATE_EXT_COMPLETE,
+        time_format: str = TIME_EXT_COMPLETE + TZ_EXT,
+        datetime_format: str = DATE_EXT_COMPLETE + "T" + TIME_EXT_COMPLETE + TZ_EXT,
+        duration_format: str = D_DEFAULT,
+        **kwargs: Any,
+    ) -> None:
+        """Initialise the encoder.
+
+        @param date_format, time_format, datetime_format, duration_format:
+            the strftime formats for date, time, datetime and timedelta or
+            Duration instances
+        @param kwargs: the arguments of json.JSONEncoder
+        """
+        super().__init__(**kwargs)
+        self.date_format = date_format
+        self.time_format = time_format
+        self.datetime_format = datetime_format
+        self.duration_format = duration_format
+
+    def default(self, o: Any) -> Any:
+        """Render dates, times and durations, see json.JSONEncoder.default."""
+        if isinstance(o, datetime):
+            return datetime_isoformat(o, self.datetime_format)
+        if isinstance(o, date):
+            return date_isoformat(o, self.date_format)
+        if isinstance(o, time):
+            return time_isoformat(o, self.time_format)
+        if isinstance(o, (timedelta, Duration)):
+            return duration_isoformat(o, self.duration_format)
+        return super().default(o)
+
+
+def _key_path(path: KeyPath) -> tuple[str, ...]:
+    """Return a key path as tuple of keys."""
+    return tuple(path.split(".")) if isinstance(path, str) else tuple(path)
+
+
+def _kinds(keys: Union[Iterable[KeyPath], Mapping[Any, str]], kind: str) -> list[tuple[Any, str]]:
+    """Return (key, kind) pairs for the keys or a mapping of keys to kinds."""
+    if isinstance(keys, Mapping):
+        pairs = list(keys.items())
+    else:
+        pairs = [(key, kind) for key in keys]
+    for _, value in pairs:
+        if value not in JSON_KINDS:
+            raise ValueError("unknown kind %r" % value)
+    return pairs
+
+
+def _copy_duration(parser: Callable[[str], Any]) -> Callable[[str], Any]:
+    """Wrap a cached duration parser to return a copy of Duration results.
+
+    Duration instances are mutable, so documents must not share them. The
+    timedelta results are immutable and returned as they are.
+    """
+
+    def parse(value: str) -> Any:
+        result = parser(value)
+        return copy(result) if isinstance(result, Duration) else result
+
+    return parse
+
+
+def _convert_path(node: Any, path: tuple[str, ...], parser: Callable[[str], Any]) -> None:
+    """Parse the strings at path (relative to node) in place."""
+    key, rest = path[0], path[1:]
+    if isinstance(node, dict):
+        children: Iterable[Any] = list(node) if key == "*" else (key,) if key in node else ()
+    elif isinstance(node, list) and key == "*":
+        children = range(len(node))
+    else:
+        return
+    for child in children:
+        if rest:
+            _convert_path(node[child], rest, parser)
+        elif isinstance(node[child], str):
+            node[child] = parser(node[child])
+
+
+class ISOJSONDecoder(json.JSONDecoder):
+    """A JSON decoder parsing the ISO 8601 strings of configured keys.
+
+    Keys are matched in every object of the document, paths from the top
+    level value only. Values which are no strings (like null) are left
+    unchanged, strings which can not be parsed raise the exception of the
+    parse function. Parsed strings are cached per decoder, so reuse the
+    decoder for documents with repeating values. Every decoded Duration is a
+    separate instance.
+
+    Keys are parsed while the document is decoded, before an object_hook is
+    called for the object, so the hook gets the parsed values. Paths are
+    converted after decoding, in the value returned by the hooks: the hook
+    sees their values as strings, and paths only reach into the dicts and
+    lists it returns.
+
+    Example:
+        decoder = ISOJSONDecoder(keys=["created"], paths={"items.*.ttl": "duration"})
+        document = decoder.decode(text)
+    """
+
+    def __init__(
+        self,
+        *,
+        keys: Union[Iterable[str], Mapping[str, str]] = (),
+        paths: Union[Iterable[KeyPath], Mapping[KeyPath, str]] = (),
+        kind: str = "datetime",
+        cache_size: Optional[int] = JSON_CACHE_SIZE,
+        to_utc: bool = False,
+        default_tz: Optional[tzinfo] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialise the decoder.
+
+        @param keys: the keys of the values to parse, or a mapping of keys to
+                     the kinds of their values
+        @param paths: the key paths of the values to parse, or a mapping of
+                      key paths to the kinds of their values
+        @param kind: the kind of the values of keys and paths given without
+                     kinds, one of JSON_KINDS
+        @param cache_size: how many parsed strings are cached per kind, None
+                           for no limit
+        @param to_utc, default_tz: see parse_time and parse_datetime
+        @param kwargs: the arguments of json.JSONDecoder
+        """
+        parsers: dict[str, Callable[[str], Any]] = {
+            "date": parse_date,
+            "time": partial(parse_time, to_utc=to_utc, default_tz=default_tz),
+            "datetime": partial(parse_datetime, to_utc=to_utc, default_tz=default_tz),
+            "duration": parse_duration,
+        }
+        self._caches = {name: lru_cache(cache_size)(parser) for name, parser in parsers.items()}
+        self._parsers: dict[str, Callable[[str], Any]] = dict(self._caches)
+        self._parsers["duration"] = _copy_duration(self._caches["duration"])
+        self._keys = [(key, self._parsers[name]) for key, name in _kinds(keys, kind)]
+        self._paths = [(_key_path(path), self._parsers[name]) for path, name in _kinds(paths, kind)]
+        self._object_hook = kwargs.pop("object_hook", None)
+        if self._keys:
+            if kwargs.get("object_pairs_hook") is not None:
+                raise ValueError("keys can not be combined with object_pairs_hook")
+            kwargs["object_hook"] = self._parse_keys
+        else:
+            kwargs["object_hook"] = self._object_hook
+        super().__init__(**kwargs)
+
+    def _parse_keys(self, obj: dict[str, Any]) -> Any:
+        """Parse the values of the configured keys of a decoded object."""
+        for key, parser in self._keys:
+            if key in obj:
+                value = obj[key]
+                if isinstance(value, str):
+                    obj[key] = parser(value)
+        if self._object_hook is not None:
+            return self._object_hook(obj)
+        return obj
+
+    def decode(self, s: str, *args: Any) -> Any:
+        """Decode a JSON document and parse the configured values."""
+        obj = super().decode(s, *args)
+        for path, parser in self._paths:
+            _convert_path(obj, path, parser)
+        return obj
+
+    def cache_info(self) -> dict[str, Any]:
+        """Return the functools cache statistics of the parse functions per kind."""
+        return {name: cache.cache_info() for name, cache in self._caches.items()}
+
+    def cache_clear(self) -> None:
+        """Clear the caches of parsed strings."""
+        for cache in self._caches.values():
+            cache.cache_clear()
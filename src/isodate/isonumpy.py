@@ -0,0 +1,82 @@
+"""This module provides bulk parsers producing NumPy arrays.
+
+NumPy is an optional dependency of isodate. It is imported only when one of the
+functions in this module is called, so that importing isodate itself does not
+require NumPy.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from isodate.isoduration import DURATION_UNITS, parse_duration_ints
+from isodate.isoerror import ISO8601Error
+
+if TYPE_CHECKING:
+    import numpy
+
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+# the range of values representable by numpy.int64 based arrays.
+# INT64_MIN is used as NaT (not a time) by numpy.timedelta64.
+
+
+def _import_numpy() -> Any:
+    """Import numpy or raise an ImportError explaining the optional dependency."""
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "numpy is required for this function; install it with 'pip install isodate[numpy]'"
+        ) from exc
+    return numpy
+
+
+def parse_duration_array(
+    durations: Iterable[str], unit: str = "us"
+) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Parses an array of ISO 8601 duration strings.
+
+    Returns a tuple of three arrays with the same shape as durations:
+      - a timedelta64[us] (or timedelta64[ns] if unit='ns') array holding the
+        exact part of each duration (weeks, days, hours, minutes, seconds)
+      - an int64 array holding the calendar part of each duration as number
+        of months (years * 12 + months)
+      - a boolean array, which is False for every value, that could not be
+        parsed. Invalid values are NaT in the timedelta array and 0 in the
+        months array.
+
+    All formats supported by parse_duration are accepted, including the
+    alternative format PYYYY-MM-DDThh:mm:ss. The values are parsed one by one
+    with parse_duration_ints, so no float rounding happens; only the results
+    are collected into NumPy arrays, the parsing itself is not vectorised.
+
+    @raise ValueError: if unit is not one of DURATION_UNITS
+    """
+    if unit not in DURATION_UNITS:
+        raise ValueError("unknown duration unit %r" % unit)
+    np = _import_numpy()
+    strings = np.asarray(durations)
+    ticks: list[int] = []
+    months: list[int] = []
+    valid: list[bool] = []
+    for value in strings.ravel().tolist():
+        try:
+            nmonths, nticks = parse_duration_ints(value, unit)
+        except (ISO8601Error, ValueError, TypeError):
+            nmonths, nticks = 0, INT64_MIN
+        if INT64_MIN < nticks <= INT64_MAX and INT64_MIN <= nmonths <= INT64_MAX:
+            ticks.append(nticks)
+            months.append(nmonths)
+            valid.append(True)
+        else:
+            ticks.append(INT64_MIN)
+            months.append(0)
+            valid.append(False)
+    shape = strings.shape
+    return (
+        np.array(ticks, dtype=np.int64).view("timedelta64[%s]" % unit).reshape(shape),
+        np.array(months, dtype=np.int64).reshape(shape),
+        np.array(valid, dtype=bool).reshape(shape),
+    )
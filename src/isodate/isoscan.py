@@ -0,0 +1,95 @@
+"""This module provides functions to find ISO 8601 dates, date-times and
+durations embedded in free text, e.g. log files or documents.
+
+The text is scanned once with a single regular expression combining the
+candidate representations. Only the candidates are parsed, with the
+exception-free try_parse_* functions, so splitting the text into tokens and
+calling a parse function on each of them is not needed.
+
+As basic format dates and times without a time designator are
+indistinguishable from ordinary numbers (1985 is a year, 1020 a time), only
+extended format dates (1985-04-12, 1985-W15-5 and 1985-W15), date-times with
+a T time designator and durations in the designator format (P1DT2H) are
+found. Candidates must not be adjacent to letters or digits.
+"""
+
+import re
+from collections.abc import Collection, Iterator
+from datetime import date, datetime, timedelta, tzinfo
+from typing import Optional, Union
+
+from isodate.duration import Duration
+from isodate.isovalid import try_parse_date, try_parse_datetime, try_parse_duration
+
+SCAN_KINDS = ("date", "datetime", "duration")
+# the kinds of values find_datetimes and iter_datetimes can find.
+
+SCAN_REGEX = re.compile(
+    # not inside a word or number, and not continuing another value
+    r"(?<!\w)(?<![0-9][-+:.,])"
+    r"(?:"
+    # date-time: any 4 digit year date, T and a time with optional time zone
+    r"(?P<datetime>[0-9]{4}(?:-[0-9]{2}-[0-9]{2}|-W[0-9]{2}(?:-[0-9])?|-[0-9]{2,3}"
+    r"|W[0-9]{2}[0-9]?|[0-9]{2,4})?"
+    r"T[0-9]{2}(?::?[0-9]{2}){0,2}(?:[.,][0-9]+)?(?:Z|[+-][0-9]{2}(?::?[0-9]{2})?)?)"
+    # date: extended complete calendar and week dates
+    r"|(?P<date>[0-9]{4}-(?:[0-9]{2}-[0-9]{2}|W[0-9]{2}(?:-[0-9])?))"
+    # duration: designator format with at least one component
+    r"|(?P<duration>[+-]?P(?=[0-9]|T[0-9])(?:[0-9]+(?:[.,][0-9]+)?[YMWD])*"
+    r"(?:T(?:[0-9]+(?:[.,][0-9]+)?[HMS])+)?)"
+    r")"
+    # not followed by letters, digits or a continuation of the value
+    r"(?!\w|[-+:.,][0-9])"
+)
+# regular expression matching the candidates in a single pass over the text.
+
+
+def iter_datetimes(
+    text: str,
+    kinds: Collection[str] = SCAN_KINDS,
+    to_utc: bool = False,
+    default_tz: Optional[tzinfo] = None,
+    as_timedelta_if_possible: bool = True,
+) -> Iterator[tuple[int, int, Union[date, datetime, timedelta, Duration]]]:
+    """Find the ISO 8601 dates, date-times and durations in text.
+
+    Candidates which are not valid (e.g. 1985-02-30) are skipped. Values of
+    kinds not in kinds are skipped, a date-time is not reported as a date.
+
+    @param text: the text to scan
+    @param kinds: the kinds of values to report, see SCAN_KINDS
+    @param to_utc, default_tz: see parse_datetime
+    @param as_timedelta_if_possible: see parse_duration
+    @return: an iterator over (start, end, value) tuples, where
+             text[start:end] is the ISO string of value
+    """
+    for name in kinds:
+        if name not in SCAN_KINDS:
+            raise ValueError("unknown kind %r" % name)
+    for match in SCAN_REGEX.finditer(text):
+        kind = match.lastgroup
+        if kind not in kinds:
+            continue
+        isostring = match.group()
+        value: Union[date, datetime, timedelta, Duration, None]
+        if kind == "datetime":
+            value = try_parse_datetime(isostring, to_utc=to_utc, default_tz=default_tz)
+        elif kind == "date":
+            value = try_parse_date(isostring)
+        else:
+            value = try_parse_duration(isostring, as_timedelta_if_possible=as_timedelta_if_possible)
+        if value is not None:
+            yield match.start(), match.end(), value
+
+
+def find_datetimes(
+    text: str,
+    kinds: Collection[str] = SCAN_KINDS,
+    to_utc: bool = False,
+    default_tz: Optional[tzinfo] = None,
+    as_timedelta_if_possible: bool = True,
+) -> list[tuple[int, int, Union[date, datetime, timedelta, Duration]]]:
+    """Return a list of the (start, end, value) tuples iter_datetimes yields,
+    see there.
+    """
+    return list(iter_datetimes(text, kinds, to_utc, default_tz, as_timedelta_if_possible))
@@ -0,0 +1,142 @@
+"""This module provides opt-in instrumentation of the isodate parse functions.
+
+When enabled with enable_stats, the parse functions record their call counts,
+latency histograms and error counts, and the date and time parsers record
+which of their regular expressions matched. Nested calls are recorded too, so
+parse_datetime also shows up as a parse_date and a parse_time call.
+
+get_stats returns a snapshot of the statistics and reset_stats discards them.
+While disabled, the parse functions only check the ENABLED flag, before they
+call their implementation.
+"""
+
+import threading
+from collections.abc import Callable
+from time import perf_counter_ns
+from typing import Any, TypeVar
+
+from isodate.isoerror import ISO8601Error
+
+T = TypeVar("T")
+
+ENABLED = False
+# whether statistics are recorded. Use enable_stats to change it.
+
+CALL_STATS: dict[str, list[int]] = {}
+# per parse function the number of calls, of raised ISO8601Errors, of other
+# exceptions and the total time spent in nanoseconds.
+
+LATENCY_STATS: dict[str, dict[int, int]] = {}
+# per parse function a histogram of call latencies. The key is the upper bound
+# of a bucket in nanoseconds, which is a power of two.
+
+PATTERN_STATS: dict[str, list[int]] = {}
+# per group of regular expressions ("date", "time") the number of hits for
+# each pattern index followed by the number of misses and the total number of
+# patterns tried.
+
+STATS_LOCK = threading.Lock()
+# serialises updates of the statistics dictionaries.
+
+
+def enable_stats(enabled: bool = True) -> None:
+    """Start (or stop with enabled=False) recording statistics."""
+    global ENABLED
+    ENABLED = enabled
+
+
+def reset_stats() -> None:
+    """Discard all recorded statistics."""
+    with STATS_LOCK:
+        CALL_STATS.clear()
+        LATENCY_STATS.clear()
+        PATTERN_STATS.clear()
+
+
+def get_stats() -> dict[str, Any]:
+    """Return a snapshot of the recorded statistics.
+
+    The snapshot is a dictionary with the keys:
+      calls    ... per parse function a dictionary with calls, errors
+                   (ISO8601Error), error_rate, exceptions (other errors),
+                   total_ns, mean_ns and histogram (latency bucket upper
+                   bound in nanoseconds to number of calls)
+      patterns ... per group of regular expressions ("date", "time") a
+                   dictionary with hits (pattern index to number of matches,
+                   the indices refer to build_date_regexps and
+                   build_time_regexps), misses, tried (patterns tried in
+                   total) and mean_tried (patterns tried per lookup)
+    """
+    with STATS_LOCK:
+        calls = {}
+        for name, (count, errors, exceptions, total_ns) in CALL_STATS.items():
+            calls[name] = {
+                "calls": count,
+                "errors": errors,
+                "error_rate": errors / count,
+                "exceptions": exceptions,
+                "total_ns": total_ns,
+                "mean_ns": total_ns / count,
+                "histogram": dict(sorted(LATENCY_STATS[name].items())),
+            }
+        patterns = {}
+        for group, counts in PATTERN_STATS.items():
+            hits, (misses, tried) = counts[:-2], counts[-2:]
+            lookups = sum(hits) + misses
+            patterns[group] = {
+                "hits": {index: count for index, count in enumerate(hits) if count},
+                "misses": misses,
+                "tried": tried,
+                "mean_tried": tried / lookups,
+            }
+    return {"calls": calls, "patterns": patterns}
+
+
+def record_pattern(group: str, index: int, patterns: int) -> None:
+    """Record which of the regular expressions of a group matched.
+
+    @param group: name of the group of regular expressions
+    @param index: index of the matching pattern, -1 if none matched
+    @param patterns: number of patterns in the group
+    """
+    with STATS_LOCK:
+        counts = PATTERN_STATS.get(group)
+        if counts is None:
+            counts = PATTERN_STATS[group] = [0] * (patterns + 2)
+        if index < 0:
+            counts[-2] += 1
+            counts[-1] += patterns
+        else:
+            counts[index] += 1
+            counts[-1] += index + 1
+
+
+def _record_call(name: str, elapsed_ns: int, error: int, exception: int) -> None:
+    """Record a call of a parse function."""
+    with STATS_LOCK:
+        counts = CALL_STATS.get(name)
+        if counts is None:
+            counts = CALL_STATS[name] = [0, 0, 0, 0]
+            LATENCY_STATS[name] = {}
+        counts[0] += 1
+        counts[1] += error
+        counts[2] += exception
+        counts[3] += elapsed_ns
+        histogram = LATENCY_STATS[name]
+        bucket = 1 << max(elapsed_ns - 1, 0).bit_length()
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+
+
+def timed(name: str, func: Callable[..., T], *args: Any) -> T:
+    """Call func with args and record it as a call of the parse function name."""
+    start = perf_counter_ns()
+    try:
+        result = func(*args)
+    except ISO8601Error:
+        _record_call(name, perf_counter_ns() - start, 1, 0)
+        raise
+    except Exception:
+        _record_call(name, perf_counter_ns() - start, 0, 1)
+        raise
+    _record_call(name, perf_counter_ns() - start, 0, 0)
+    return result
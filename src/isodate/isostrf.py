@@ -7,10 +7,15 @@ pr-defined format strings in this module to make ease producing of ISO 8601
 conforming strings.
 """
 
+import io
 import re
-from datetime import date, time, timedelta
-from typing import Callable, Union
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta
+from functools import partial
+from operator import attrgetter, methodcaller
+from typing import IO, Any, Callable, Union
 
+from isodate._calendar import first_ordinal, week1_ordinal
 from isodate.duration import Duration
 from isodate.isotzinfo import tz_isoformat
 
@@ -56,38 +61,253 @@ D_ALT_BAS = "P" + DATE_BAS_COMPLETE + "T" + TIME_BAS_COMPLETE
 D_ALT_EXT_ORD = "P" + DATE_EXT_ORD_COMPLETE + "T" + TIME_EXT_COMPLETE
 D_ALT_BAS_ORD = "P" + DATE_BAS_ORD_COMPLETE + "T" + TIME_BAS_COMPLETE
 
-STRF_DT_MAP: dict[str, Callable[[Union[time, date], int], str]] = {
-    "%d": lambda tdt, yds: "%02d" % tdt.day,  # type: ignore [union-attr]
-    "%f": lambda tdt, yds: "%06d" % tdt.microsecond,  # type: ignore [union-attr]
-    "%H": lambda tdt, yds: "%02d" % tdt.hour,  # type: ignore [union-attr]
-    "%j": lambda tdt, yds: "%03d" % (tdt.toordinal() - date(tdt.year, 1, 1).toordinal() + 1),  # type: ignore [union-attr, operator] # noqa: E501
-    "%m": lambda tdt, yds: "%02d" % tdt.month,  # type: ignore [union-attr]
-    "%M": lambda tdt, yds: "%02d" % tdt.minute,  # type: ignore [union-attr]
-    "%S": lambda tdt, yds: "%02d" % tdt.second,  # type: ignore [union-attr]
-    "%w": lambda tdt, yds: "%1d" % tdt.isoweekday(),  # type: ignore [union-attr]
-    "%W": lambda tdt, yds: "%02d" % tdt.isocalendar()[1],  # type: ignore [union-attr]
-    "%Y": lambda tdt, yds: (((yds != 4) and "+") or "") + (("%%0%dd" % yds) % tdt.year),  # type: ignore [union-attr] # noqa: E501
-    "%C": lambda tdt, yds: (((yds != 4) and "+") or "")  # type: ignore [union-attr]
-    + (("%%0%dd" % (yds - 2)) % (tdt.year / 100)),  # type: ignore [union-attr]
-    "%h": lambda tdt, yds: tz_isoformat(tdt, "%h"),  # type: ignore [arg-type]
-    "%Z": lambda tdt, yds: tz_isoformat(tdt, "%Z"),  # type: ignore [arg-type]
-    "%z": lambda tdt, yds: tz_isoformat(tdt, "%z"),  # type: ignore [arg-type]
-    "%%": lambda tdt, yds: "%",
+FieldSpec = tuple[str, Union[str, Callable[[Any], Any]]]
+# a printf style conversion and the attribute name or a function extracting the
+# value to render for a single strftime directive.
+
+
+YEAR_ORDINAL_CACHE: dict[int, tuple[int, int, int]] = {}
+# A dictionary to cache calendar data per year. Each entry holds the proleptic
+# Gregorian ordinal of January 1st, of the Monday starting ISO week 1 and of
+# the Monday starting ISO week 1 of the following year.
+
+
+def _year_ordinals(year: int) -> tuple[int, int, int]:
+    """Return the YEAR_ORDINAL_CACHE entry for year."""
+    try:
+        return YEAR_ORDINAL_CACHE[year]
+    except KeyError:
+        pass
+    entry = (first_ordinal(year), week1_ordinal(year), week1_ordinal(year + 1))
+    return YEAR_ORDINAL_CACHE.setdefault(year, entry)
+
+
+def _ordinal_day(tdt: date) -> int:
+    """Return the day of the year (%j) for a date instance."""
+    return tdt.toordinal() - _year_ordinals(tdt.year)[0] + 1
+
+
+def _iso_week(tdt: date) -> int:
+    """Return the ISO week number (%W) for a date instance."""
+    ordinal = tdt.toordinal()
+    _, week1, nextweek1 = _year_ordinals(tdt.year)
+    if ordinal < week1:
+        # belongs to the last week of the previous year
+        week1 = _year_ordinals(tdt.year - 1)[1]
+    elif ordinal >= nextweek1:
+        # belongs to the first week of the next year
+        week1 = nextweek1
+    return (ordinal - week1) // 7 + 1
+
+
+def _strfduration_p(tdt: Union[timedelta, Duration]) -> str:
+    """Render the %P directive for a timedelta or Duration instance.
+
+    The time part is built from the integer days, seconds and microseconds of
+    the normalised absolute timedelta.
+    """
+    prefix = ""
+    if isinstance(tdt, Duration):
+        if tdt.years:
+            prefix = str(abs(tdt.years)) + "Y"
+        if tdt.months:
+            prefix += str(abs(tdt.months)) + "M"
+        tdt = tdt.tdelta
+    tdt = abs(tdt)
+    days = tdt.days
+    seconds = tdt.seconds
+    usecs = tdt.microseconds
+    if not seconds and not usecs:
+        if days:
+            return prefix + "%dD" % days
+        # at least one component has to be there.
+        return prefix or "0D"
+    ret = prefix + "%dDT" % days if days else prefix + "T"
+    if seconds >= 3600:
+        ret += "%dH" % (seconds // 3600)
+        seconds %= 3600
+    if seconds >= 60:
+        ret += "%dM" % (seconds // 60)
+        seconds %= 60
+    if usecs:
+        return ret + ("%d.%06d" % (seconds, usecs)).rstrip("0") + "S"
+    if seconds:
+        return ret + "%dS" % seconds
+    return ret
+
+
+STRF_DT_FIELDS: dict[str, FieldSpec] = {
+    "%d": ("%02d", "day"),
+    "%f": ("%06d", "microsecond"),
+    "%H": ("%02d", "hour"),
+    "%j": ("%03d", _ordinal_day),
+    "%m": ("%02d", "month"),
+    "%M": ("%02d", "minute"),
+    "%S": ("%02d", "second"),
+    "%w": ("%1d", methodcaller("isoweekday")),
+    "%W": ("%02d", _iso_week),
+    "%Y": ("%0{}d", "year"),
+    "%C": ("%0{}d", lambda tdt: tdt.year // 100),  # type: ignore [union-attr]
+    "%h": ("%s", lambda tdt: tz_isoformat(tdt, "%h")),  # type: ignore [arg-type]
+    "%Z": ("%s", lambda tdt: tz_isoformat(tdt, "%Z")),  # type: ignore [arg-type]
+    "%z": ("%s", lambda tdt: tz_isoformat(tdt, "%z")),  # type: ignore [arg-type]
+}
+# Map time and date directives to their FieldSpec.
+# The year and century conversions get the number of digits filled in.
+
+STRF_D_FIELDS: dict[str, FieldSpec] = {
+    "%d": ("%02d", "days"),
+    "%f": ("%06d", "microseconds"),
+    "%H": ("%02d", lambda tdt: tdt.seconds // 3600),
+    "%m": ("%02d", "months"),
+    "%M": ("%02d", lambda tdt: (tdt.seconds // 60) % 60),
+    "%S": ("%02d", lambda tdt: tdt.seconds % 60),
+    "%W": ("%02d", lambda tdt: abs(tdt.days) // 7),
+    "%Y": ("%0{}d", "years"),
+    "%C": ("%0{}d", lambda tdt: tdt.years / 100),  # type: ignore [union-attr]
+    "%P": ("%s", _strfduration_p),
+    "%p": ("%s", lambda tdt: str(abs(tdt.days // 7)) + "W"),
 }
+# Map duration directives to their FieldSpec.
+
+STRF_DT_RE = re.compile("(%d|%f|%H|%j|%m|%M|%S|%w|%W|%Y|%C|%z|%Z|%h|%%)")
+STRF_D_RE = re.compile("(%d|%f|%H|%m|%M|%S|%W|%Y|%C|%%|%P|%p)")
+# regular expressions to split format strings into literal text and directives.
+
+STRF_PROGRAM_CACHE: dict[tuple[str, int, bool, bool], Callable[[Any], Any]] = {}
+# A dictionary to cache compiled format programs.
+# A program is identified by the format string, the number of year digits,
+# whether it formats durations or date/time instances and whether it renders
+# str or ASCII bytes.
+
+STRF_CHUNK_SIZE = 8192
+# number of values rendered into one chunk, before it is written to the stream
+# by write_formatted.
+
+STRF_PROGRAM_CACHE_SIZE = 512
+# maximum number of cached format programs. The cache is cleared, when this
+# limit is reached, to protect against unbounded growth with generated formats.
+
+
+def _encoded(getter: Callable[[Any], str]) -> Callable[[Any], bytes]:
+    """Wrap a field function returning str into one returning ASCII bytes."""
+    return lambda tdt: getter(tdt).encode("ascii")
+
+
+def _compile(
+    format: str, yeardigits: int, duration: bool, binary: bool = False
+) -> Callable[[Any], Any]:
+    """Compile a format string into a function rendering a single value.
+
+    The format is split into literal text and directives once. Literal text and
+    the conversions of all directives are combined into a single printf style
+    template, which is filled with the values extracted by the field functions.
+    If binary is True, the template is ASCII bytes and the function returns bytes.
+    """
+    if duration:
+        splitter, fields = STRF_D_RE, STRF_D_FIELDS
+    else:
+        splitter, fields = STRF_DT_RE, STRF_DT_FIELDS
+    template: list[str] = []
+    getters: list[Callable[[Any], Any]] = []
+    attrs: list[str] = []
+    for idx, token in enumerate(splitter.split(format)):
+        if idx % 2 == 0:
+            # literal text
+            template.append(token.replace("%", "%%"))
+            continue
+        if token == "%%":
+            template.append("%%")
+            continue
+        conversion, getter = fields[token]
+        if token in ("%Y", "%C"):
+            digits = yeardigits if token == "%Y" else yeardigits - 2
+            conversion = ((yeardigits != 4) and "+" or "") + conversion.format(digits)
+        template.append(conversion)
+        if isinstance(getter, str):
+            attrs.append(getter)
+            getter = attrgetter(getter)
+        elif binary and conversion == "%s":
+            getter = _encoded(getter)
+        getters.append(getter)
+    text = "".join(template)
+    # the template of binary programs is encoded once, so bytes are rendered
+    pattern: Union[str, bytes] = text.encode("ascii") if binary else text
+    if not getters:
+        result = pattern % ()
+        return lambda tdt: result
+    if len(attrs) == len(getters) > 1:
+        # all values are plain attributes, fetch them with a single call
+        getall = attrgetter(*attrs)
+        return lambda tdt: pattern % getall(tdt)
+    if len(getters) == 1:
+        getter = getters[0]
+        return lambda tdt: pattern % (getter(tdt),)
+    return lambda tdt: pattern % tuple([getter(tdt) for getter in getters])
+
+
+def _native_date_ext_complete(generic: Callable[[Any], str], tdt: Union[time, date]) -> str:
+    """Render DATE_EXT_COMPLETE with the C implementation of date.isoformat."""
+    if type(tdt) is date:
+        return tdt.isoformat()
+    if type(tdt) is datetime and tdt.tzinfo is None:
+        return tdt.isoformat()[:10]
+    return generic(tdt)
+
+
+def _native_time_ext_complete(generic: Callable[[Any], str], tdt: Union[time, date]) -> str:
+    """Render TIME_EXT_COMPLETE with the C implementation of time.isoformat.
+
+    This is also used for TIME_EXT_COMPLETE + TZ_EXT, as naive values have an
+    empty time zone designator.
+    """
+    if type(tdt) is time and tdt.tzinfo is None:
+        return tdt.isoformat("seconds")
+    if type(tdt) is datetime and tdt.tzinfo is None:
+        return tdt.isoformat(timespec="seconds")[11:]
+    return generic(tdt)
+
+
+def _native_dt_ext_complete(generic: Callable[[Any], str], tdt: Union[time, date]) -> str:
+    """Render DT_EXT_COMPLETE with the C implementation of datetime.isoformat.
+
+    The time zone designator of aware values is rendered by tz_isoformat, as
+    datetime.isoformat rejects offsets of 24 hours or more.
+    """
+    if type(tdt) is datetime:
+        if tdt.tzinfo is None:
+            return tdt.isoformat(timespec="seconds")
+        return tdt.replace(tzinfo=None).isoformat(timespec="seconds") + tz_isoformat(tdt, "%Z")
+    return generic(tdt)
+
 
-STRF_D_MAP: dict[str, Callable[[Union[timedelta, Duration], int], str]] = {
-    "%d": lambda tdt, yds: "%02d" % tdt.days,
-    "%f": lambda tdt, yds: "%06d" % tdt.microseconds,
-    "%H": lambda tdt, yds: "%02d" % (tdt.seconds / 60 / 60),
-    "%m": lambda tdt, yds: "%02d" % tdt.months,  # type: ignore [union-attr]
-    "%M": lambda tdt, yds: "%02d" % ((tdt.seconds / 60) % 60),
-    "%S": lambda tdt, yds: "%02d" % (tdt.seconds % 60),
-    "%W": lambda tdt, yds: "%02d" % (abs(tdt.days / 7)),
-    "%Y": lambda tdt, yds: (((yds != 4) and "+") or "") + (("%%0%dd" % yds) % tdt.years),  # type: ignore [union-attr] # noqa: E501
-    "%C": lambda tdt, yds: (((yds != 4) and "+") or "")
-    + (("%%0%dd" % (yds - 2)) % (tdt.years / 100)),  # type: ignore [union-attr]
-    "%%": lambda tdt, yds: "%",
+STRF_NATIVE_FORMATS: dict[str, Callable[[Callable[[Any], str], Union[time, date]], str]] = {
+    DATE_EXT_COMPLETE: _native_date_ext_complete,
+    TIME_EXT_COMPLETE: _native_time_ext_complete,
+    TIME_EXT_COMPLETE + TZ_EXT: _native_time_ext_complete,
+    DT_EXT_COMPLETE: _native_dt_ext_complete,
 }
+# Well known formats, which can be rendered by the isoformat methods of the
+# standard library types with 4 digit years. Each function falls back to the
+# generic compiled program for all other types.
+
+
+def _program(
+    format: str, yeardigits: int, duration: bool, binary: bool = False
+) -> Callable[[Any], Any]:
+    """Return the cached compiled program for the given format."""
+    key = (format, yeardigits, duration, binary)
+    try:
+        return STRF_PROGRAM_CACHE[key]
+    except KeyError:
+        pass
+    if len(STRF_PROGRAM_CACHE) >= STRF_PROGRAM_CACHE_SIZE:
+        STRF_PROGRAM_CACHE.clear()
+    program = _compile(format, yeardigits, duration, binary)
+    native = STRF_NATIVE_FORMATS.get(format)
+    if native is not None and yeardigits == 4 and not duration and not binary:
+        program = partial(native, program)
+    return STRF_PROGRAM_CACHE.setdefault(key, program)
 
 
 def _strfduration(tdt: Union[timedelta, Duration], format: str, yeardigits: int = 4) -> str:
@@ -95,44 +315,7 @@ def _strfduration(tdt: Union[timedelta, Duration], format: str, yeardigits: int
 
     See strftime for more details.
     """
-
-    def repl(match: re.Match[str]) -> str:
-        """Lookup format command and return corresponding replacement."""
-        if match.group(0) in STRF_D_MAP:
-            return STRF_D_MAP[match.group(0)](tdt, yeardigits)
-        elif match.group(0) == "%P":
-            ret: list[str] = []
-            if isinstance(tdt, Duration):
-                if tdt.years:
-                    ret.append("%sY" % abs(tdt.years))
-                if tdt.months:
-                    ret.append("%sM" % abs(tdt.months))
-            usecs = abs((tdt.days * 24 * 60 * 60 + tdt.seconds) * 1000000 + tdt.microseconds)
-            seconds, usecs = divmod(usecs, 1000000)
-            minutes, seconds = divmod(seconds, 60)
-            hours, minutes = divmod(minutes, 60)
-            days, hours = divmod(hours, 24)
-            if days:
-                ret.append("%sD" % days)
-            if hours or minutes or seconds or usecs:
-                ret.append("T")
-                if hours:
-                    ret.append("%sH" % hours)
-                if minutes:
-                    ret.append("%sM" % minutes)
-                if seconds or usecs:
-                    if usecs:
-                        ret.append(("%d.%06d" % (seconds, usecs)).rstrip("0"))
-                    else:
-                        ret.append("%d" % seconds)
-                    ret.append("S")
-            # at least one component has to be there.
-            return "".join(ret) if ret else "0D"
-        elif match.group(0) == "%p":
-            return str(abs(tdt.days // 7)) + "W"
-        return match.group(0)
-
-    return re.sub("%d|%f|%H|%m|%M|%S|%W|%Y|%C|%%|%P|%p", repl, format)
+    return _program(format, yeardigits, True)(tdt)
 
 
 def _strfdt(tdt: Union[time, date], format: str, yeardigits: int = 4) -> str:
@@ -140,14 +323,7 @@ def _strfdt(tdt: Union[time, date], format: str, yeardigits: int = 4) -> str:
 
     See strftime for more details.
     """
-
-    def repl(match: re.Match[str]) -> str:
-        """Lookup format command and return corresponding replacement."""
-        if match.group(0) in STRF_DT_MAP:
-            return STRF_DT_MAP[match.group(0)](tdt, yeardigits)
-        return match.group(0)
-
-    return re.sub("%d|%f|%H|%j|%m|%M|%S|%w|%W|%Y|%C|%z|%Z|%h|%%", repl, format)
+    return _program(format, yeardigits, False)(tdt)
 
 
 def strftime(tdt: Union[timedelta, Duration, time, date], format: str, yeardigits: int = 4) -> str:
@@ -178,3 +354,105 @@ def strftime(tdt: Union[timedelta, Duration, time, date], format: str, yeardigit
     if isinstance(tdt, (timedelta, Duration)):
         return _strfduration(tdt, format, yeardigits)
     return _strfdt(tdt, format, yeardigits)
+
+
+def format_many(
+    values: Iterable[Union[timedelta, Duration, time, date]], format: str, yeardigits: int = 4
+) -> list[str]:
+    """Format many values with the same format string.
+
+    This is equivalent to [strftime(value, format, yeardigits) for value in
+    values], but looks up the compiled format program only once.
+    """
+    dtprogram = _program(format, yeardigits, False)
+    dprogram = _program(format, yeardigits, True)
+    return [
+        dprogram(value) if isinstance(value, (timedelta, Duration)) else dtprogram(value)
+        for value in values
+    ]
+
+
+def _is_binary(stream: IO[Any]) -> bool:
+    """Guess whether stream accepts bytes or str."""
+    if isinstance(stream, io.TextIOBase):
+        return False
+    if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    return "b" in getattr(stream, "mode", "")
+
+
+def write_formatted(
+    values: Iterable[Union[timedelta, Duration, time, date]],
+    format: str,
+    stream: IO[Any],
+    sep: str = "\n",
+    yeardigits: int = 4,
+) -> int:
+    """Format many values and write them separated by sep to stream.
+
+    The values are rendered in chunks of STRF_CHUNK_SIZE values, which are
+    joined and written with a single write call each. Binary streams get the
+    ASCII encoded output.
+
+    Returns the number of values written.
+    """
+    dtprogram = _program(format, yeardigits, False)
+    dprogram = _program(format, yeardigits, True)
+    binary = _is_binary(stream)
+    chunk: list[str] = []
+    count = 0
+    for value in values:
+        if isinstance(value, (timedelta, Duration)):
+            chunk.append(dprogram(value))
+        else:
+            chunk.append(dtprogram(value))
+        if len(chunk) == STRF_CHUNK_SIZE:
+            count = _write_chunk(stream, chunk, sep, count, binary)
+            chunk.clear()
+    if chunk:
+        count = _write_chunk(stream, chunk, sep, count, binary)
+    return count
+
+
+def _write_chunk(stream: IO[Any], chunk: list[str], sep: str, count: int, binary: bool) -> int:
+    """Write a chunk of formatted values to stream.
+
+    Returns the number of values written so far.
+    """
+    text = sep.join(chunk)
+    if count:
+        text = sep + text
+    stream.write(text.encode("ascii") if binary else text)
+    return count + len(chunk)
+
+
+def strftime_into(
+    tdt: Union[timedelta, Duration, time, date],
+    format: str,
+    buffer: Union[bytearray, memoryview, IO[bytes]],
+    offset: int = 0,
+    yeardigits: int = 4,
+) -> int:
+    """Format tdt like strftime, but write the result as ASCII bytes.
+
+    The bytes are rendered directly from a bytes template, without creating
+    an intermediate str. buffer can be a bytearray or writable memoryview,
+    where the result is stored starting at offset, or a binary stream, where
+    the result is written to (offset is ignored in that case). A bytearray is
+    extended as necessary, a memoryview has to be large enough.
+
+    Returns the number of bytes written.
+    """
+    data = _program(format, yeardigits, isinstance(tdt, (timedelta, Duration)), True)(tdt)
+    end = offset + len(data)
+    if isinstance(buffer, bytearray):
+        if offset > len(buffer):
+            raise ValueError("offset %d beyond end of buffer" % offset)
+        buffer[offset:end] = data
+    elif isinstance(buffer, memoryview):
+        if end > len(buffer):
+            raise ValueError("buffer too small, %d bytes required" % end)
+        buffer[offset:end] = data
+    else:
+        buffer.write(data)
+    return len(data)
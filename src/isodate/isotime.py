@@ -6,14 +6,16 @@ as described in the ISO standard.
 """
 
 import re
-from datetime import date, time, timedelta
+from datetime import date, time, timedelta, tzinfo
 from decimal import ROUND_FLOOR, Decimal
-from typing import Union
+from typing import Any, Optional, Union
 
+from isodate import isostats
 from isodate.duration import Duration
 from isodate.isoerror import ISO8601Error
 from isodate.isostrf import TIME_EXT_COMPLETE, TZ_EXT, strftime
 from isodate.isotzinfo import TZ_REGEX, build_tzinfo
+from isodate.tzinfo import UTC, LocalTimezone
 
 TIME_REGEX_CACHE: list[re.Pattern[str]] = []
 # used to cache regular expressions to parse ISO time strings.
@@ -25,7 +27,10 @@ def build_time_regexps() -> list[re.Pattern[str]]:
     The regular expressions are compiled and stored in TIME_REGEX_CACHE
     for later reuse.
     """
+    global TIME_REGEX_CACHE
     if not TIME_REGEX_CACHE:
+        cache_entry: list[re.Pattern[str]] = []
+
         # ISO 8601 time representations allow decimal fractions on least
         #    significant time component. Command and Full Stop are both valid
         #    fraction separators.
@@ -43,7 +48,7 @@ def build_time_regexps() -> list[re.Pattern[str]]:
         #    +-hh =>
         #    isotzinfo.TZ_REGEX
         def add_re(regex_text: str) -> None:
-            TIME_REGEX_CACHE.append(re.compile(r"\A" + regex_text + TZ_REGEX + r"\Z"))
+            cache_entry.append(re.compile(r"\A" + regex_text + TZ_REGEX + r"\Z"))
 
         # 1. complete time:
         #    hh:mm:ss.ss ... extended format
@@ -64,10 +69,170 @@ def build_time_regexps() -> list[re.Pattern[str]]:
         add_re(r"T?(?P<hour>[0-9]{2})" r"(?P<minute>[0-9]{2}" r"([,.][0-9]+)?)")
         #    hh.hh ... basic format
         add_re(r"T?(?P<hour>[0-9]{2}" r"([,.][0-9]+)?)")
+        # replace the list instead of filling it, so that threads building it
+        # concurrently never see a partial list or add the patterns twice.
+        TIME_REGEX_CACHE = cache_entry
     return TIME_REGEX_CACHE
 
 
-def parse_time(timestring: str) -> time:
+def match_time(timestring: str) -> tuple[int, Optional[re.Match[str]]]:
+    """Match timestring against the regular expressions for ISO times.
+
+    Returns the index of the first matching expression in the list returned
+    by build_time_regexps and its match object, or (-1, None) if no
+    expression matches.
+    """
+    isotimes = build_time_regexps()
+    for index, pattern in enumerate(isotimes):
+        match = pattern.match(timestring)
+        if match:
+            if isostats.ENABLED:
+                isostats.record_pattern("time", index, len(isotimes))
+            return index, match
+    if isostats.ENABLED:
+        isostats.record_pattern("time", -1, len(isotimes))
+    return -1, None
+
+
+TimeFields = tuple[int, int, int, int, dict[str, Any]]
+# hour, minute, second, microsecond and the time zone groups of a parsed time.
+
+
+def _parse_time_fields(timestring: str) -> TimeFields:
+    """Parse an ISO 8601 time string into its fields.
+
+    Returns hour, minute, second, microsecond and the match groups holding
+    the time zone designator. The fields are not range checked.
+
+    @raise ISO8601Error: if the string is not an ISO 8601 time.
+    """
+    _, match = match_time(timestring)
+    if match is None:
+        raise ISO8601Error("Unrecognised ISO 8601 time format: %r" % timestring)
+    return _time_fields_from_match(match)
+
+
+def _time_fields_from_match(match: re.Match[str]) -> TimeFields:
+    """Return the fields of a match of one of the regular expressions of
+    build_time_regexps, see _parse_time_fields.
+    """
+    groups = match.groupdict()
+    for key, value in groups.items():
+        if value is not None:
+            groups[key] = value.replace(",", ".")
+    if "second" in groups:
+        second = Decimal(groups["second"]).quantize(Decimal(".000001"), rounding=ROUND_FLOOR)
+        microsecond = (second - int(second)) * int(1e6)
+        # int(...) ... no rounding
+        # to_integral() ... rounding
+        return (
+            int(groups["hour"]),
+            int(groups["minute"]),
+            int(second),
+            int(microsecond.to_integral()),
+            groups,
+        )
+    if "minute" in groups:
+        minute = Decimal(groups["minute"])
+        second = Decimal((minute - int(minute)) * 60).quantize(
+            Decimal(".000001"), rounding=ROUND_FLOOR
+        )
+        microsecond = (second - int(second)) * int(1e6)
+        return (
+            int(groups["hour"]),
+            int(minute),
+            int(second),
+            int(microsecond.to_integral()),
+            groups,
+        )
+    else:
+        microsecond, second, minute = Decimal(0), Decimal(0), Decimal(0)
+    hour = Decimal(groups["hour"])
+    minute = (hour - int(hour)) * 60
+    second = Decimal((minute - int(minute)) * 60)
+    microsecond = (second - int(second)) * int(1e6)
+    return (
+        int(hour),
+        int(minute),
+        int(second),
+        int(microsecond.to_integral()),
+        groups,
+    )
+
+
+def _build_tzinfo(groups: dict[str, Any]) -> Optional[tzinfo]:
+    """Build the tzinfo object for the time zone groups of a parsed time."""
+    return build_tzinfo(
+        groups["tzname"],
+        groups["tzsign"],
+        int(groups["tzhour"] or 0),
+        int(groups["tzmin"] or 0),
+    )
+
+
+def _utc_offset_minutes(groups: dict[str, Any]) -> Optional[int]:
+    """Return the parsed UTC offset in minutes, or None if the time is naive.
+
+    @raise ValueError: if the offset is not strictly between -24 and 24 hours,
+        like datetime.astimezone would.
+    """
+    tzname = groups["tzname"]
+    if not tzname:
+        return None
+    if tzname == "Z":
+        return 0
+    minutes = int(groups["tzhour"] or 0) * 60 + int(groups["tzmin"] or 0)
+    if minutes >= 24 * 60:
+        raise ValueError("offset must be strictly between -24 and 24 hours, not %r" % tzname)
+    return -minutes if groups["tzsign"] == "-" else minutes
+
+
+def _check_time_fields(hour: int, minute: int, second: int) -> None:
+    """Raise the ValueError datetime.time would raise for out of range fields.
+
+    Needed before applying an offset arithmetically, which could otherwise
+    move an invalid time into the valid range.
+    """
+    if hour > 23:
+        raise ValueError("hour must be in 0..23")
+    if minute > 59:
+        raise ValueError("minute must be in 0..59")
+    if second > 59:
+        raise ValueError("second must be in 0..59")
+
+
+def _parse_time(timestring: str, to_utc: bool = False, default_tz: Optional[tzinfo] = None) -> time:
+    """Implementation of parse_time, see there."""
+    return _time_from_fields(_parse_time_fields(timestring), to_utc, default_tz)
+
+
+def _time_from_fields(
+    fields: TimeFields, to_utc: bool = False, default_tz: Optional[tzinfo] = None
+) -> time:
+    """Build the time for the fields of a parsed time, see parse_time for the
+    options.
+    """
+    hour, minute, second, microsecond, groups = fields
+    if not to_utc:
+        tzinfo = _build_tzinfo(groups)
+        if tzinfo is None:
+            tzinfo = default_tz
+        return time(hour, minute, second, microsecond, tzinfo)
+    _check_time_fields(hour, minute, second)
+    offset = _utc_offset_minutes(groups)
+    if offset is None:
+        if default_tz is None:
+            return time(hour, minute, second, microsecond)
+        if isinstance(default_tz, LocalTimezone):
+            raise ValueError("default_tz depends on the date, use parse_datetime")
+        utcoffset = default_tz.utcoffset(None)
+        offset = 0 if utcoffset is None else utcoffset // timedelta(minutes=1)
+    if offset:
+        hour, minute = divmod((hour * 60 + minute - offset) % (24 * 60), 60)
+    return time(hour, minute, second, microsecond, UTC)
+
+
+def parse_time(timestring: str, to_utc: bool = False, default_tz: Optional[tzinfo] = None) -> time:
     """Parses ISO 8601 times into datetime.time objects.
 
     Following ISO 8601 formats are supported:
@@ -83,62 +248,19 @@ def parse_time(timestring: str) -> time:
       +-hhmm  basic hours and minutes
       +-hh:mm extended hours and minutes
       +-hh    hours
+
+    default_tz is used as time zone for times without designator. The default
+    None leaves them naive, UTC or LOCAL assume UTC or local time.
+
+    If to_utc is True, the time is converted to UTC and carries the UTC
+    instance as tzinfo. The conversion wraps around midnight. Naive times stay
+    naive, if there is no default_tz, otherwise the offset of default_tz is
+    taken from utcoffset(None). A ValueError is raised for LOCAL, as its
+    offset depends on the date.
     """
-    isotimes = build_time_regexps()
-    for pattern in isotimes:
-        match = pattern.match(timestring)
-        if match:
-            groups = match.groupdict()
-            for key, value in groups.items():
-                if value is not None:
-                    groups[key] = value.replace(",", ".")
-            tzinfo = build_tzinfo(
-                groups["tzname"],
-                groups["tzsign"],
-                int(groups["tzhour"] or 0),
-                int(groups["tzmin"] or 0),
-            )
-            if "second" in groups:
-                second = Decimal(groups["second"]).quantize(
-                    Decimal(".000001"), rounding=ROUND_FLOOR
-                )
-                microsecond = (second - int(second)) * int(1e6)
-                # int(...) ... no rounding
-                # to_integral() ... rounding
-                return time(
-                    int(groups["hour"]),
-                    int(groups["minute"]),
-                    int(second),
-                    int(microsecond.to_integral()),
-                    tzinfo,
-                )
-            if "minute" in groups:
-                minute = Decimal(groups["minute"])
-                second = Decimal((minute - int(minute)) * 60).quantize(
-                    Decimal(".000001"), rounding=ROUND_FLOOR
-                )
-                microsecond = (second - int(second)) * int(1e6)
-                return time(
-                    int(groups["hour"]),
-                    int(minute),
-                    int(second),
-                    int(microsecond.to_integral()),
-                    tzinfo,
-                )
-            else:
-                microsecond, second, minute = Decimal(0), Decimal(0), Decimal(0)
-            hour = Decimal(groups["hour"])
-            minute = (hour - int(hour)) * 60
-            second = Decimal((minute - int(minute)) * 60)
-            microsecond = (second - int(second)) * int(1e6)
-            return time(
-                int(hour),
-                int(minute),
-                int(second),
-                int(microsecond.to_integral()),
-                tzinfo,
-            )
-    raise ISO8601Error("Unrecognised ISO 8601 time format: %r" % timestring)
+    if isostats.ENABLED:
+        return isostats.timed("parse_time", _parse_time, timestring, to_utc, default_tz)
+    return _parse_time(timestring, to_utc, default_tz)
 
 
 def time_isoformat(
@@ -4,16 +4,35 @@ It offers a function to parse the time zone offset as specified by ISO 8601.
 """
 
 import re
-from datetime import datetime, tzinfo
-from typing import Union
+from datetime import datetime, timedelta, tzinfo
+from typing import Optional, Union
 
+from isodate import isostats
 from isodate.isoerror import ISO8601Error
-from isodate.tzinfo import UTC, ZERO, FixedOffset, Utc
+from isodate.tzinfo import (
+    UTC,
+    UTC_ISOFORMATS,
+    ZERO,
+    FixedOffset,
+    Utc,
+    fixed_offset,
+    offset_isoformats,
+)
 
 TZ_REGEX = r"(?P<tzname>(Z|(?P<tzsign>[+-])" r"(?P<tzhour>[0-9]{2})(:?(?P<tzmin>[0-9]{2}))?)?)"
 
 TZ_RE = re.compile(TZ_REGEX)
 
+TZ_ISOFORMAT_CACHE: dict[tuple[timedelta, Optional[timedelta]], dict[str, str]] = {}
+# A dictionary to cache rendered UTC offsets of arbitrary tzinfo instances.
+# The key is the tuple (utcoffset, dst), where dst is only looked up for a
+# zero utcoffset. The cache is cleared, when it reaches TZ_ISOFORMAT_CACHE_SIZE.
+
+TZ_ISOFORMAT_CACHE_SIZE = 1024
+
+PRECOMPUTED_TZINFOS = (FixedOffset, Utc)
+# tzinfo classes, which render their fixed offset once at construction time.
+
 
 def build_tzinfo(
     tzname: Union[str, None], tzsign: str = "+", tzhour: float = 0, tzmin: float = 0
@@ -24,26 +43,18 @@ def build_tzinfo(
     tzname:
       'Z'       ... return UTC
       '' | None ... return None
-      other     ... return FixedOffset
+      other     ... return the shared FixedOffset instance
     """
     if tzname is None or tzname == "":
         return None
     if tzname == "Z":
         return UTC
     tzsignum = ((tzsign == "-") and -1) or 1
-    return FixedOffset(tzsignum * tzhour, tzsignum * tzmin, tzname)
+    return fixed_offset(tzsignum * tzhour, tzsignum * tzmin, tzname)
 
 
-def parse_tzinfo(tzstring: str) -> Union[tzinfo, None]:
-    """Parses ISO 8601 time zone designators to tzinfo objects.
-
-    A time zone designator can be in the following format:
-              no designator indicates local time zone
-      Z       UTC
-      +-hhmm  basic hours and minutes
-      +-hh:mm extended hours and minutes
-      +-hh    hours
-    """
+def _parse_tzinfo(tzstring: str) -> Union[tzinfo, None]:
+    """Implementation of parse_tzinfo, see there."""
     match = TZ_RE.match(tzstring)
     if match:
         groups = match.groupdict()
@@ -56,6 +67,21 @@ def parse_tzinfo(tzstring: str) -> Union[tzinfo, None]:
     raise ISO8601Error("%s not a valid time zone info" % tzstring)
 
 
+def parse_tzinfo(tzstring: str) -> Union[tzinfo, None]:
+    """Parses ISO 8601 time zone designators to tzinfo objects.
+
+    A time zone designator can be in the following format:
+              no designator indicates local time zone
+      Z       UTC
+      +-hhmm  basic hours and minutes
+      +-hh:mm extended hours and minutes
+      +-hh    hours
+    """
+    if isostats.ENABLED:
+        return isostats.timed("parse_tzinfo", _parse_tzinfo, tzstring)
+    return _parse_tzinfo(tzstring)
+
+
 def tz_isoformat(dt: datetime, format: str = "%Z") -> str:
     """Return time zone offset ISO 8601 formatted.
 
@@ -70,24 +96,28 @@ def tz_isoformat(dt: datetime, format: str = "%Z") -> str:
         %Z ... +-HH:MM
     """
     tzinfo = dt.tzinfo
-    if (tzinfo is None) or (tzinfo.utcoffset(dt) is None):
+    if tzinfo is None:
         return ""
-    if tzinfo.utcoffset(dt) == ZERO and tzinfo.dst(dt) == ZERO:
+    isoformats = None
+    if type(tzinfo) in PRECOMPUTED_TZINFOS:
+        isoformats = tzinfo._isoformats  # type: ignore [attr-defined]
+    if isoformats is None:
+        tdelta = tzinfo.utcoffset(dt)
+        if tdelta is None:
+            return ""
+        key = (tdelta, tzinfo.dst(dt) if tdelta == ZERO else None)
+        isoformats = TZ_ISOFORMAT_CACHE.get(key)
+        if isoformats is None:
+            if key[1] == ZERO:
+                isoformats = UTC_ISOFORMATS
+            else:
+                isoformats = offset_isoformats(tdelta)
+            if len(TZ_ISOFORMAT_CACHE) >= TZ_ISOFORMAT_CACHE_SIZE:
+                TZ_ISOFORMAT_CACHE.clear()
+            TZ_ISOFORMAT_CACHE[key] = isoformats
+    if isoformats is UTC_ISOFORMATS:
         return "Z"
-    tdelta = tzinfo.utcoffset(dt)
-    if tdelta is None:
-        return ""
-    seconds = tdelta.days * 24 * 60 * 60 + tdelta.seconds
-    sign = ((seconds < 0) and "-") or "+"
-    seconds = abs(seconds)
-    minutes, seconds = divmod(seconds, 60)
-    hours, minutes = divmod(minutes, 60)
-    if hours > 99:
-        raise OverflowError("can not handle differences > 99 hours")
-    if format == "%Z":
-        return "%s%02d:%02d" % (sign, hours, minutes)
-    elif format == "%z":
-        return "%s%02d%02d" % (sign, hours, minutes)
-    elif format == "%h":
-        return "%s%02d" % (sign, hours)
-    raise ValueError('unknown format string "%s"' % format)
+    try:
+        return isoformats[format]
+    except KeyError:
+        raise ValueError('unknown format string "%s"' % format)
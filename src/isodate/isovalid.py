@@ -0,0 +1,354 @@
+"""This module provides functions to check and parse ISO 8601 strings without
+raising exceptions.
+
+Each is_valid_* function returns True if and only if the corresponding parse
+function with the same options would succeed. The try_parse_* functions
+return the result of the parse function, or a default value instead of
+raising an exception. The range checks of the parse functions are done with
+plain integer arithmetic, so no date, time, timedelta, Decimal or exception
+instances are created for invalid strings. Only extremely long fractions,
+durations close to the limits of timedelta and date-times converted to UTC
+at the limits of datetime, where the result depends on the rounding of
+Decimal or float arithmetic, are checked by calling the parse function.
+"""
+
+import re
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta, tzinfo
+from typing import Any, Callable, Optional, TypeVar, Union
+
+from isodate._calendar import MAX_ORDINAL, first_ordinal, valid_day, week_ordinal
+from isodate.duration import Duration
+from isodate.isodates import _date_from_match, match_date
+from isodate.isodatetime import _datetime_to_utc
+from isodate.isoduration import (
+    DURATION_FIELDS,
+    ISO8601_PERIOD_REGEX,
+    _duration_from_datetime,
+    _duration_from_match,
+    _parse_duration,
+)
+from isodate.isotime import (
+    TimeFields,
+    _parse_time,
+    _time_fields_from_match,
+    _time_from_fields,
+    match_time,
+)
+
+T = TypeVar("T")
+
+ERROR_TYPE = "type"
+# error code of try_parse_* for values, which are not strings.
+
+ERROR_FORMAT = "format"
+# error code of try_parse_* for strings, which are not in a supported ISO 8601
+# format (the parse functions raise ISO8601Error).
+
+ERROR_RANGE = "range"
+# error code of try_parse_* for strings with fields out of range, or which can
+# not be represented by the result type (the parse functions raise ValueError
+# or OverflowError).
+
+EXACT_FRACTION_DIGITS = 20
+# fractions of hours and minutes with up to this many digits are checked with
+# integers. Longer ones are checked with parse_time, as they are rounded by
+# the Decimal context precision.
+
+MAX_TIMEDELTA_SECONDS = 999999999 * 24 * 60 * 60
+# number of seconds in the largest number of days a timedelta supports.
+
+DURATION_CHECK_MARGIN = 2 * 24 * 60 * 60
+# durations within this number of seconds of MAX_TIMEDELTA_SECONDS are checked
+# with parse_duration, as the float arithmetic of timedelta decides there.
+
+
+def _parses(parser: Callable[..., Any], *args: Any) -> bool:
+    """Return whether parser accepts args."""
+    try:
+        parser(*args)
+    except (ValueError, OverflowError):
+        return False
+    return True
+
+
+def _failed(default: T, errors: Optional[list[str]], code: str) -> T:
+    """Record the error code in errors and return default."""
+    if errors is not None:
+        errors.append(code)
+    return default
+
+
+def _valid_date_match(match: re.Match[str], defaultmonth: int, defaultday: int) -> bool:
+    """Return whether a match of build_date_regexps is a representable date."""
+    groups = match.groupdict()
+    sign = -1 if groups["sign"] == "-" else 1
+    if "century" in groups:
+        return valid_day(sign * (int(groups["century"]) * 100 + 1), defaultmonth, defaultday)
+    year = sign * int(groups["year"])
+    if "month" not in groups:
+        if not 1 <= year <= 9999:
+            return False
+        if "week" in groups:
+            ordinal = week_ordinal(year, int(groups["week"]), int(groups.get("day") or 1))
+        elif "day" in groups:
+            ordinal = first_ordinal(year) + int(groups["day"]) - 1
+        else:
+            return valid_day(year, defaultmonth, defaultday)
+        return 1 <= ordinal <= MAX_ORDINAL
+    day = defaultday if groups.get("day") is None else int(groups["day"])
+    return valid_day(year, int(groups["month"]) or defaultmonth, day)
+
+
+def _valid_time_match(match: re.Match[str], timestring: str) -> bool:
+    """Return whether a match of build_time_regexps is a representable time."""
+    groups = match.groupdict()
+    if int(groups["hour"][:2]) > 23:
+        return False
+    if "second" in groups:
+        # seconds are cut off after 6 fraction digits
+        return int(groups["minute"]) <= 59 and int(groups["second"][:2]) <= 59
+    if "minute" in groups:
+        if int(groups["minute"][:2]) > 59:
+            return False
+        fraction = groups["minute"][3:]
+    else:
+        fraction = groups["hour"][3:]
+    if len(fraction) > EXACT_FRACTION_DIGITS:
+        return _parses(_parse_time, timestring)
+    if "minute" in groups or not fraction:
+        # the seconds derived from a fraction of a minute are cut off after
+        # microseconds, and so are always less than 60.
+        return True
+    # the microseconds derived from a fraction of an hour are rounded half
+    # even and could round up to a full second.
+    denominator = 10 ** len(fraction)
+    microsecond, remainder = divmod(int(fraction) * 3600 % denominator * 10**6, denominator)
+    if remainder * 2 > denominator or (remainder * 2 == denominator and microsecond % 2):
+        microsecond += 1
+    return microsecond < 10**6
+
+
+def _valid_time_fields(fields: TimeFields) -> bool:
+    """Return whether datetime.time accepts the fields of a parsed time."""
+    hour, minute, second, microsecond, _ = fields
+    return hour <= 23 and minute <= 59 and second <= 59 and microsecond < 10**6
+
+
+def _valid_utc_offset(match: re.Match[str]) -> bool:
+    """Return whether the time zone of a match of build_time_regexps can be
+    applied to convert to UTC.
+    """
+    tzhour = match.group("tzhour")
+    return tzhour is None or int(tzhour) * 60 + int(match.group("tzmin") or 0) < 24 * 60
+
+
+def _valid_duration_match(match: re.Match[str], datestring: str) -> bool:
+    """Return whether a match of ISO8601_PERIOD_REGEX is a representable
+    duration.
+    """
+    groups = match.groupdict()
+    seconds = 0.0
+    for key, factor in DURATION_FIELDS:
+        value = groups[key]
+        if value is not None:
+            seconds += float(value[:-1].replace(",", ".")) * factor
+    if seconds < MAX_TIMEDELTA_SECONDS - DURATION_CHECK_MARGIN:
+        return True
+    if seconds > MAX_TIMEDELTA_SECONDS + DURATION_CHECK_MARGIN:
+        return False
+    return _parses(_parse_duration, datestring)
+
+
+def is_valid_date(
+    datestring: str,
+    yeardigits: int = 4,
+    expanded: bool = False,
+    defaultmonth: int = 1,
+    defaultday: int = 1,
+) -> bool:
+    """Return whether parse_date with the same parameters accepts datestring.
+
+    Like parse_date, week and ordinal dates are accepted as long as the date
+    they roll over to is representable, e.g. 2012-W53-1 is 2013-01-07.
+    """
+    if not isinstance(datestring, str):
+        return False
+    _, match = match_date(datestring, yeardigits, expanded)
+    return match is not None and _valid_date_match(match, defaultmonth, defaultday)
+
+
+def is_valid_time(timestring: str) -> bool:
+    """Return whether parse_time accepts timestring."""
+    if not isinstance(timestring, str):
+        return False
+    _, match = match_time(timestring)
+    return match is not None and _valid_time_match(match, timestring)
+
+
+def is_valid_datetime(datetimestring: str) -> bool:
+    """Return whether parse_datetime accepts datetimestring."""
+    if not isinstance(datetimestring, str) or datetimestring.count("T") != 1:
+        return False
+    datestring, timestring = datetimestring.split("T")
+    return is_valid_date(datestring) and is_valid_time(timestring)
+
+
+def is_valid_duration(datestring: str) -> bool:
+    """Return whether parse_duration accepts datestring."""
+    if not isinstance(datestring, str):
+        return False
+    match = ISO8601_PERIOD_REGEX.match(datestring)
+    if not match:
+        return datestring.startswith("P") and is_valid_datetime(datestring[1:])
+    return _valid_duration_match(match, datestring)
+
+
+def valid_mask(
+    values: Iterable[str],
+    validator: Callable[..., bool] = is_valid_datetime,
+    **kwargs: Any,
+) -> list[bool]:
+    """Check many ISO 8601 strings at once.
+
+    Returns a list of booleans, which is True for each value accepted by the
+    validator. Additional keyword arguments are passed to the validator, e.g.
+    yeardigits for is_valid_date.
+
+    @param values: the ISO strings to check
+    @param validator: one of the is_valid_* functions
+    """
+    if kwargs:
+        return [validator(value, **kwargs) for value in values]
+    return list(map(validator, values))
+
+
+def try_parse_date(
+    datestring: str,
+    default: T = None,  # type: ignore [assignment]
+    yeardigits: int = 4,
+    expanded: bool = False,
+    defaultmonth: int = 1,
+    defaultday: int = 1,
+    errors: Optional[list[str]] = None,
+) -> Union[date, T]:
+    """Parse an ISO 8601 date like parse_date, but return default instead of
+    raising an exception.
+
+    @param default: the value returned, if datestring can not be parsed
+    @param errors: if given, the error code (ERROR_TYPE, ERROR_FORMAT or
+                   ERROR_RANGE) is appended to this list, if datestring can
+                   not be parsed
+    """
+    if not isinstance(datestring, str):
+        return _failed(default, errors, ERROR_TYPE)
+    _, match = match_date(datestring, yeardigits, expanded)
+    if match is None:
+        return _failed(default, errors, ERROR_FORMAT)
+    if not _valid_date_match(match, defaultmonth, defaultday):
+        return _failed(default, errors, ERROR_RANGE)
+    return _date_from_match(match, defaultmonth, defaultday)
+
+
+def try_parse_time(
+    timestring: str,
+    default: T = None,  # type: ignore [assignment]
+    to_utc: bool = False,
+    default_tz: Optional[tzinfo] = None,
+    errors: Optional[list[str]] = None,
+) -> Union[time, T]:
+    """Parse an ISO 8601 time like parse_time, but return default instead of
+    raising an exception.
+
+    @param default: the value returned, if timestring can not be parsed
+    @param errors: if given, the error code (ERROR_TYPE, ERROR_FORMAT or
+                   ERROR_RANGE) is appended to this list, if timestring can
+                   not be parsed
+    """
+    if not isinstance(timestring, str):
+        return _failed(default, errors, ERROR_TYPE)
+    _, match = match_time(timestring)
+    if match is None:
+        return _failed(default, errors, ERROR_FORMAT)
+    # the fields are needed anyway, so check them instead of the match
+    fields = _time_fields_from_match(match)
+    if not _valid_time_fields(fields) or (to_utc and not _valid_utc_offset(match)):
+        return _failed(default, errors, ERROR_RANGE)
+    try:
+        return _time_from_fields(fields, to_utc, default_tz)
+    except ValueError:
+        # the offset of default_tz depends on the date, like for LOCAL
+        return _failed(default, errors, ERROR_RANGE)
+
+
+def try_parse_datetime(
+    datetimestring: str,
+    default: T = None,  # type: ignore [assignment]
+    to_utc: bool = False,
+    default_tz: Optional[tzinfo] = None,
+    errors: Optional[list[str]] = None,
+) -> Union[datetime, T]:
+    """Parse an ISO 8601 date-time like parse_datetime, but return default
+    instead of raising an exception.
+
+    @param default: the value returned, if datetimestring can not be parsed
+    @param errors: if given, the error code (ERROR_TYPE, ERROR_FORMAT or
+                   ERROR_RANGE) is appended to this list, if datetimestring
+                   can not be parsed
+    """
+    if not isinstance(datetimestring, str):
+        return _failed(default, errors, ERROR_TYPE)
+    if datetimestring.count("T") != 1:
+        return _failed(default, errors, ERROR_FORMAT)
+    datestring, timestring = datetimestring.split("T")
+    # check in the order of parse_datetime, which parses the date first
+    _, datematch = match_date(datestring)
+    if datematch is None:
+        return _failed(default, errors, ERROR_FORMAT)
+    if not _valid_date_match(datematch, 1, 1):
+        return _failed(default, errors, ERROR_RANGE)
+    _, timematch = match_time(timestring)
+    if timematch is None:
+        return _failed(default, errors, ERROR_FORMAT)
+    fields = _time_fields_from_match(timematch)
+    if not _valid_time_fields(fields):
+        return _failed(default, errors, ERROR_RANGE)
+    tmpdate = _date_from_match(datematch)
+    if not to_utc:
+        return datetime.combine(tmpdate, _time_from_fields(fields, False, default_tz))
+    if not _valid_utc_offset(timematch):
+        return _failed(default, errors, ERROR_RANGE)
+    if tmpdate == date.min or tmpdate == date.max:
+        # the conversion to UTC may leave the range of datetime
+        if not _parses(_datetime_to_utc, tmpdate, fields, default_tz):
+            return _failed(default, errors, ERROR_RANGE)
+    return _datetime_to_utc(tmpdate, fields, default_tz)
+
+
+def try_parse_duration(
+    datestring: str,
+    default: T = None,  # type: ignore [assignment]
+    as_timedelta_if_possible: bool = True,
+    errors: Optional[list[str]] = None,
+) -> Union[timedelta, Duration, T]:
+    """Parse an ISO 8601 duration like parse_duration, but return default
+    instead of raising an exception.
+
+    @param default: the value returned, if datestring can not be parsed
+    @param errors: if given, the error code (ERROR_TYPE, ERROR_FORMAT or
+                   ERROR_RANGE) is appended to this list, if datestring can
+                   not be parsed
+    """
+    if not isinstance(datestring, str):
+        return _failed(default, errors, ERROR_TYPE)
+    match = ISO8601_PERIOD_REGEX.match(datestring)
+    if match is None:
+        if not datestring.startswith("P"):
+            return _failed(default, errors, ERROR_FORMAT)
+        durdt = try_parse_datetime(datestring[1:], errors=errors)
+        if durdt is None:
+            return default
+        return _duration_from_datetime(durdt, as_timedelta_if_possible)
+    if not _valid_duration_match(match, datestring):
+        return _failed(default, errors, ERROR_RANGE)
+    return _duration_from_match(match, as_timedelta_if_possible)
@@ -0,0 +1,60 @@
+"""This module provides a function to do the lazy initialisation of isodate
+in advance.
+
+isodate imports its modules, compiles its regular expressions and strftime
+format programs and looks up the local DST transitions only when they are
+needed the first time. Pre-fork servers can call warmup in the parent process,
+so that all workers share the prepared data copy-on-write instead of building
+it again in every worker.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime
+
+from isodate import (  # noqa: F401
+    isoadaptive,
+    isodatetime,
+    isodetect,
+    isoduration,
+    isofields,
+    isointerval,
+    isojson,
+    isonumpy,
+    isoscan,
+    isostrf,
+    isovalid,
+)
+from isodate.isodates import build_date_regexps
+from isodate.isotime import build_time_regexps
+from isodate.tzinfo import LOCAL
+
+FORMAT_PREFIXES = ("DATE_", "TIME_", "DT_")
+# prefixes of the format constants in isostrf used for dates and times.
+
+
+def warmup(yeardigits: Iterable[int] = (4,)) -> None:
+    """Import all modules and prepare the regular expressions, the strftime
+    programs of the predefined formats and the DST transitions of the current
+    year.
+
+    @param yeardigits: the numbers of year digits parse_date and strftime are
+                       used with (4 and expanded 4 digit years are always
+                       prepared)
+    """
+    build_time_regexps()
+    build_date_regexps(4, False)
+    formats = [
+        value
+        for name, value in vars(isostrf).items()
+        if name.startswith(FORMAT_PREFIXES) and isinstance(value, str)
+    ]
+    # the default format of time_isoformat
+    formats.append(isostrf.TIME_EXT_COMPLETE + isostrf.TZ_EXT)
+    durations = [value for name, value in vars(isostrf).items() if name.startswith("D_")]
+    for digits in {4, *yeardigits}:
+        build_date_regexps(digits, True)
+        for format in formats:
+            isostrf._program(format, digits, False)
+        for format in durations:
+            isostrf._program(format, digits, True)
+    LOCAL.utcoffset(datetime.now())
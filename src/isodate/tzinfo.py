@@ -4,12 +4,38 @@ All those classes are taken from the Python documentation.
 """
 
 import time
-from datetime import datetime, timedelta, tzinfo
-from typing import Literal, Optional
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, tzinfo
+from typing import Any, Literal, Optional
 
 ZERO = timedelta(0)
 # constant for zero time offset.
 
+SECOND = timedelta(seconds=1)
+
+UTC_ISOFORMATS = {"%h": "Z", "%z": "Z", "%Z": "Z"}
+# ISO 8601 renderings of the UTC time zone designator.
+
+
+def offset_isoformats(tdelta: timedelta) -> dict[str, str]:
+    """Render a UTC offset in all ISO 8601 formats supported by tz_isoformat.
+
+    Returns a dictionary mapping the formats %h, %z and %Z to the rendered offset.
+    Seconds of the offset are ignored.
+    """
+    seconds = tdelta.days * 24 * 60 * 60 + tdelta.seconds
+    sign = ((seconds < 0) and "-") or "+"
+    seconds = abs(seconds)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours > 99:
+        raise OverflowError("can not handle differences > 99 hours")
+    return {
+        "%h": "%s%02d" % (sign, hours),
+        "%z": "%s%02d%02d" % (sign, hours, minutes),
+        "%Z": "%s%02d:%02d" % (sign, hours, minutes),
+    }
+
 
 class Utc(tzinfo):
     """UTC
@@ -17,6 +43,8 @@ class Utc(tzinfo):
     Universal time coordinated time zone.
     """
 
+    _isoformats = UTC_ISOFORMATS
+
     def utcoffset(self, dt: Optional[datetime]) -> timedelta:
         """Return offset from UTC in minutes east of UTC, which is ZERO for UTC."""
         return ZERO
@@ -52,8 +80,13 @@ class FixedOffset(tzinfo):
 
     Note that FixedOffset(0, 0, "UTC") or FixedOffset() is a different way to
     build a UTC tzinfo object.
+
+    FixedOffset instances are compared and hashed by offset and name. Use
+    fixed_offset to get a shared instance instead of creating a new one.
     """
 
+    __slots__ = ("__offset", "__name", "_isoformats")
+
     def __init__(
         self, offset_hours: float = 0, offset_minutes: float = 0, name: str = "UTC"
     ) -> None:
@@ -62,8 +95,18 @@ class FixedOffset(tzinfo):
         The time offset should be positive for time zones east of UTC
         and negate for time zones west of UTC.
         """
-        self.__offset = timedelta(hours=offset_hours, minutes=offset_minutes)
+        self._setup(timedelta(hours=offset_hours, minutes=offset_minutes), name)
+
+    def _setup(self, offset: timedelta, name: str) -> None:
+        """Set offset and name and render the offset for tz_isoformat."""
+        self.__offset = offset
         self.__name = name
+        # the offset never changes, so render it for tz_isoformat only once.
+        self._isoformats: Optional[dict[str, str]] = None
+        if offset == ZERO:
+            self._isoformats = UTC_ISOFORMATS
+        elif abs(offset) < timedelta(hours=100):
+            self._isoformats = offset_isoformats(offset)
 
     def utcoffset(self, dt: Optional[datetime]) -> timedelta:
         """Return offset from UTC in minutes of UTC."""
@@ -81,35 +124,139 @@ class FixedOffset(tzinfo):
         """
         return ZERO
 
+    def __eq__(self, other: object) -> bool:
+        """FixedOffsets with the same offset and name are equal."""
+        if isinstance(other, FixedOffset):
+            return self.__offset == other.__offset and self.__name == other.__name
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Return a hash of offset and name."""
+        return hash((self.__offset, self.__name))
+
+    def __reduce__(self):
+        """When unpickling a FixedOffset object, return the shared instance."""
+        return _FixedOffset, (self.__offset, self.__name)
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore FixedOffset objects pickled by older versions."""
+        self._setup(state["_FixedOffset__offset"], state["_FixedOffset__name"])
+
     def __repr__(self) -> str:
         """Return nicely formatted repr string."""
         return "<FixedOffset %r>" % self.__name
 
 
-STDOFFSET = timedelta(seconds=-time.timezone)
+FIXED_OFFSET_CACHE: dict[tuple[timedelta, str], FixedOffset] = {}
+# A dictionary holding the shared FixedOffset instances returned by
+# fixed_offset. The key is the tuple (offset, name). The cache is cleared,
+# when it reaches FIXED_OFFSET_CACHE_SIZE entries.
+
+FIXED_OFFSET_CACHE_SIZE = 4096
+
+
+def _FixedOffset(offset: timedelta, name: str) -> FixedOffset:
+    """Return the shared FixedOffset instance for offset and name.
+
+    This is also the helper function for unpickling a FixedOffset object.
+    """
+    try:
+        return FIXED_OFFSET_CACHE[(offset, name)]
+    except KeyError:
+        pass
+    tz = FixedOffset.__new__(FixedOffset)
+    tz._setup(offset, name)
+    if len(FIXED_OFFSET_CACHE) >= FIXED_OFFSET_CACHE_SIZE:
+        FIXED_OFFSET_CACHE.clear()
+    return FIXED_OFFSET_CACHE.setdefault((offset, name), tz)
+
+
+def fixed_offset(
+    offset_hours: float = 0, offset_minutes: float = 0, name: str = "UTC"
+) -> FixedOffset:
+    """Return a shared FixedOffset instance.
+
+    Takes the same parameters as FixedOffset, but returns the same instance
+    for the same offset and name.
+    """
+    return _FixedOffset(timedelta(hours=offset_hours, minutes=offset_minutes), name)
+
+
+# The local time zone offsets and LOCAL are set up on first access by the
+# module __getattr__, so importing this module does not query the platform's
+# time zone.
+
+STDOFFSET: timedelta
 # locale time zone offset
 
-# calculate local daylight saving offset if any.
-DSTOFFSET = timedelta(seconds=-time.altzone) if time.daylight else STDOFFSET
+DSTOFFSET: timedelta
+# local daylight saving offset if any, otherwise STDOFFSET.
 
-DSTDIFF = DSTOFFSET - STDOFFSET
+DSTDIFF: timedelta
 # difference between local time zone and local DST time zone
 
+LOCAL: "LocalTimezone"
+# the default instance for local time zone.
+
+
+def _local_offsets() -> tuple[timedelta, timedelta, timedelta]:
+    """Return STDOFFSET, DSTOFFSET and DSTDIFF, computing them on first use."""
+    namespace = globals()
+    if "STDOFFSET" not in namespace:
+        stdoffset = timedelta(seconds=-time.timezone)
+        dstoffset = timedelta(seconds=-time.altzone) if time.daylight else stdoffset
+        namespace.update(STDOFFSET=stdoffset, DSTOFFSET=dstoffset, DSTDIFF=dstoffset - stdoffset)
+    return namespace["STDOFFSET"], namespace["DSTOFFSET"], namespace["DSTDIFF"]
+
+
+def __getattr__(name: str) -> Any:
+    """Set up the local time zone offsets and LOCAL on first access (PEP 562)."""
+    if name in ("STDOFFSET", "DSTOFFSET", "DSTDIFF"):
+        _local_offsets()
+    elif name == "LOCAL":
+        globals().setdefault("LOCAL", LocalTimezone())
+    else:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    return globals()[name]
+
+
+EPOCH_ORDINAL = 719163
+# proleptic Gregorian ordinal of 1970-01-01, the start of the Unix epoch.
+
 
 class LocalTimezone(tzinfo):
-    """A class capturing the platform's idea of local time."""
+    """A class capturing the platform's idea of local time.
+
+    Whether DST is active is looked up in a per year table of DST transitions.
+    The table is built once per year by bisecting with time.localtime, so
+    repeated calls for the same year do not call into the C library.
+    Additionally the DST state of each day without transition is memoized.
+    Call clear_cache after changing the platform's time zone (time.tzset).
+
+    Local times repeated by the switch back to standard time are resolved
+    with the fold attribute (PEP 495): fold=0 is the first occurrence (DST)
+    and fold=1 the second one (standard time).
+    """
+
+    DAY_CACHE_SIZE = 50000
+    # maximum number of memoized days. The memo is cleared, when it is full.
+
+    def __init__(self) -> None:
+        self._transitions: dict[int, Optional[tuple[list[int], list[bool]]]] = {}
+        self._days: dict[int, Optional[bool]] = {}
 
     def utcoffset(self, dt: Optional[datetime]) -> timedelta:
         """Return offset from UTC in minutes of UTC."""
+        stdoffset, dstoffset, _ = _local_offsets()
         if self._isdst(dt):
-            return DSTOFFSET
+            return dstoffset
         else:
-            return STDOFFSET
+            return stdoffset
 
     def dst(self, dt: Optional[datetime]) -> timedelta:
         """Return daylight saving offset."""
         if self._isdst(dt):
-            return DSTDIFF
+            return _local_offsets()[2]
         else:
             return ZERO
 
@@ -119,10 +266,100 @@ class LocalTimezone(tzinfo):
         """
         return time.tzname[self._isdst(dt)]
 
+    def clear_cache(self) -> None:
+        """Forget all DST transitions computed so far."""
+        self._transitions.clear()
+        self._days.clear()
+
+    def _year_transitions(self, year: int) -> Optional[tuple[list[int], list[bool]]]:
+        """Find the DST transitions for year.
+
+        Returns a sorted list of UTC timestamps and a list with the DST state
+        starting at each timestamp. The table covers the whole year with two
+        days margin on each side, so any local time in year can be looked up.
+        Returns None if the platform can not handle timestamps in this year.
+        """
+
+        def isdst(stamp: int) -> bool:
+            return time.localtime(stamp).tm_isdst > 0
+
+        start = (date(year, 1, 1).toordinal() - EPOCH_ORDINAL - 2) * 86400
+        end = (date(year, 12, 31).toordinal() - EPOCH_ORDINAL + 3) * 86400
+        try:
+            state = isdst(start)
+            stamps, states = [start], [state]
+            # sample once a day and bisect to the second between samples with
+            # different DST state.
+            for low in range(start, end, 86400):
+                high = min(low + 86400, end)
+                if isdst(high) == state:
+                    continue
+                while high - low > 1:
+                    mid = (low + high) // 2
+                    if isdst(mid) == state:
+                        low = mid
+                    else:
+                        high = mid
+                state = not state
+                stamps.append(high)
+                states.append(state)
+        except (OverflowError, OSError, ValueError):
+            return None
+        return stamps, states
+
+    def _table(self, year: int) -> Optional[tuple[list[int], list[bool]]]:
+        """Return the cached DST transitions for year."""
+        try:
+            return self._transitions[year]
+        except KeyError:
+            return self._transitions.setdefault(year, self._year_transitions(year))
+
+    def _day_state(self, ordinal: int, year: int) -> Optional[bool]:
+        """Return the DST state of a whole day, or None if it changes within the day."""
+        table = self._table(year)
+        if table is None:
+            return None
+        stamps, states = table
+        stdoffset, dstoffset, _ = _local_offsets()
+        std, dst = stdoffset // SECOND, dstoffset // SECOND
+        daystart = (ordinal - EPOCH_ORDINAL) * 86400
+        first = bisect_right(stamps, daystart - max(std, dst))
+        last = bisect_right(stamps, daystart + 86400 - min(std, dst))
+        state = states[first - 1] if first == last else None
+        if len(self._days) >= self.DAY_CACHE_SIZE:
+            self._days.clear()
+        return self._days.setdefault(ordinal, state)
+
     def _isdst(self, dt: Optional[datetime]) -> bool:
         """Returns true if DST is active for given datetime object dt."""
         if dt is None:
             raise Exception("datetime object dt was None!")
+        ordinal = dt.toordinal()
+        try:
+            state = self._days[ordinal]
+        except KeyError:
+            state = self._day_state(ordinal, dt.year)
+        if state is not None:
+            return state
+        table = self._table(dt.year)
+        if table is None:
+            return self._isdst_mktime(dt)
+        stamps, states = table
+        wall = (ordinal - EPOCH_ORDINAL) * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+        # interpret the local time as standard and as DST time.
+        stdoffset, dstoffset, _ = _local_offsets()
+        std = states[bisect_right(stamps, wall - stdoffset // SECOND) - 1]
+        dst = states[bisect_right(stamps, wall - dstoffset // SECOND) - 1]
+        if std == dst:
+            return std
+        if not std and dst:
+            # local time is ambiguous; the first occurrence is DST.
+            return not dt.fold
+        # local time does not exist (skipped by the switch to DST)
+        return std
+
+    def _isdst_mktime(self, dt: datetime) -> bool:
+        """Ask the C library whether DST is active for given datetime object dt."""
         tt = (
             dt.year,
             dt.month,
@@ -137,7 +374,3 @@ class LocalTimezone(tzinfo):
         stamp = time.mktime(tt)
         tt = time.localtime(stamp)
         return tt.tm_isdst > 0
-
-
-# the default instance for local time zone.
-LOCAL = LocalTimezone()
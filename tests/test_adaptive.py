@@ -0,0 +1,84 @@
+"""Test cases for the isoadaptive module."""
+
+from datetime import date, datetime, time
+
+import pytest
+
+from isodate import (
+    UTC,
+    AdaptiveParser,
+    ISO8601Error,
+    fixed_offset,
+    parse_date,
+    parse_datetime,
+    parse_time,
+)
+
+# the following list contains tuples of the kind, the parse function and a
+# stream of ISO strings, which switches between representations.
+TEST_CASES = [
+    ("date", parse_date, ["2012-06-15", "2012-167", "2012-W24-5", "2012-W24", "20120615", "19"]),
+    ("time", parse_time, ["10:20:30", "10:20", "102030.5Z", "10.5+01", "T1020-05:30"]),
+    (
+        "datetime",
+        parse_datetime,
+        ["2012-06-15T10:20:30Z", "2012-167T10:20", "20120615T102030.5+0100", "2012T10"],
+    ),
+]
+
+
+@pytest.mark.parametrize("kind, parser, values", TEST_CASES)
+def test_parse(kind, parser, values):
+    """AdaptiveParser returns the same results as the parse functions."""
+    adaptive = AdaptiveParser(kind)
+    stream = [value for value in values for _ in range(3)] + values[::-1]
+    assert [adaptive(value) for value in stream] == [parser(value) for value in stream]
+
+
+def test_stats():
+    """The statistics count hits, misses and failures."""
+    adaptive = AdaptiveParser("date")
+    for value in ["2012-06-15", "2012-06-16", "2012-167", "2012-168", "2012-169"]:
+        adaptive(value)
+    with pytest.raises(ISO8601Error):
+        adaptive("2012-06-15T")
+    assert adaptive.get_stats() == {
+        "date": {"hits": 4, "misses": 1, "failures": 1, "hit_rate": 4 / 6, "last": 4}
+    }
+    adaptive.reset_stats()
+    assert adaptive.get_stats()["date"] == {
+        "hits": 0,
+        "misses": 0,
+        "failures": 0,
+        "hit_rate": 0.0,
+        "last": 4,
+    }
+    assert set(AdaptiveParser().get_stats()) == {"date", "time"}
+    assert set(AdaptiveParser("time").get_stats()) == {"time"}
+
+
+def test_options():
+    """The options are the ones of the parse functions."""
+    assert AdaptiveParser("date", yeardigits=6)("+002012-06") == date(2012, 6, 1)
+    assert AdaptiveParser("date", defaultday=15)("2012-06") == date(2012, 6, 15)
+    assert AdaptiveParser("time", to_utc=True)("10:20+01:00") == time(9, 20, tzinfo=UTC)
+    tz = fixed_offset(2, 0, "+02")
+    assert AdaptiveParser("datetime", default_tz=tz)("2012-06-15T10:20") == datetime(
+        2012, 6, 15, 10, 20, tzinfo=tz
+    )
+    assert AdaptiveParser("datetime", to_utc=True)("2012-06-15T01:20+02") == datetime(
+        2012, 6, 14, 23, 20, tzinfo=UTC
+    )
+
+
+def test_errors():
+    """Errors are the ones of the parse functions."""
+    adaptive = AdaptiveParser()
+    with pytest.raises(ISO8601Error, match="designator 'T' missing"):
+        adaptive("2012-06-15")
+    with pytest.raises(ISO8601Error, match="time format"):
+        adaptive("2012-06-15T10:20:30:40")
+    with pytest.raises(ValueError, match="hour"):
+        adaptive("2012-06-15T25:20")
+    with pytest.raises(ValueError):
+        AdaptiveParser("duration")
@@ -0,0 +1,78 @@
+"""Test cases for the isobatch module and concurrent use of the caches."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from isodate import (
+    UTC,
+    ISO8601Error,
+    isodates,
+    isotime,
+    parse_date,
+    parse_datetime,
+    parse_duration,
+    parse_many,
+    parse_time,
+)
+
+DATETIMES = [
+    "2012-06-%02dT%02d:20:30+01:00" % (day, hour) for day in range(1, 29) for hour in range(24)
+]
+
+
+@pytest.mark.parametrize("workers, chunksize", [(1, 10), (4, 10), (4, 1000), (None, 7)])
+def test_parse_many(workers, chunksize):
+    """parse_many returns the results in order."""
+    expected = [parse_datetime(value) for value in DATETIMES]
+    assert parse_many(DATETIMES, workers=workers, chunksize=chunksize) == expected
+
+
+def test_parse_many_options():
+    """parse_many passes options to the parser and accepts iterables."""
+    values = iter(["P1D", "PT1H"])
+    assert parse_many(values, parse_duration, workers=2, chunksize=1) == [
+        timedelta(days=1),
+        timedelta(hours=1),
+    ]
+    result = parse_many(DATETIMES, to_utc=True, workers=2, chunksize=50)
+    assert result[0] == datetime(2012, 5, 31, 23, 20, 30, tzinfo=UTC)
+    assert all(value.tzinfo is UTC for value in result)
+
+
+def test_parse_many_executor():
+    """parse_many can run on an existing executor."""
+    with ThreadPoolExecutor(2) as executor:
+        result = parse_many(["2012-06-15", "2012-W01"], parse_date, chunksize=1, executor=executor)
+    assert result == [date(2012, 6, 15), date(2012, 1, 2)]
+
+
+def test_parse_many_errors():
+    """The error of the first invalid value is raised."""
+    values = DATETIMES[:100] + ["2012-06-15T25"] + DATETIMES[:100] + ["x"]
+    with pytest.raises(ValueError, match="hour"):
+        parse_many(values, workers=4, chunksize=10)
+    with pytest.raises(ISO8601Error):
+        parse_many(DATETIMES[:100] + ["x"], workers=4, chunksize=10)
+    with pytest.raises(ValueError):
+        parse_many(DATETIMES, chunksize=0)
+
+
+def test_concurrent_first_use(monkeypatch):
+    """Threads building the regular expression caches at once agree on one copy."""
+    monkeypatch.setattr(isotime, "TIME_REGEX_CACHE", [])
+    monkeypatch.setattr(isodates, "DATE_REGEX_CACHE", {})
+    barrier = threading.Barrier(8)
+
+    def parse() -> tuple[date, object]:
+        barrier.wait()
+        return parse_date("2012-06-15"), parse_time("10:20")
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda _: parse(), range(8)))
+    assert len(set(results)) == 1
+    assert len(isotime.build_time_regexps()) == 5
+    assert len(isodates.build_date_regexps()) == 12
+    assert list(isodates.DATE_REGEX_CACHE) == [(4, False)]
@@ -0,0 +1,42 @@
+"""Test cases for the _calendar module."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from isodate._calendar import (
+    MAX_ORDINAL,
+    first_ordinal,
+    valid_day,
+    week1_ordinal,
+    week_ordinal,
+)
+
+
+@pytest.mark.parametrize("year", [1, 2, 4, 100, 400, 1582, 1900, 2000, 2004, 2012, 2100, 9999])
+def test_ordinals(year: int):
+    """The ordinals are the ones of date.toordinal."""
+    assert first_ordinal(year) == date(year, 1, 1).toordinal()
+    for day in range(0, 371, 13):
+        value = date(year, 1, 1) + timedelta(days=day)
+        isoyear, week, weekday = value.isocalendar()
+        assert week_ordinal(isoyear, week, weekday) == value.toordinal()
+    assert date.fromordinal(week1_ordinal(year)).isocalendar()[:2] == (year, 1)
+
+
+def test_week_ordinal_overflow():
+    """Weeks and weekdays out of range are counted on like parse_date does."""
+    assert week_ordinal(2009, 53, 7) == date(2010, 1, 3).toordinal()
+    assert week_ordinal(2010, 53, 1) == date(2011, 1, 3).toordinal()
+    assert week_ordinal(2012, 0, 1) == date(2011, 12, 26).toordinal()
+    assert week_ordinal(2012, 1, 0) == date(2012, 1, 1).toordinal()
+
+
+def test_valid_day():
+    """valid_day accepts the values datetime.date accepts."""
+    assert valid_day(2012, 2, 29)
+    assert not valid_day(2011, 2, 29)
+    assert not valid_day(2012, 13, 1)
+    assert not valid_day(0, 1, 1)
+    assert not valid_day(10000, 1, 1)
+    assert date.fromordinal(MAX_ORDINAL) == date.max
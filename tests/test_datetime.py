@@ -1,6 +1,6 @@
 """Test cases for the isodatetime module."""
 
-from datetime import datetime
+from datetime import datetime, tzinfo
 from typing import Optional
 
 import pytest
@@ -12,6 +12,7 @@ from isodate import (
     DATE_EXT_COMPLETE,
     DATE_EXT_ORD_COMPLETE,
     DATE_EXT_WEEK_COMPLETE,
+    LOCAL,
     TIME_BAS_COMPLETE,
     TIME_BAS_MINUTE,
     TIME_EXT_COMPLETE,
@@ -159,3 +160,52 @@ def test_format(datetimestring: str, expected: Optional[datetime], format: str,
             datetime_isoformat(expected, format)  # type: ignore [arg-type]
     else:
         assert datetime_isoformat(expected, format) == output
+
+
+# the following list contains tuples of ISO datetime strings, the default_tz
+# and the expected result from parse_datetime with to_utc=True. A result of
+# None means a ValueError is expected.
+UTC_TEST_CASES: list[tuple[str, Optional[tzinfo], Optional[datetime]]] = [
+    ("2012-06-15T10:20:30Z", None, datetime(2012, 6, 15, 10, 20, 30, tzinfo=UTC)),
+    ("2012-06-15T10:20:30+00:00", None, datetime(2012, 6, 15, 10, 20, 30, tzinfo=UTC)),
+    ("2012-06-15T10:20:30.5+05:30", None, datetime(2012, 6, 15, 4, 50, 30, 500000, UTC)),
+    ("2012-06-15T10:20:30-0800", None, datetime(2012, 6, 15, 18, 20, 30, tzinfo=UTC)),
+    ("2012-12-31T20:00:00-05", None, datetime(2013, 1, 1, 1, tzinfo=UTC)),
+    ("2012-03-01T01:00:00+02", None, datetime(2012, 2, 29, 23, tzinfo=UTC)),
+    ("2012-06-15T10:20:30", None, datetime(2012, 6, 15, 10, 20, 30)),
+    ("2012-06-15T10:20:30", UTC, datetime(2012, 6, 15, 10, 20, 30, tzinfo=UTC)),
+    (
+        "2012-06-15T10:20:30",
+        FixedOffset(-2, 0, "-02:00"),
+        datetime(2012, 6, 15, 12, 20, 30, 0, UTC),
+    ),
+    (
+        "2012-06-15T10:20:30+01:00",
+        FixedOffset(-2, 0, "-02:00"),
+        datetime(2012, 6, 15, 9, 20, 30, 0, UTC),
+    ),
+    ("2012-06-15T24:00:00+01:00", None, None),
+    ("2012-06-15T10:20:30+24:00", None, None),
+]
+
+
+@pytest.mark.parametrize("datetimestring, default_tz, expected", UTC_TEST_CASES)
+def test_parse_to_utc(
+    datetimestring: str, default_tz: Optional[tzinfo], expected: Optional[datetime]
+):
+    """Parse an ISO datetime string and convert it to UTC."""
+    if expected is None:
+        with pytest.raises(ValueError):
+            parse_datetime(datetimestring, to_utc=True, default_tz=default_tz)
+        return
+    result = parse_datetime(datetimestring, to_utc=True, default_tz=default_tz)
+    assert result == expected
+    assert result.tzinfo is expected.tzinfo
+
+
+@pytest.mark.parametrize("datetimestring", ["2012-01-15T10:20:30", "2012-07-15T10:20:30"])
+def test_parse_to_utc_local(datetimestring: str):
+    """Naive date-times are interpreted as local time with default_tz=LOCAL."""
+    expected = parse_datetime(datetimestring).replace(tzinfo=LOCAL).astimezone(UTC)
+    assert parse_datetime(datetimestring, to_utc=True, default_tz=LOCAL) == expected
+    assert parse_datetime(datetimestring, default_tz=LOCAL).tzinfo is LOCAL
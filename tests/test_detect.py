@@ -0,0 +1,213 @@
+"""Test cases for the isodetect module."""
+
+from datetime import date, datetime, time
+from typing import Optional
+
+import pytest
+
+from isodate import (
+    D_ALT_BAS_ORD,
+    D_ALT_EXT,
+    D_DEFAULT,
+    D_WEEK,
+    DATE_BAS_WEEK_COMPLETE,
+    DATE_CENTURY,
+    DATE_EXT_COMPLETE,
+    DATE_EXT_ORD_COMPLETE,
+    DATE_EXT_WEEK,
+    DATE_YEAR,
+    DT_BAS_COMPLETE,
+    DT_EXT_COMPLETE,
+    TIME_BAS_MINUTE,
+    UTC,
+    ISOFormat,
+    detect_format,
+    fixed_offset,
+    parse_date,
+    parse_datetime,
+    parse_time,
+    strftime,
+)
+
+# the following list contains tuples of ISO strings and the expected
+# descriptor. A descriptor of None means, that the string is not recognised.
+TEST_CASES: list[tuple[str, Optional[ISOFormat]]] = [
+    (
+        "2012-06-15",
+        ISOFormat(
+            "date", DATE_EXT_COMPLETE, "DATE_EXT_COMPLETE", "complete", None, True, False, None, 0
+        ),
+    ),
+    (
+        "2012W234",
+        ISOFormat(
+            "date",
+            DATE_BAS_WEEK_COMPLETE,
+            "DATE_BAS_WEEK_COMPLETE",
+            "week_complete",
+            None,
+            False,
+            date_index=3,
+        ),
+    ),
+    (
+        "2012-W23",
+        ISOFormat("date", DATE_EXT_WEEK, "DATE_EXT_WEEK", "week", None, True, date_index=6),
+    ),
+    (
+        "2012-167",
+        ISOFormat(
+            "date",
+            DATE_EXT_ORD_COMPLETE,
+            "DATE_EXT_ORD_COMPLETE",
+            "ordinal",
+            None,
+            True,
+            date_index=4,
+        ),
+    ),
+    ("2012", ISOFormat("date", DATE_YEAR, "DATE_YEAR", "year", date_index=10)),
+    ("20", ISOFormat("date", DATE_CENTURY, "DATE_CENTURY", "century", date_index=11)),
+    (
+        "10:20:30,5+01:00",
+        ISOFormat("time", "%H:%M:%S,%f%Z", None, None, "complete", True, True, "extended", None, 0),
+    ),
+    ("T1020Z", ISOFormat("time", "T%H%M%z", None, None, "minute", False, tz="Z", time_index=3)),
+    ("10:20.5", ISOFormat("time", None, None, None, "minute", True, True, time_index=2)),
+    ("10.5-05", ISOFormat("time", None, None, None, "hour", None, True, "hour", time_index=4)),
+    (
+        "2012-06-15T10:20:30Z",
+        ISOFormat(
+            "datetime",
+            DT_EXT_COMPLETE,
+            "DT_EXT_COMPLETE",
+            "complete",
+            "complete",
+            True,
+            False,
+            "Z",
+            0,
+            0,
+        ),
+    ),
+    (
+        "20120615T102030-0500",
+        ISOFormat(
+            "datetime",
+            DT_BAS_COMPLETE,
+            "DT_BAS_COMPLETE",
+            "complete",
+            "complete",
+            False,
+            False,
+            "basic",
+            1,
+            1,
+        ),
+    ),
+    (
+        "2012T10:20",
+        ISOFormat("datetime", "%YT%H:%M", None, "year", "minute", True, False, None, 10, 2),
+    ),
+    ("P1Y2M3DT4H", ISOFormat("duration", D_DEFAULT, "D_DEFAULT")),
+    ("-P1.5D", ISOFormat("duration", D_DEFAULT, "D_DEFAULT", fraction=True)),
+    ("P3W", ISOFormat("duration", D_WEEK, "D_WEEK")),
+    (
+        "P0018-09-04T11:09:00",
+        ISOFormat(
+            "duration", D_ALT_EXT, "D_ALT_EXT", "complete", "complete", True, False, None, 0, 0
+        ),
+    ),
+    (
+        "P0018247T110900",
+        ISOFormat(
+            "duration",
+            D_ALT_BAS_ORD,
+            "D_ALT_BAS_ORD",
+            "ordinal",
+            "complete",
+            False,
+            False,
+            None,
+            5,
+            1,
+        ),
+    ),
+    ("2012-06-15X", None),
+    ("2012-06-15T10:20:30:40", None),
+    ("P1D2H", None),
+    ("", None),
+]
+
+
+@pytest.mark.parametrize("isostring, expected", TEST_CASES)
+def test_detect(isostring: str, expected: Optional[ISOFormat]):
+    """detect_format classifies ISO strings."""
+    assert detect_format(isostring) == expected
+
+
+@pytest.mark.parametrize(
+    "value, isostring",
+    [
+        (date(2012, 6, 15), "2012-06-15"),
+        (date(2012, 6, 15), "2012-W24-5"),
+        (date(2012, 6, 15), "2012167"),
+        (time(10, 20, 30, 500000, UTC), "T10:20:30.500000Z"),
+        (time(10, 20, 30, tzinfo=fixed_offset(1, 30, "+01:30")), "102030+0130"),
+        (
+            datetime(2012, 6, 15, 10, 20, 30, tzinfo=fixed_offset(-5, 0, "-05")),
+            "2012-06-15T10:20:30-05",
+        ),
+    ],
+)
+def test_format_round_trip(value, isostring: str):
+    """The detected format renders values in the same representation."""
+    descriptor = detect_format(isostring)
+    assert descriptor is not None and descriptor.format is not None
+    assert strftime(value, descriptor.format) == isostring
+
+
+def test_kind():
+    """kind restricts the detection to one kind of values."""
+    assert detect_format("1020").kind == "date"
+    assert detect_format("1020", "time") == ISOFormat(
+        "time", "%H%M", "TIME_BAS_MINUTE", None, "minute", False, time_index=3
+    )
+    assert detect_format("1020", "time").format == TIME_BAS_MINUTE
+    assert detect_format("2012-06-15", "time") is None
+    assert detect_format("2012-06-15T10:20", "date") is None
+    with pytest.raises(ValueError):
+        detect_format("2012", "year")
+
+
+def test_options():
+    """yeardigits and expanded are passed on like for parse_date."""
+    assert detect_format("+002012-06-15") is None
+    descriptor = detect_format("+002012-06-15", yeardigits=6)
+    assert descriptor.format == DATE_EXT_COMPLETE
+    assert strftime(date(2012, 6, 15), descriptor.format, 6) == "+002012-06-15"
+    assert detect_format("+2012-167", expanded=True).format == "+" + DATE_EXT_ORD_COMPLETE
+
+
+@pytest.mark.parametrize(
+    "isostring, parser",
+    [
+        ("2012-06-15", parse_date),
+        ("10:20:30", parse_time),
+        ("2012-06-15T10:20:30Z", parse_datetime),
+    ],
+)
+def test_indices(isostring: str, parser):
+    """The pattern indices are the ones the parse functions use."""
+    from isodate.isodates import build_date_regexps
+    from isodate.isotime import build_time_regexps
+
+    descriptor = detect_format(isostring)
+    assert descriptor is not None
+    parser(isostring)
+    if descriptor.date_index is not None:
+        datestring = isostring.split("T")[0]
+        assert build_date_regexps()[descriptor.date_index].match(datestring)
+    if descriptor.time_index is not None:
+        timestring = isostring.split("T")[-1]
+        assert build_time_regexps()[descriptor.time_index].match(timestring)
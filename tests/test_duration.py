@@ -12,7 +12,10 @@ from isodate import (
     Duration,
     ISO8601Error,
     duration_isoformat,
+    isoduration,
     parse_duration,
+    parse_duration_ints,
+    strftime,
 )
 
 # the following list contains tuples of ISO duration strings and the expected
@@ -82,6 +85,80 @@ def test_format_parse(durationstring, expectation, format, altstr):
         assert duration_isoformat(expectation, format) == durationstring
 
 
+# A list of test cases for parse_duration_ints. Each tuple contains a duration
+# string, the unit and the expected (months, ticks) tuple.
+INTS_TEST_CASES: list[tuple[str, str, Optional[tuple[int, int]]]] = [
+    ("P18Y9M4DT11H9M8S", "us", (225, (((4 * 24 + 11) * 60 + 9) * 60 + 8) * 10**6)),
+    ("P2W", "us", (0, 14 * 86400 * 10**6)),
+    ("-P2.2W", "us", (0, -1330560 * 10**6)),
+    ("PT2.3H", "us", (0, 8280 * 10**6)),
+    ("PT22.22S", "us", (0, 22220000)),
+    ("PT22.22S", "ns", (0, 22220000000)),
+    ("PT0,123456789S", "us", (0, 123456)),
+    ("PT0,123456789S", "ns", (0, 123456789)),
+    ("-PT0.0000019S", "us", (0, -1)),
+    ("P0.5Y", "us", (6, 0)),
+    ("P1Y0.5M", "us", None),
+    ("P1.5Y", "us", (18, 0)),
+    ("+P11D", "ns", (0, 11 * 86400 * 10**9)),
+    ("-P3Y6M4DT12H30M5S", "us", (-42, -((4 * 24 + 12) * 3600 + 30 * 60 + 5) * 10**6)),
+    ("P0018-09-04T11:09:08", "us", (225, (((4 * 24 + 11) * 60 + 9) * 60 + 8) * 10**6)),
+    ("P0018-09-04T11:09:08.5", "ns", (225, ((((4 * 24 + 11) * 60 + 9) * 60 + 8) * 10 + 5) * 10**8)),
+]
+
+
+@pytest.mark.parametrize("durationstring, unit, expectation", INTS_TEST_CASES)
+def test_parse_ints(durationstring: str, unit: str, expectation: Optional[tuple[int, int]]):
+    """Parse an ISO duration string into integer months and ticks."""
+    if expectation is None:
+        with pytest.raises(ValueError):
+            parse_duration_ints(durationstring, unit)
+    else:
+        result = parse_duration_ints(durationstring, unit)
+        assert result == expectation
+        assert all(type(value) is int for value in result)
+
+
+@pytest.mark.parametrize(
+    "durationstring, expectation, format, altstr",
+    PARSE_TEST_CASES,
+)
+def test_parse_ints_parse(durationstring, expectation, format, altstr):
+    """parse_duration_ints agrees with parse_duration."""
+    months, usecs = parse_duration_ints(durationstring)
+    if isinstance(expectation, Duration):
+        assert months == expectation.years * 12 + expectation.months
+        expectation = expectation.tdelta
+    else:
+        assert months == 0
+    assert usecs == expectation // timedelta(microseconds=1)
+
+
+@pytest.mark.parametrize(
+    "durationstring, ticks, microseconds",
+    [
+        ("PT0.0000019S", 1, 2),
+        ("-PT0.0000019S", -1, -2),
+        ("PT0.0000015S", 1, 2),
+        ("PT1.0000009S", 1000000, 1000001),
+    ],
+)
+def test_parse_ints_truncate(durationstring: str, ticks: int, microseconds: int):
+    """parse_duration_ints truncates toward zero, where parse_duration rounds."""
+    assert parse_duration_ints(durationstring) == (0, ticks)
+    assert parse_duration(durationstring) == timedelta(microseconds=microseconds)
+
+
+def test_parse_ints_errors():
+    """parse_duration_ints rejects the same input as parse_duration."""
+    with pytest.raises(ISO8601Error):
+        parse_duration_ints("T10:10:10")
+    with pytest.raises(TypeError):
+        parse_duration_ints(date(2000, 1, 1))  # type: ignore [arg-type]
+    with pytest.raises(ValueError):
+        parse_duration_ints("P1D", "ms")
+
+
 #                       d1                    d2           '+', '-', '>'
 # A list of test cases to test addition and subtraction between datetime and
 # Duration objects.
@@ -426,6 +503,45 @@ def test_format():
     assert duration_isoformat(-dur) == "-P3Y7M23DT5H25M0.33S"
 
 
+def test_format_cache(monkeypatch):
+    """Formatted timedelta instances are cached for the default formats."""
+    monkeypatch.setattr(isoduration, "DURATION_FORMAT_CACHE", {D_DEFAULT: {}, D_WEEK: {}})
+    for _ in range(2):
+        assert duration_isoformat(timedelta(hours=1)) == "PT1H"
+        assert duration_isoformat(timedelta(hours=-1)) == "-PT1H"
+        assert duration_isoformat(timedelta(weeks=-2), D_WEEK) == "-P2W"
+        assert duration_isoformat(timedelta(microseconds=10)) == "PT0.00001S"
+        assert duration_isoformat(timedelta(0)) == "P0D"
+    assert len(isoduration.DURATION_FORMAT_CACHE[D_DEFAULT]) == 4
+    assert len(isoduration.DURATION_FORMAT_CACHE[D_WEEK]) == 1
+
+
+def test_format_cache_bounded(monkeypatch):
+    """The format cache is cleared when it reaches DURATION_FORMAT_CACHE_SIZE."""
+    monkeypatch.setattr(isoduration, "DURATION_FORMAT_CACHE", {D_DEFAULT: {}, D_WEEK: {}})
+    monkeypatch.setattr(isoduration, "DURATION_FORMAT_CACHE_SIZE", 8)
+    for seconds in range(50):
+        assert duration_isoformat(timedelta(seconds=seconds + 1)) == "PT%dS" % (seconds + 1)
+        assert len(isoduration.DURATION_FORMAT_CACHE[D_DEFAULT]) <= 8
+
+
+@pytest.mark.parametrize(
+    "tduration",
+    [
+        Duration(years=1, months=13, days=-3),
+        Duration(months=-1, seconds=1.5),
+        Duration(weeks=-2, microseconds=1),
+        Duration(0),
+        timedelta(days=-15, microseconds=10),
+    ],
+)
+@pytest.mark.parametrize("format", [D_DEFAULT, D_WEEK])
+def test_format_default_strftime(tduration, format):
+    """The default formats render like the generic strftime path."""
+    sign = "-" if duration_isoformat(tduration, "%P").startswith("-") else ""
+    assert duration_isoformat(tduration, format) == sign + strftime(tduration, format)
+
+
 def test_equal():
     """Test __eq__ and __ne__ methods."""
     assert Duration(years=1, months=1) == Duration(years=1, months=1)
@@ -0,0 +1,134 @@
+"""Test cases for the isofields module."""
+
+from datetime import date, datetime, time, timedelta
+from typing import Any, Callable
+
+import pytest
+
+from isodate import (
+    ISO8601Error,
+    ISOFields,
+    fixed_offset,
+    parse_date,
+    parse_date_fields,
+    parse_datetime,
+    parse_datetime_fields,
+    parse_time,
+    parse_time_fields,
+)
+
+# the following list contains tuples of a fields parser, an ISO string and
+# the expected fields.
+TEST_CASES: list[tuple[Callable[[str], ISOFields], str, ISOFields]] = [
+    (parse_date_fields, "1985-04-12", ISOFields(1985, 4, 12, precision="day")),
+    (parse_date_fields, "19850412", ISOFields(1985, 4, 12, precision="day")),
+    (parse_date_fields, "1985-W15-5", ISOFields(1985, 4, 12, precision="day")),
+    (parse_date_fields, "1985-102", ISOFields(1985, 4, 12, precision="day")),
+    (parse_date_fields, "1985-000", ISOFields(1984, 12, 31, precision="day")),
+    (parse_date_fields, "1985-W15", ISOFields(1985, 4, 8, precision="week")),
+    (parse_date_fields, "1985-04", ISOFields(1985, 4, precision="month")),
+    (parse_date_fields, "1985", ISOFields(1985, precision="year")),
+    (parse_date_fields, "19", ISOFields(1901, precision="century")),
+    (parse_time_fields, "23:20:50", ISOFields(None, None, None, 23, 20, 50, precision="second")),
+    (
+        parse_time_fields,
+        "232050,5-05:30",
+        ISOFields(None, None, None, 23, 20, 50, 500000, -330, "second"),
+    ),
+    (
+        parse_time_fields,
+        "23:20:50.1234567Z",
+        ISOFields(None, None, None, 23, 20, 50, 123456, 0, "second"),
+    ),
+    (
+        parse_time_fields,
+        "T2320+01",
+        ISOFields(None, None, None, 23, 20, tz_offset=60, precision="minute"),
+    ),
+    (parse_time_fields, "23:20.5", ISOFields(None, None, None, 23, 20, 30, 0, precision="minute")),
+    (parse_time_fields, "23", ISOFields(None, None, None, 23, precision="hour")),
+    (parse_time_fields, "23.25", ISOFields(None, None, None, 23, 15, 0, 0, precision="hour")),
+    (
+        parse_datetime_fields,
+        "1985-04-12T23:20:50.5Z",
+        ISOFields(1985, 4, 12, 23, 20, 50, 500000, 0, "second"),
+    ),
+    (
+        parse_datetime_fields,
+        "1985-W15T23:20+0100",
+        ISOFields(1985, 4, 8, 23, 20, tz_offset=60, precision="minute"),
+    ),
+    (parse_datetime_fields, "1985T23", ISOFields(1985, None, None, 23, precision="hour")),
+]
+
+
+@pytest.mark.parametrize("parser, isostring, expected", TEST_CASES)
+def test_fields(parser: Callable[[str], ISOFields], isostring: str, expected: ISOFields):
+    """The fields parsers return the fields given by the string."""
+    assert parser(isostring) == expected
+
+
+def _value(fields: ISOFields) -> Any:
+    """Build the value the parse functions return from the fields."""
+    tzinfo = None if fields.tz_offset is None else fixed_offset(0, fields.tz_offset, "")
+    timefields = (fields.hour, fields.minute or 0, fields.second or 0, fields.microsecond or 0)
+    if fields.year is None:
+        return time(*timefields, tzinfo=tzinfo)  # type: ignore [arg-type]
+    value = date(fields.year, fields.month or 1, fields.day or 1)
+    if fields.hour is None:
+        return value
+    return datetime.combine(value, time(*timefields, tzinfo=tzinfo))  # type: ignore [arg-type]
+
+
+@pytest.mark.parametrize(
+    "parser, reference",
+    [
+        (parse_date_fields, parse_date),
+        (parse_time_fields, parse_time),
+        (parse_datetime_fields, parse_datetime),
+    ],
+)
+def test_parse_functions(parser: Callable[[str], ISOFields], reference: Callable[[str], Any]):
+    """The fields are the ones of the values the parse functions return."""
+    for fieldsparser, isostring, _ in TEST_CASES:
+        if fieldsparser is parser:
+            value = reference(isostring)
+            expected = _value(parser(isostring))
+            assert value == expected
+            if not isinstance(value, date) or isinstance(value, datetime):
+                assert value.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize(
+    "parser, isostring, exception",
+    [
+        (parse_date_fields, "1985-04-31", ValueError),
+        (parse_date_fields, "1985-13", ValueError),
+        (parse_date_fields, "0000", ValueError),
+        (parse_date_fields, "1985-4-12", ISO8601Error),
+        (parse_time_fields, "24:00", ValueError),
+        (parse_time_fields, "23:60:00.5", ValueError),
+        (parse_time_fields, "05.001111111", ValueError),
+        (parse_time_fields, "23:20:50:40", ISO8601Error),
+        (parse_datetime_fields, "1985-04-12", ISO8601Error),
+        (parse_datetime_fields, "1985-04-31T23:20", ValueError),
+        (parse_datetime_fields, "1985-04-12T23:20:50:40", ISO8601Error),
+        (parse_date_fields, None, TypeError),
+        (parse_time_fields, 2320, TypeError),
+        (parse_datetime_fields, b"1985-04-12T23:20", TypeError),
+    ],
+)
+def test_errors(parser: Callable[[Any], ISOFields], isostring: Any, exception: type):
+    """The fields parsers raise the exceptions of the parse functions."""
+    with pytest.raises(exception):
+        parser(isostring)
+
+
+def test_options():
+    """parse_date_fields takes the options of parse_date, offsets are in minutes."""
+    assert parse_date_fields("+001985-04", yeardigits=6) == ISOFields(1985, 4, precision="month")
+    assert parse_date_fields("+1985-04-12", expanded=True) == ISOFields(
+        1985, 4, 12, precision="day"
+    )
+    assert parse_time_fields("23:20+25:00").tz_offset == 1500
+    assert timedelta(minutes=parse_time_fields("23:20-12").tz_offset) == timedelta(hours=-12)
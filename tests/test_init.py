@@ -0,0 +1,61 @@
+"""Test cases for the lazy imports of the isodate package."""
+
+import subprocess
+import sys
+
+import pytest
+
+import isodate
+from isodate import isodates, isostrf, isotime, warmup
+
+
+def test_import_is_lazy():
+    """Importing isodate does not import its submodules."""
+    code = (
+        "import sys, isodate; "
+        "print(sorted(name for name in sys.modules if name.startswith('isodate')))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    assert output.strip() == "['isodate']"
+
+
+def test_local_is_lazy():
+    """Parsing does not set up the local time zone until it is used."""
+    code = (
+        "import isodate, isodate.tzinfo as tz; "
+        "isodate.parse_datetime('2012-06-15T10:20:30+01:00'); "
+        "print('STDOFFSET' in vars(tz), 'LOCAL' in vars(tz)); "
+        "isodate.LOCAL.utcoffset(isodate.parse_datetime('2012-06-15T10:20')); "
+        "print('STDOFFSET' in vars(tz), 'LOCAL' in vars(tz))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    assert output.splitlines() == ["False False", "True True"]
+
+
+@pytest.mark.parametrize("name", isodate.__all__)
+def test_exports(name: str):
+    """All names in __all__ can be accessed and are listed by dir."""
+    assert getattr(isodate, name) is not None
+    assert name in dir(isodate)
+
+
+def test_submodules():
+    """Submodules are accessible as attributes."""
+    assert isodate.isostrf is isostrf
+    with pytest.raises(AttributeError):
+        getattr(isodate, "no_such_name")
+
+
+def test_warmup(monkeypatch):
+    """warmup compiles the regular expressions and strftime programs."""
+    monkeypatch.setattr(isostrf, "STRF_PROGRAM_CACHE", {})
+    monkeypatch.setattr(isodates, "DATE_REGEX_CACHE", {})
+    warmup(yeardigits=(6,))
+    assert {(4, False), (4, True), (6, True)} <= set(isodates.DATE_REGEX_CACHE)
+    assert isotime.TIME_REGEX_CACHE
+    assert (isostrf.DT_EXT_COMPLETE, 4, False, False) in isostrf.STRF_PROGRAM_CACHE
+    assert (isostrf.D_DEFAULT, 6, True, False) in isostrf.STRF_PROGRAM_CACHE
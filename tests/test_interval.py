@@ -0,0 +1,229 @@
+"""Test cases for the isointerval module."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Optional
+
+import pytest
+
+from isodate import (
+    UTC,
+    Duration,
+    Interval,
+    IntervalIndex,
+    ISO8601Error,
+    RecurringInterval,
+    fixed_offset,
+    parse_interval,
+    parse_recurring_interval,
+)
+
+# the following list contains tuples of ISO interval strings and the expected
+# start and end.
+TEST_CASES = [
+    (
+        "2012-06-15T10:00Z/2012-06-15T12:30Z",
+        datetime(2012, 6, 15, 10, tzinfo=UTC),
+        datetime(2012, 6, 15, 12, 30, tzinfo=UTC),
+    ),
+    (
+        "2012-06-15T10:00Z/PT2H30M",
+        datetime(2012, 6, 15, 10, tzinfo=UTC),
+        datetime(2012, 6, 15, 12, 30, tzinfo=UTC),
+    ),
+    (
+        "PT2H30M/2012-06-15T12:30Z",
+        datetime(2012, 6, 15, 10, tzinfo=UTC),
+        datetime(2012, 6, 15, 12, 30, tzinfo=UTC),
+    ),
+    ("20120131T00/P1M", datetime(2012, 1, 31), datetime(2012, 2, 29)),
+    ("P1Y2M/2012-03-31T00:00", datetime(2011, 1, 31), datetime(2012, 3, 31)),
+    ("2012-06-15T10:00/2012-06-15T10:00", datetime(2012, 6, 15, 10), datetime(2012, 6, 15, 10)),
+    (
+        "2012-06-15T10:00+02:00/2012-06-15T09:00Z",
+        datetime(2012, 6, 15, 10, tzinfo=fixed_offset(2, 0, "+02:00")),
+        datetime(2012, 6, 15, 9, tzinfo=UTC),
+    ),
+]
+
+
+@pytest.mark.parametrize("intervalstring, start, end", TEST_CASES)
+def test_parse(intervalstring: str, start: datetime, end: datetime):
+    """parse_interval returns the start and end of an interval."""
+    assert parse_interval(intervalstring) == Interval(start, end)
+
+
+@pytest.mark.parametrize(
+    "intervalstring, exception",
+    [
+        ("2012-06-15T10:00Z", ISO8601Error),
+        ("2012-06-15T10:00Z/PT1H/PT1H", ISO8601Error),
+        ("P1D/P2D", ISO8601Error),
+        ("2012-06-15/2012-06-16", ISO8601Error),
+        ("2012-06-15T10:00/12:00", ISO8601Error),
+        ("2012-06-15T12:00/2012-06-15T10:00", ValueError),
+        ("2012-06-15T10:00/-PT1H", ValueError),
+        ("2012-06-15T10:00Z/2012-06-15T12:00", ValueError),
+        ("2012-06-15T10:00/2012-06-15T12:00+01", ValueError),
+        ("2012-06-31T10:00/PT1H", ValueError),
+        (None, TypeError),
+    ],
+)
+def test_parse_errors(intervalstring: Optional[str], exception: type):
+    """Invalid and unsupported intervals raise an exception."""
+    with pytest.raises(exception):
+        parse_interval(intervalstring)  # type: ignore [arg-type]
+
+
+def test_parse_options():
+    """The options of parse_datetime are applied to start and end."""
+    assert parse_interval("2012-06-15T10:00+02:00/PT1H", to_utc=True) == Interval(
+        datetime(2012, 6, 15, 8, tzinfo=UTC), datetime(2012, 6, 15, 9, tzinfo=UTC)
+    )
+    tz = fixed_offset(-5, 0, "-05")
+    assert parse_interval("PT1H/2012-06-15T10:00", default_tz=tz).start == datetime(
+        2012, 6, 15, 9, tzinfo=tz
+    )
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 7, 100])
+@pytest.mark.parametrize("tz", [None, UTC])
+def test_index(size: int, tz):
+    """The index finds the intervals a linear scan finds."""
+    rng = random.Random(size)
+    base = datetime(1969, 12, 25, tzinfo=tz)
+    intervals = []
+    for _ in range(size):
+        start = base + timedelta(minutes=rng.randrange(10000))
+        intervals.append((start, start + timedelta(minutes=rng.choice([0, 1, 5, 60, 3000]))))
+    index = IntervalIndex(intervals)
+    assert len(index) == size
+    assert index.intervals == [Interval(*interval) for interval in intervals]
+    for _ in range(200):
+        instant = base + timedelta(minutes=rng.randrange(-100, 13100))
+        if tz is not None:
+            instant = instant.astimezone(timezone(timedelta(hours=rng.randrange(-5, 6))))
+        expected = [i for i, (start, end) in enumerate(intervals) if start <= instant < end]
+        assert index.containing(instant) == expected
+        end = instant + timedelta(minutes=rng.choice([1, 30, 500]))
+        expected = [
+            i for i, (start, stop) in enumerate(intervals) if start < end and stop > instant
+        ]
+        assert index.overlapping(instant, end) == expected
+        assert index.overlapping(instant, instant) == index.containing(instant)
+
+
+def test_index_parsed():
+    """The index takes parsed intervals and raises for naive and aware values."""
+    index = IntervalIndex(parse_interval(value) for value, _, _ in TEST_CASES[:3])
+    assert index.containing(datetime(2012, 6, 15, 10, tzinfo=UTC)) == [0, 1, 2]
+    assert index.containing(datetime(2012, 6, 15, 12, 30, tzinfo=UTC)) == []
+    assert (
+        index.overlapping(
+            datetime(2012, 6, 15, 5, tzinfo=UTC), datetime(2012, 6, 15, 10, tzinfo=UTC)
+        )
+        == []
+    )
+    with pytest.raises(TypeError):
+        index.containing(datetime(2012, 6, 15, 10))
+    with pytest.raises(TypeError):
+        IntervalIndex([TEST_CASES[0][1:], (datetime(2012, 1, 1), datetime(2012, 1, 2))])
+    assert IntervalIndex([]).containing(datetime(2012, 6, 15, 10, tzinfo=UTC)) == []
+
+
+# the following list contains tuples of ISO recurring interval strings, the
+# expected number of recurrences and the starts of the first occurrences.
+RECURRING_CASES = [
+    (
+        "R3/2012-06-15T10:00Z/PT2H",
+        3,
+        [datetime(2012, 6, 15, hour, tzinfo=UTC) for hour in (10, 12, 14, 16)],
+    ),
+    (
+        "R/2012-06-15T10:00/2012-06-15T10:30",
+        None,
+        [datetime(2012, 6, 15, 10, minute) for minute in (0, 30)] + [datetime(2012, 6, 15, 11)],
+    ),
+    (
+        "R2/2012-01-31T00:00/P1M",
+        2,
+        [datetime(2012, 1, 31), datetime(2012, 2, 29), datetime(2012, 3, 31)],
+    ),
+    (
+        "R/2012-02-29T12:00/P1YT1H",
+        None,
+        [datetime(2012, 2, 29, 12), datetime(2013, 2, 28, 13), datetime(2014, 2, 28, 14)],
+    ),
+    ("R0/2012-06-15T10:00/P1D", 0, [datetime(2012, 6, 15, 10), datetime(2012, 6, 16, 10)]),
+]
+
+
+@pytest.mark.parametrize("intervalstring, recurrences, starts", RECURRING_CASES)
+def test_parse_recurring(intervalstring: str, recurrences: Optional[int], starts: list[datetime]):
+    """Occurrences follow each other and are computed from the start."""
+    recurring = parse_recurring_interval(intervalstring)
+    assert recurring.recurrences == recurrences
+    occurrences = [Interval(start, end) for start, end in zip(starts, starts[1:])]
+    assert list(islice(recurring, len(occurrences)))[:recurrences] == occurrences[:recurrences]
+    for index, occurrence in enumerate(occurrences[:recurrences]):
+        assert recurring.nth(index) == occurrence
+    if recurrences is not None:
+        assert len(list(recurring)) == recurrences
+        with pytest.raises(IndexError):
+            recurring.nth(recurrences)
+    with pytest.raises(IndexError):
+        recurring.nth(-1)
+
+
+@pytest.mark.parametrize(
+    "intervalstring, exception",
+    [
+        ("R5/2012-06-15T10:00Z", ISO8601Error),
+        ("2012-06-15T10:00Z/PT1H/PT1H", ISO8601Error),
+        ("R-1/2012-06-15T10:00Z/PT1H", ISO8601Error),
+        ("R5/PT1H/2012-06-15T10:00Z", ISO8601Error),
+        ("R5/2012-06-15T10:00/2012-06-15T10:00", ValueError),
+        ("R5/2012-06-15T10:00Z/2012-06-15T12:00", ValueError),
+        ("R5/2012-06-15T10:00/-P1M", ValueError),
+        ("R5/2012-06-15T10:00/P0D", ValueError),
+        ("R5/2012-06-15T10:00/P1.5M", ValueError),
+        (None, TypeError),
+    ],
+)
+def test_parse_recurring_errors(intervalstring: Optional[str], exception: type):
+    """Invalid and unsupported recurring intervals raise an exception."""
+    with pytest.raises(exception):
+        parse_recurring_interval(intervalstring)  # type: ignore [arg-type]
+
+
+@pytest.mark.parametrize(
+    "duration",
+    [timedelta(minutes=7), Duration(months=1), Duration(years=1, months=1, days=3, hours=5)],
+)
+@pytest.mark.parametrize("recurrences", [None, 0, 1, 40])
+def test_recurring_between(duration, recurrences: Optional[int]):
+    """occurrences_between finds the occurrences iterating finds."""
+    rng = random.Random(recurrences)
+    start = datetime(2012, 1, 31, 10, tzinfo=UTC)
+    recurring = RecurringInterval(start, duration, recurrences)
+    occurrences = list(islice(recurring, 60))
+    last = occurrences[-1].start if occurrences else start
+    for _ in range(100):
+        first = start + (last - start) * rng.uniform(-0.2, 1.0)
+        end = first + (last - first) * rng.uniform(0.0, 1.0)
+        expected = [occurrence for occurrence in occurrences if first <= occurrence.start < end]
+        assert list(recurring.occurrences_between(first, end)) == expected
+
+
+def test_recurring_range():
+    """Occurrences are found far from the start and up to the end of the
+    datetime range, naive and aware instants are not compared.
+    """
+    recurring = parse_recurring_interval("R/2000-01-31T10:00/P1M")
+    assert recurring.nth(12 * 7000 + 1).start == datetime(9000, 2, 28, 10)
+    occurrences = recurring.occurrences_between(datetime(9999, 11, 1), datetime(9999, 12, 31, 12))
+    assert [occurrence.start for occurrence in occurrences] == [datetime(9999, 11, 30, 10)]
+    assert len(list(RecurringInterval(datetime(9999, 1, 31), Duration(months=1)))) == 11
+    with pytest.raises(TypeError):
+        recurring.occurrences_between(datetime(2012, 1, 1, tzinfo=UTC), datetime(2013, 1, 1))
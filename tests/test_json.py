@@ -0,0 +1,140 @@
+"""Test cases for the isojson module."""
+
+import json
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from isodate import (
+    DATE_EXT_COMPLETE,
+    TIME_EXT_COMPLETE,
+    UTC,
+    Duration,
+    ISO8601Error,
+    ISOJSONDecoder,
+    ISOJSONEncoder,
+    fixed_offset,
+)
+
+DOCUMENT = {
+    "created": datetime(2012, 6, 15, 10, 20, 30, tzinfo=UTC),
+    "day": date(2012, 6, 15),
+    "at": time(10, 20),
+    "ttl": timedelta(hours=2),
+    "period": Duration(months=1),
+    "items": [
+        {"created": datetime(2012, 1, 1, 12), "note": "2012-06-15"},
+        {"created": None, "note": "P1D"},
+    ],
+}
+# a document with all kinds of values and strings, which must not be parsed.
+
+TEXT = (
+    '{"created": "2012-06-15T10:20:30Z", "day": "2012-06-15", "at": "10:20:00", '
+    '"ttl": "PT2H", "period": "P1M", "items": [{"created": "2012-01-01T12:00:00", '
+    '"note": "2012-06-15"}, {"created": null, "note": "P1D"}]}'
+)
+# DOCUMENT encoded by ISOJSONEncoder.
+
+PATHS = {"day": "date", ("at",): "time", "ttl": "duration", "period": "duration"}
+# key paths and kinds of the values in DOCUMENT, which are not under "created".
+
+
+def test_encode():
+    """The encoder renders the values with the isoformat functions."""
+    assert json.dumps(DOCUMENT, cls=ISOJSONEncoder) == TEXT
+    with pytest.raises(TypeError):
+        json.dumps({1, 2}, cls=ISOJSONEncoder)
+
+
+def test_encode_formats():
+    """The formats of the encoder can be changed."""
+    encoded = json.dumps(
+        [datetime(2012, 6, 15, 10, 20, 30, 500000), date(2012, 6, 15), timedelta(weeks=2)],
+        cls=ISOJSONEncoder,
+        datetime_format=DATE_EXT_COMPLETE + "T" + TIME_EXT_COMPLETE + ".%f",
+        date_format="%Y-W%W",
+        duration_format="P%p",
+    )
+    assert encoded == '["2012-06-15T10:20:30.500000", "2012-W24", "P2W"]'
+
+
+def test_decode():
+    """The decoder parses the values of the configured keys and paths only."""
+    assert json.loads(TEXT, cls=ISOJSONDecoder, keys=["created"], paths=PATHS) == DOCUMENT
+    assert ISOJSONDecoder(keys={"created": "datetime"}, paths=PATHS).decode(TEXT) == DOCUMENT
+    decoded = ISOJSONDecoder(paths=["items.*.created"]).decode(TEXT)
+    assert decoded["created"] == "2012-06-15T10:20:30Z"
+    assert decoded["items"][0]["created"] == datetime(2012, 1, 1, 12)
+    assert json.loads(TEXT, cls=ISOJSONDecoder) == json.loads(TEXT)
+
+
+def test_decode_options():
+    """The options of the parse functions and other hooks are applied."""
+    text = '{"created": "2012-06-15T10:20+02:00", "at": "T1020"}'
+    tz = fixed_offset(1, 0, "+01")
+    decoded = json.loads(
+        text, cls=ISOJSONDecoder, keys={"created": "datetime", "at": "time"}, default_tz=tz
+    )
+    assert decoded["at"] == time(10, 20, tzinfo=tz)
+    decoded = json.loads(text, cls=ISOJSONDecoder, keys=["created"], to_utc=True)
+    assert decoded["created"] == datetime(2012, 6, 15, 8, 20, tzinfo=UTC)
+    decoded = json.loads(text, cls=ISOJSONDecoder, keys=["created"], object_hook=sorted)
+    assert decoded == ["at", "created"]
+    with pytest.raises(ValueError):
+        ISOJSONDecoder(keys=["created"], object_pairs_hook=dict)
+    with pytest.raises(ValueError):
+        ISOJSONDecoder(keys={"created": "timestamp"})
+
+
+def test_decode_errors():
+    """Strings which can not be parsed raise the exceptions of the parse functions."""
+    decoder = ISOJSONDecoder(keys=["created"])
+    with pytest.raises(ISO8601Error):
+        decoder.decode('{"created": "yesterday"}')
+    with pytest.raises(ValueError):
+        decoder.decode('[{"created": "2012-06-31T10:20"}]')
+
+
+def test_decode_hook_order():
+    """Keys are parsed before the object_hook, paths after it."""
+    seen = []
+
+    def hook(obj):
+        seen.append(dict(obj))
+        return obj
+
+    text = '{"created": "2012-06-15T10:20", "ttl": "PT1H"}'
+    decoded = ISOJSONDecoder(keys=["created"], paths={"ttl": "duration"}, object_hook=hook).decode(
+        text
+    )
+    assert seen == [{"created": datetime(2012, 6, 15, 10, 20), "ttl": "PT1H"}]
+    assert decoded["ttl"] == timedelta(hours=1)
+    hook = lambda obj: list(obj.items())  # noqa: E731
+    decoded = ISOJSONDecoder(paths={"ttl": "duration"}, object_hook=hook).decode(text)
+    assert decoded == [("created", "2012-06-15T10:20"), ("ttl", "PT1H")]
+
+
+def test_cache():
+    """Parsed strings are cached per decoder."""
+    decoder = ISOJSONDecoder(keys=["created"], paths={"*.ttl": "duration"}, cache_size=2)
+    decoder.decode('[{"created": "2012-06-15T10:20", "ttl": "PT1H"}] ')
+    decoded = decoder.decode('[{"created": "2012-06-15T10:20", "ttl": "PT1H"}]')
+    assert decoded == [{"created": datetime(2012, 6, 15, 10, 20), "ttl": timedelta(hours=1)}]
+    info = decoder.cache_info()
+    assert (info["datetime"].hits, info["datetime"].misses, info["datetime"].maxsize) == (1, 1, 2)
+    assert (info["duration"].hits, info["duration"].misses) == (1, 1)
+    decoder.cache_clear()
+    assert decoder.cache_info()["datetime"].currsize == 0
+
+
+def test_cache_duration_copies():
+    """Cached Duration values are not shared between decoded documents."""
+    decoder = ISOJSONDecoder(keys=["period"], kind="duration")
+    first = decoder.decode('{"period": "P1M"}')["period"]
+    second = [item["period"] for item in decoder.decode('[{"period": "P1M"}, {"period": "P1M"}]')]
+    assert decoder.cache_info()["duration"].hits == 2
+    assert first == second[0] == second[1] == Duration(months=1)
+    assert first is not second[0] and second[0] is not second[1]
+    first.months += 1
+    assert second[0] == Duration(months=1)
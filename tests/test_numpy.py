@@ -0,0 +1,52 @@
+"""Test cases for the isonumpy module."""
+
+import pytest
+
+from isodate import parse_duration_array
+
+np = pytest.importorskip("numpy")
+
+
+def test_parse_duration_array():
+    """Parse a mixed array of designator, alternative and invalid durations."""
+    durations = ["P1Y2M3DT4H5M6.5S", "PT0.000001S", "-P2W", "P0018-09-04T11:09:08", "P1X", ""]
+    tdeltas, months, valid = parse_duration_array(durations)
+    assert tdeltas.dtype == np.dtype("timedelta64[us]")
+    assert months.dtype == np.int64
+    assert valid.tolist() == [True, True, True, True, False, False]
+    assert months.tolist() == [14, 0, 0, 225, 0, 0]
+    expected = np.array(
+        [
+            ((3 * 24 + 4) * 60 + 5) * 60 * 10**6 + 6500000,
+            1,
+            -14 * 86400 * 10**6,
+            (((4 * 24 + 11) * 60 + 9) * 60 + 8) * 10**6,
+        ],
+        dtype="timedelta64[us]",
+    )
+    assert (tdeltas[:4] == expected).all()
+    assert np.isnat(tdeltas[4:]).all()
+
+
+def test_parse_duration_array_shape():
+    """The result arrays have the same shape as the input array."""
+    durations = np.array([["PT1S", "P1M"], ["bad", "PT1.5S"]])
+    tdeltas, months, valid = parse_duration_array(durations, unit="ns")
+    assert tdeltas.shape == months.shape == valid.shape == (2, 2)
+    assert tdeltas.dtype == np.dtype("timedelta64[ns]")
+    assert tdeltas[1, 1] == np.timedelta64(1500000000, "ns")
+    assert valid.tolist() == [[True, True], [False, True]]
+
+
+def test_parse_duration_array_overflow():
+    """Values not representable as int64 are reported as invalid."""
+    tdeltas, months, valid = parse_duration_array(["P999999999999W", None])
+    assert valid.tolist() == [False, False]
+    assert np.isnat(tdeltas).all()
+
+
+@pytest.mark.parametrize("unit", ["ms", "s", "US"])
+def test_parse_duration_array_unit(unit: str):
+    """An unsupported unit raises instead of marking every value invalid."""
+    with pytest.raises(ValueError):
+        parse_duration_array(["PT1S"], unit=unit)
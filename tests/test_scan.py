@@ -0,0 +1,82 @@
+"""Test cases for the isoscan module."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from isodate import (
+    UTC,
+    Duration,
+    FixedOffset,
+    find_datetimes,
+    iter_datetimes,
+    parse_datetime,
+)
+
+TEXT = (
+    "2012-06-15T10:20:30Z INFO job took PT1.5S, next run 2012-06-16;\n"
+    "id=20120615T102030-0500 on 2012-W24-5, retry after -P1DT2H or P1Y2M.\n"
+    "ts:2012-167T10:20+01:00 from 10.0.0.1:8080 version 1.2.3\n"
+)
+# a text with embedded ISO values and numbers, which are no ISO values.
+
+# the following list contains tuples of a text and the ISO strings found in it.
+TEST_CASES = [
+    (
+        TEXT,
+        [
+            "2012-06-15T10:20:30Z",
+            "PT1.5S",
+            "2012-06-16",
+            "20120615T102030-0500",
+            "2012-W24-5",
+            "-P1DT2H",
+            "P1Y2M",
+            "2012-167T10:20+01:00",
+        ],
+    ),
+    ("from 2012-06-15 to 2012-06-20", ["2012-06-15", "2012-06-20"]),
+    ("1985 1020 10:20:30 1985-04 1985-102 19850412", []),
+    ("2012-02-30 2012-06-15T25:00 P1D2H PT P", []),
+    ("x2012-06-15 2012-06-15x 2012-06-15_1 v1.2012-06-15 2012-06-15-1", []),
+    ("2012-06-15T10:20:30:40 2012-06-15T10:20:30+01:00:00", []),
+    ("(2012-06-15T10:20), [P3W] '2012-W24'.", ["2012-06-15T10:20", "P3W", "2012-W24"]),
+    ("", []),
+]
+
+
+@pytest.mark.parametrize("text, expected", TEST_CASES)
+def test_find(text: str, expected: list[str]):
+    """find_datetimes finds the valid ISO values in the text."""
+    assert [text[start:end] for start, end, _ in find_datetimes(text)] == expected
+
+
+def test_values():
+    """The values are the ones of the parse functions."""
+    found = find_datetimes(TEXT)
+    assert [value for _, _, value in found] == [
+        datetime(2012, 6, 15, 10, 20, 30, tzinfo=UTC),
+        timedelta(seconds=1.5),
+        date(2012, 6, 16),
+        datetime(2012, 6, 15, 10, 20, 30, tzinfo=FixedOffset(-5, 0, "-0500")),
+        date(2012, 6, 15),
+        -timedelta(days=1, hours=2),
+        Duration(years=1, months=2),
+        datetime(2012, 6, 15, 10, 20, tzinfo=FixedOffset(1, 0, "+01:00")),
+    ]
+    assert list(iter_datetimes(TEXT)) == found
+
+
+def test_options():
+    """The kinds and the options of the parse functions can be given."""
+    kinds = [value for _, _, value in find_datetimes(TEXT, kinds=("date",))]
+    assert kinds == [date(2012, 6, 16), date(2012, 6, 15)]
+    assert len(find_datetimes(TEXT, kinds=["datetime", "duration"])) == 6
+    utc = find_datetimes(TEXT, kinds=("datetime",), to_utc=True)
+    assert [value for _, _, value in utc] == [
+        parse_datetime(TEXT[start:end], to_utc=True) for start, end, _ in utc
+    ]
+    _, _, value = find_datetimes("in PT36H", as_timedelta_if_possible=False)[0]
+    assert isinstance(value, Duration)
+    with pytest.raises(ValueError):
+        find_datetimes(TEXT, kinds=("time",))
@@ -0,0 +1,98 @@
+"""Test cases for the isostats module."""
+
+import pytest
+
+from isodate import (
+    ISO8601Error,
+    enable_stats,
+    get_stats,
+    parse_date,
+    parse_datetime,
+    parse_duration,
+    parse_time,
+    parse_tzinfo,
+    reset_stats,
+)
+from isodate.isodates import build_date_regexps
+from isodate.isotime import build_time_regexps
+
+
+@pytest.fixture
+def stats():
+    """Record statistics during a test only."""
+    reset_stats()
+    enable_stats()
+    yield
+    enable_stats(False)
+    reset_stats()
+
+
+def test_disabled():
+    """Nothing is recorded while statistics are disabled."""
+    reset_stats()
+    parse_date("2012-06-15")
+    assert get_stats() == {"calls": {}, "patterns": {}}
+
+
+def test_calls(stats):
+    """Calls, errors and latencies are recorded per parse function."""
+    parse_date("2012-06-15")
+    parse_date("20120615")
+    with pytest.raises(ISO8601Error):
+        parse_date("2012-06-15x")
+    with pytest.raises(ValueError):
+        parse_date("2012-13-01")
+    parse_duration("P1D")
+    parse_tzinfo("+01:00")
+    calls = get_stats()["calls"]
+    assert set(calls) == {"parse_date", "parse_duration", "parse_tzinfo"}
+    date_stats = calls["parse_date"]
+    assert date_stats["calls"] == 4
+    assert date_stats["errors"] == 1
+    assert date_stats["error_rate"] == 0.25
+    assert date_stats["exceptions"] == 1
+    assert sum(date_stats["histogram"].values()) == 4
+    assert date_stats["total_ns"] >= max(date_stats["histogram"]) // 2
+    assert all(bucket & (bucket - 1) == 0 for bucket in date_stats["histogram"])
+
+
+def test_nested_calls(stats):
+    """parse_datetime is also recorded as parse_date and parse_time call."""
+    parse_datetime("2012-06-15T10:20:30Z")
+    calls = get_stats()["calls"]
+    assert {name: value["calls"] for name, value in calls.items()} == {
+        "parse_datetime": 1,
+        "parse_date": 1,
+        "parse_time": 1,
+    }
+
+
+def test_patterns(stats):
+    """The index of the matching regular expression is recorded."""
+    parse_date("2012-06-15")
+    parse_date("2012-06-15")
+    parse_date("2012W234")
+    parse_time("10:20")
+    with pytest.raises(ISO8601Error):
+        parse_time("10:20:30:40")
+    patterns = get_stats()["patterns"]
+    date_regexps = build_date_regexps()
+    date_index = next(i for i, regex in enumerate(date_regexps) if regex.match("2012-06-15"))
+    week_index = next(i for i, regex in enumerate(date_regexps) if regex.match("2012W234"))
+    assert patterns["date"]["hits"] == {date_index: 2, week_index: 1}
+    assert patterns["date"]["misses"] == 0
+    assert patterns["date"]["tried"] == 2 * (date_index + 1) + week_index + 1
+    time_index = next(i for i, regex in enumerate(build_time_regexps()) if regex.match("10:20"))
+    assert patterns["time"] == {
+        "hits": {time_index: 1},
+        "misses": 1,
+        "tried": time_index + 1 + len(build_time_regexps()),
+        "mean_tried": (time_index + 1 + len(build_time_regexps())) / 2,
+    }
+
+
+def test_reset(stats):
+    """reset_stats discards all statistics."""
+    parse_date("2012-06-15")
+    reset_stats()
+    assert get_stats() == {"calls": {}, "patterns": {}}
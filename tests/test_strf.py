@@ -1,11 +1,28 @@
 """Test cases for the isodate module."""
 
+import io
 import time
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
+from typing import Union
 
 import pytest
 
-from isodate import DT_EXT_COMPLETE, LOCAL, strftime, tzinfo
+from isodate import (
+    DATE_EXT_COMPLETE,
+    DT_EXT_COMPLETE,
+    LOCAL,
+    TIME_EXT_COMPLETE,
+    TZ_EXT,
+    UTC,
+    Duration,
+    FixedOffset,
+    format_many,
+    isostrf,
+    strftime,
+    strftime_into,
+    tzinfo,
+    write_formatted,
+)
 
 TEST_CASES: list[tuple[datetime, str, str]] = [
     (
@@ -68,6 +85,10 @@ def tz_patch(monkeypatch):
     # assume DST = +11:00
     monkeypatch.setattr(tzinfo, "DSTOFFSET", timedelta(seconds=39600))
     monkeypatch.setattr(tzinfo, "DSTDIFF", tzinfo.DSTOFFSET - tzinfo.STDOFFSET)
+    # forget DST transitions computed with the real time.localtime
+    LOCAL.clear_cache()
+    yield
+    LOCAL.clear_cache()
 
 
 @pytest.mark.parametrize("dt, format, expectation", TEST_CASES)
@@ -81,3 +102,131 @@ def test_format(tz_patch, dt: datetime, format: str, expectation: str):
             strftime(dt, format)
     else:
         assert strftime(dt, format) == expectation
+
+
+# the following list contains tuples of values, a format string, the number of
+# year digits and the expected result from strftime.
+LITERAL_TEST_CASES: list[tuple[object, str, int, str]] = [
+    (date(2012, 1, 2), "%%Y is %Y", 4, "%Y is 2012"),
+    (date(2012, 1, 2), "%x %Y%", 4, "%x 2012%"),
+    (date(2012, 1, 2), "%Y-%m-%d", 6, "+002012-01-02"),
+    (date(2012, 1, 2), "%C", 6, "+0020"),
+    (date(2012, 1, 2), "no directives", 4, "no directives"),
+    (timedelta(days=1, seconds=3661), "%d %H:%M:%S %%P %P", 4, "01 01:01:01 %P 1DT1H1M1S"),
+    (Duration(years=3, months=2), "%Y/%m %Z", 4, "0003/02 %Z"),
+]
+
+
+@pytest.mark.parametrize("value, format, yeardigits, expectation", LITERAL_TEST_CASES)
+def test_format_literals(value, format: str, yeardigits: int, expectation: str):
+    """Literal text and escaped % characters are kept in the compiled format."""
+    assert strftime(value, format, yeardigits) == expectation  # type: ignore [arg-type]
+
+
+def test_program_cache():
+    """A format string is compiled only once per year digits and value kind."""
+    isostrf.STRF_PROGRAM_CACHE.clear()
+    strftime(date(2012, 1, 2), "%Y-%m-%d")
+    strftime(date(2013, 1, 2), "%Y-%m-%d")
+    strftime(date(2013, 1, 2), "%Y-%m-%d", 6)
+    strftime(timedelta(days=1), "%d")
+    assert sorted(isostrf.STRF_PROGRAM_CACHE) == [
+        ("%Y-%m-%d", 4, False, False),
+        ("%Y-%m-%d", 6, False, False),
+        ("%d", 4, True, False),
+    ]
+
+
+NATIVE_TEST_VALUES: list[datetime] = [
+    datetime(1, 1, 1),
+    datetime(999, 12, 31, 23, 59, 59, 999999),
+    datetime(9999, 12, 31, 23, 59, 59),
+    datetime(2012, 10, 12, 8, 29, 46, 69178, UTC),
+    datetime(2012, 10, 12, 8, 29, 46, tzinfo=FixedOffset(-5, -30, "-05:30")),
+    datetime(2012, 10, 12, 8, 29, 46, 1, tzinfo=FixedOffset(0, 0.5, "+00:00:30")),
+    datetime(2012, 10, 12, 8, 29, 46, tzinfo=timezone.utc),
+    datetime(2012, 10, 12, 8, 29, 46, tzinfo=timezone(timedelta(hours=14))),
+    datetime(2012, 10, 12, 8, 29, 46, tzinfo=FixedOffset(30, 0, "+30:00")),
+    datetime(2012, 10, 12, 8, 29, 46, tzinfo=FixedOffset(-25, 0, "-25:00")),
+    datetime(2012, 12, 25, 13, 30, 0, 0, LOCAL),
+    datetime(1999, 12, 25, 13, 30, 0, 0, LOCAL),
+]
+
+
+@pytest.mark.parametrize(
+    "format", [DATE_EXT_COMPLETE, TIME_EXT_COMPLETE, TIME_EXT_COMPLETE + TZ_EXT, DT_EXT_COMPLETE]
+)
+@pytest.mark.parametrize("dt", NATIVE_TEST_VALUES)
+def test_format_native(tz_patch, dt: datetime, format: str):
+    """The isoformat based fast path produces exactly the generic output."""
+    generic = isostrf._compile(format, 4, False)
+    for value in (dt, dt.date(), dt.time(), dt.timetz()):
+        try:
+            expectation = generic(value)
+        except Exception as exc:
+            with pytest.raises(type(exc)):
+                strftime(value, format)
+        else:
+            assert strftime(value, format) == expectation
+
+
+def test_format_many():
+    """format_many produces the same strings as strftime for each value."""
+    dates = [datetime(2012, 10, 12, 8, 29, 46, 69178, UTC), date(1999, 12, 31)]
+    durations = [timedelta(days=1, seconds=3661), Duration(years=3, months=2, days=5)]
+    for values, format in ((dates, "%Y-%m-%d"), (durations, "P%P"), (dates + durations, "%d")):
+        assert format_many(values, format, 6) == [strftime(v, format, 6) for v in values]
+
+
+@pytest.mark.parametrize("streamtype", [io.StringIO, io.BytesIO])
+def test_write_formatted(monkeypatch, streamtype):
+    """write_formatted writes chunks to text and binary streams."""
+    stream = streamtype()
+    monkeypatch.setattr(isostrf, "STRF_CHUNK_SIZE", 3)
+    values = [date(2000, 1, day) for day in range(1, 8)]
+    assert write_formatted(values, DATE_EXT_COMPLETE, stream, sep=",") == 7
+    expectation = ",".join(strftime(v, DATE_EXT_COMPLETE) for v in values)
+    if isinstance(stream, io.BytesIO):
+        assert stream.getvalue() == expectation.encode("ascii")
+    else:
+        assert stream.getvalue() == expectation
+    assert write_formatted([], DATE_EXT_COMPLETE, io.StringIO()) == 0
+
+
+# the following list contains tuples of values and format strings to test
+# formatting into bytes.
+BYTES_TEST_CASES: list[tuple[Union[timedelta, Duration, date], str]] = [
+    (datetime(2012, 10, 12, 8, 29, 46, 69178, UTC), DT_EXT_COMPLETE),
+    (datetime(2012, 10, 12, 8, 29, 46, tzinfo=FixedOffset(-5, 0, "-05:00")), "%Y%jT%H%M%S%z"),
+    (date(2012, 10, 12), "%Y-W%W-%w %C %%"),
+    (date(2012, 10, 12), "%Y-%m-%d"),
+    (timedelta(days=1, seconds=3661, microseconds=5), "P%P"),
+    (Duration(years=3, months=2, days=5), "P%p %Y %m"),
+]
+
+
+@pytest.mark.parametrize("value, format", BYTES_TEST_CASES)
+def test_strftime_into(value: Union[timedelta, Duration, date], format: str):
+    """strftime_into writes the ASCII bytes of strftime into buffers and streams."""
+    expectation = strftime(value, format, 6).encode("ascii")
+    buffer = bytearray(b"xx")
+    assert strftime_into(value, format, buffer, 2, 6) == len(expectation)
+    assert buffer == b"xx" + expectation
+    view = memoryview(bytearray(len(expectation) + 1))
+    assert strftime_into(value, format, view, 1, 6) == len(expectation)
+    assert view[1:].tobytes() == expectation
+    stream = io.BytesIO()
+    assert strftime_into(value, format, stream, yeardigits=6) == len(expectation)
+    assert stream.getvalue() == expectation
+    with pytest.raises(ValueError):
+        strftime_into(value, format, memoryview(bytearray(1)), yeardigits=6)
+    with pytest.raises(ValueError):
+        strftime_into(value, format, bytearray(), 1, 6)
+
+
+@pytest.mark.parametrize("year", [1, 2004, 2008, 2009, 2010, 2015, 2020, 9999])
+def test_format_week_ordinal(year: int):
+    """%j and %W match the calendar data of the datetime module around new year."""
+    for day in [date(year, 1, d) for d in range(1, 8)] + [date(year, 12, d) for d in range(25, 32)]:
+        assert strftime(day, "%j") == "%03d" % day.timetuple().tm_yday
+        assert strftime(day, "%W-%w") == "%02d-%d" % day.isocalendar()[1:]
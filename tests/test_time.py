@@ -1,11 +1,12 @@
 """Test cases for the isotime module."""
 
-from datetime import time
+from datetime import time, tzinfo
 from typing import Optional
 
 import pytest
 
 from isodate import (
+    LOCAL,
     TIME_BAS_COMPLETE,
     TIME_BAS_MINUTE,
     TIME_EXT_COMPLETE,
@@ -124,3 +125,39 @@ def test_format(timestring: str, expectation: Optional[time], format: Optional[s
             time_isoformat(expectation, format)  # type: ignore [arg-type]
     elif format is not None:
         assert time_isoformat(expectation, format) == timestring
+
+
+# the following list contains tuples of ISO time strings, the default_tz and
+# the expected result from parse_time with to_utc=True. A result of None means
+# a ValueError is expected.
+UTC_TEST_CASES: list[tuple[str, Optional[tzinfo], Optional[time]]] = [
+    ("10:20:30Z", None, time(10, 20, 30, tzinfo=UTC)),
+    ("10:20:30.5+05:30", None, time(4, 50, 30, 500000, UTC)),
+    ("20:00-0500", None, time(1, tzinfo=UTC)),
+    ("01:00+02", None, time(23, tzinfo=UTC)),
+    ("10:20:30", None, time(10, 20, 30)),
+    ("10:20:30", UTC, time(10, 20, 30, tzinfo=UTC)),
+    ("10:20:30", FixedOffset(1, 0, "+01:00"), time(9, 20, 30, tzinfo=UTC)),
+    ("24:00+01:00", None, None),
+    ("10:20+24", None, None),
+    ("10:20:30", LOCAL, None),
+    ("10:20+01", LOCAL, time(9, 20, tzinfo=UTC)),
+]
+
+
+@pytest.mark.parametrize("timestring, default_tz, expected", UTC_TEST_CASES)
+def test_parse_to_utc(timestring: str, default_tz: Optional[tzinfo], expected: Optional[time]):
+    """Parse an ISO time string and convert it to UTC."""
+    if expected is None:
+        with pytest.raises(ValueError):
+            parse_time(timestring, to_utc=True, default_tz=default_tz)
+        return
+    result = parse_time(timestring, to_utc=True, default_tz=default_tz)
+    assert result == expected
+    assert result.tzinfo is expected.tzinfo
+
+
+def test_parse_default_tz():
+    """Naive times get default_tz as time zone."""
+    assert parse_time("10:20", default_tz=UTC).tzinfo is UTC
+    assert parse_time("10:20+01", default_tz=UTC).utcoffset() == FixedOffset(1).utcoffset(None)
@@ -0,0 +1,201 @@
+"""Test cases for the isotzinfo and tzinfo modules."""
+
+import calendar
+import pickle
+import time
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Optional
+
+import pytest
+
+import isodate.tzinfo
+from isodate import (
+    LOCAL,
+    UTC,
+    FixedOffset,
+    fixed_offset,
+    isotzinfo,
+    parse_tzinfo,
+    tz_isoformat,
+)
+
+# the following list contains tuples of tzinfo instances and the expected
+# results of tz_isoformat for the formats %h, %z and %Z.
+# A result of None means an OverflowError is expected.
+TZ_FORMAT_TEST_CASES: list[tuple[Optional[tzinfo], Optional[tuple[str, str, str]]]] = [
+    (None, ("", "", "")),
+    (UTC, ("Z", "Z", "Z")),
+    (FixedOffset(), ("Z", "Z", "Z")),
+    (FixedOffset(5, 30, "+05:30"), ("+05", "+0530", "+05:30")),
+    (FixedOffset(-3, -30, "-03:30"), ("-03", "-0330", "-03:30")),
+    (FixedOffset(99, 59, "+99:59"), ("+99", "+9959", "+99:59")),
+    (FixedOffset(100, 0, "+100"), None),
+    (timezone.utc, ("+00", "+0000", "+00:00")),
+    (timezone(timedelta(hours=-8)), ("-08", "-0800", "-08:00")),
+    (timezone(timedelta(hours=1, seconds=30)), ("+01", "+0100", "+01:00")),
+]
+
+
+@pytest.mark.parametrize("tz, expectation", TZ_FORMAT_TEST_CASES)
+def test_tz_isoformat(tz: Optional[tzinfo], expectation: Optional[tuple[str, str, str]]):
+    """Render the time zone designator in all supported formats."""
+    dt = datetime(2012, 10, 12, 8, 29, 46, tzinfo=tz)
+    for _ in range(2):  # second round uses the cached renderings
+        if expectation is None:
+            with pytest.raises(OverflowError):
+                tz_isoformat(dt, "%Z")
+        else:
+            assert tuple(tz_isoformat(dt, fmt) for fmt in ("%h", "%z", "%Z")) == expectation
+
+
+def test_tz_isoformat_unknown_format():
+    """An unknown format raises a ValueError, unless the time zone is UTC."""
+    with pytest.raises(ValueError):
+        tz_isoformat(datetime(2012, 1, 1, tzinfo=FixedOffset(1, 0, "+01:00")), "%x")
+    with pytest.raises(ValueError):
+        tz_isoformat(datetime(2012, 1, 1, tzinfo=timezone(timedelta(hours=1))), "%x")
+    assert tz_isoformat(datetime(2012, 1, 1, tzinfo=UTC), "%x") == "Z"
+
+
+def test_tz_isoformat_cache(monkeypatch):
+    """Offsets of arbitrary tzinfo instances are rendered once per offset."""
+    monkeypatch.setattr(isotzinfo, "TZ_ISOFORMAT_CACHE", {})
+    for hour in range(24):
+        tz_isoformat(datetime(2012, 1, 1, hour, tzinfo=timezone(timedelta(hours=2))))
+    tz_isoformat(datetime(2012, 1, 1, tzinfo=FixedOffset(2, 0, "+02:00")))
+    assert list(isotzinfo.TZ_ISOFORMAT_CACHE) == [(timedelta(hours=2), None)]
+
+
+@pytest.fixture
+def dst_patch(monkeypatch):
+    """Mock a local time zone of UTC+1 with DST (UTC+2) from 2012-03-25T01:00Z
+    to 2012-10-28T01:00Z.
+
+    Returns a list, which counts the calls to time.localtime.
+    """
+    calls = []
+    dststart = calendar.timegm((2012, 3, 25, 1, 0, 0))
+    dstend = calendar.timegm((2012, 10, 28, 1, 0, 0))
+
+    def localtime_mock(secs: int):
+        calls.append(secs)
+        tt = time.gmtime(secs)
+        return time.struct_time(tt[:8] + (int(dststart <= secs < dstend),))
+
+    monkeypatch.setattr(time, "localtime", localtime_mock)
+    monkeypatch.setattr(isodate.tzinfo, "STDOFFSET", timedelta(hours=1))
+    monkeypatch.setattr(isodate.tzinfo, "DSTOFFSET", timedelta(hours=2))
+    monkeypatch.setattr(isodate.tzinfo, "DSTDIFF", timedelta(hours=1))
+    LOCAL.clear_cache()
+    yield calls
+    LOCAL.clear_cache()
+
+
+# the following list contains tuples of local times and the expected UTC offset
+# in hours for the time zone mocked by dst_patch.
+LOCAL_TEST_CASES: list[tuple[datetime, int]] = [
+    (datetime(2012, 1, 1), 1),
+    (datetime(2012, 3, 25, 1, 59, 59), 1),
+    # 02:00 - 03:00 does not exist
+    (datetime(2012, 3, 25, 2, 30), 2),
+    (datetime(2012, 3, 25, 3, 0), 2),
+    (datetime(2012, 7, 1, 12), 2),
+    (datetime(2012, 10, 28, 1, 59, 59), 2),
+    # 02:00 - 03:00 happens twice
+    (datetime(2012, 10, 28, 2, 30), 2),
+    (datetime(2012, 10, 28, 2, 30, fold=1), 1),
+    (datetime(2012, 10, 28, 3, 0), 1),
+    (datetime(2012, 12, 31, 23, 59, 59), 1),
+]
+
+
+@pytest.mark.parametrize("dt, offset", LOCAL_TEST_CASES)
+def test_local_timezone(dst_patch, dt: datetime, offset: int):
+    """LocalTimezone finds DST transitions and asks time.localtime only once per year."""
+    dt = dt.replace(tzinfo=LOCAL)
+    assert LOCAL.utcoffset(dt) == timedelta(hours=offset)
+    assert LOCAL.dst(dt) == timedelta(hours=offset - 1)
+    calls = len(dst_patch)
+    for day in range(1, 29):
+        LOCAL.utcoffset(dt.replace(day=day))
+    assert LOCAL.utcoffset(dt) == timedelta(hours=offset)
+    assert len(dst_patch) == calls
+
+
+@pytest.fixture
+def new_york_patch(monkeypatch):
+    """Switch the local time zone of the platform to America/New_York."""
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset is not available")
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    if time.tzname != ("EST", "EDT"):
+        monkeypatch.undo()
+        time.tzset()
+        pytest.skip("time zone America/New_York is not available")
+    monkeypatch.setattr(isodate.tzinfo, "STDOFFSET", timedelta(hours=-5))
+    monkeypatch.setattr(isodate.tzinfo, "DSTOFFSET", timedelta(hours=-4))
+    monkeypatch.setattr(isodate.tzinfo, "DSTDIFF", timedelta(hours=1))
+    LOCAL.clear_cache()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+    LOCAL.clear_cache()
+
+
+def test_local_timezone_fold(new_york_patch):
+    """Ambiguous local times are DST for fold=0 and standard time for fold=1."""
+    dt = datetime(2091, 11, 4, 1, 34, tzinfo=LOCAL)
+    assert LOCAL.utcoffset(dt) == timedelta(hours=-4)
+    assert LOCAL.utcoffset(dt.replace(fold=1)) == timedelta(hours=-5)
+    assert LOCAL.tzname(dt) == "EDT"
+    assert LOCAL.tzname(dt.replace(fold=1)) == "EST"
+    assert LOCAL.utcoffset(dt.replace(hour=2)) == timedelta(hours=-5)
+
+
+def test_fixed_offset_value():
+    """FixedOffset instances compare and hash by offset and name."""
+    tz = FixedOffset(5, 30, "+05:30")
+    assert tz == FixedOffset(5, 30, "+05:30")
+    assert hash(tz) == hash(FixedOffset(5, 30, "+05:30"))
+    assert tz != FixedOffset(5, 30, "+0530")
+    assert tz != FixedOffset(5, 0, "+05:30")
+    assert tz != timezone(timedelta(hours=5, minutes=30))
+    assert not hasattr(tz, "__dict__")
+
+
+def test_fixed_offset_shared():
+    """fixed_offset and parse_tzinfo return shared instances."""
+    tz = fixed_offset(5, 30, "+05:30")
+    assert tz is fixed_offset(5, 30, "+05:30")
+    assert tz == FixedOffset(5, 30, "+05:30")
+    assert parse_tzinfo("+05:30") is tz
+    assert parse_tzinfo("+0530") is not tz
+
+
+@pytest.mark.parametrize("proto", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_fixed_offset_pickle(proto: int):
+    """Unpickled FixedOffset objects are the shared instances."""
+    tz = FixedOffset(5, 30, "+05:30")
+    unpickled = pickle.loads(pickle.dumps(tz, proto))
+    assert unpickled == tz
+    assert unpickled is fixed_offset(5, 30, "+05:30")
+
+
+@pytest.mark.parametrize(
+    "pickled",
+    [
+        # FixedOffset(5, 30, "+05:30") pickled with protocols 0 and 2 by isodate 0.7.2
+        b"cisodate.tzinfo\nFixedOffset\np0\n(tRp1\n(dp2\nV_FixedOffset__offset\np3\n"
+        b"cdatetime\ntimedelta\np4\n(I0\nI19800\nI0\ntp5\nRp6\nsV_FixedOffset__name\n"
+        b"p7\nV+05:30\np8\nsb.",
+        b"\x80\x02cisodate.tzinfo\nFixedOffset\nq\x00)Rq\x01}q\x02(X\x14\x00\x00\x00"
+        b"_FixedOffset__offsetq\x03cdatetime\ntimedelta\nq\x04K\x00MXMK\x00\x87q\x05Rq"
+        b"\x06X\x12\x00\x00\x00_FixedOffset__nameq\x07X\x06\x00\x00\x00+05:30q\x08ub.",
+    ],
+)
+def test_fixed_offset_unpickle_legacy(pickled: bytes):
+    """FixedOffset objects pickled by older versions can still be loaded."""
+    tz = pickle.loads(pickled)
+    assert tz == FixedOffset(5, 30, "+05:30")
+    assert tz_isoformat(datetime(2012, 1, 1, tzinfo=tz)) == "+05:30"
@@ -0,0 +1,218 @@
+"""Test cases for the isovalid module."""
+
+from datetime import date, datetime, time, timedelta
+from typing import Any, Callable
+
+import pytest
+
+from isodate import (
+    ERROR_FORMAT,
+    ERROR_RANGE,
+    ERROR_TYPE,
+    LOCAL,
+    UTC,
+    Duration,
+    ISO8601Error,
+    is_valid_date,
+    is_valid_datetime,
+    is_valid_duration,
+    is_valid_time,
+    parse_date,
+    parse_datetime,
+    parse_duration,
+    parse_time,
+    try_parse_date,
+    try_parse_datetime,
+    try_parse_duration,
+    try_parse_time,
+    valid_mask,
+)
+
+# the following list contains tuples of a validator, the parse function it
+# mirrors, the string to check and whether the string is valid.
+TEST_CASES: list[tuple[Callable[[str], bool], Callable[[str], Any], str, bool]] = [
+    (is_valid_date, parse_date, "19", True),
+    (is_valid_date, parse_date, "1985", True),
+    (is_valid_date, parse_date, "0000", False),
+    (is_valid_date, parse_date, "1985-04", True),
+    (is_valid_date, parse_date, "1985-00", True),
+    (is_valid_date, parse_date, "1985-13", False),
+    (is_valid_date, parse_date, "1985-04-12", True),
+    (is_valid_date, parse_date, "19850431", False),
+    (is_valid_date, parse_date, "2012-02-29", True),
+    (is_valid_date, parse_date, "1900-02-29", False),
+    (is_valid_date, parse_date, "1985-102", True),
+    (is_valid_date, parse_date, "1985-000", True),
+    (is_valid_date, parse_date, "0001-000", False),
+    (is_valid_date, parse_date, "9999-365", True),
+    (is_valid_date, parse_date, "9999-366", False),
+    (is_valid_date, parse_date, "1985W155", True),
+    (is_valid_date, parse_date, "2012-W53-1", True),
+    (is_valid_date, parse_date, "9999-W52-5", True),
+    (is_valid_date, parse_date, "9999-W52-6", False),
+    (is_valid_date, parse_date, "0001-W00", False),
+    (is_valid_date, parse_date, "1985-W15", True),
+    (is_valid_date, parse_date, "1985-04-12x", False),
+    (is_valid_date, parse_date, "+1985-04-12", False),
+    (is_valid_time, parse_time, "232050", True),
+    (is_valid_time, parse_time, "23:20:50.5+01:00", True),
+    (is_valid_time, parse_time, "24:00:00", False),
+    (is_valid_time, parse_time, "23:60", False),
+    (is_valid_time, parse_time, "23:59:60", False),
+    (is_valid_time, parse_time, "23:59,99999999Z", True),
+    (is_valid_time, parse_time, "23.5", True),
+    (is_valid_time, parse_time, "24.5", False),
+    (is_valid_time, parse_time, "05.001111111", False),
+    (is_valid_time, parse_time, "05.001111112", True),
+    (is_valid_time, parse_time, "23:59." + "9" * 30, False),
+    (is_valid_time, parse_time, "23:59." + "9" * 20, True),
+    (is_valid_time, parse_time, "T1020", True),
+    (is_valid_time, parse_time, "10:20:30:40", False),
+    (is_valid_datetime, parse_datetime, "2012-06-15T10:20:30Z", True),
+    (is_valid_datetime, parse_datetime, "20120615T102030+0130", True),
+    (is_valid_datetime, parse_datetime, "2012-06-31T10:20:30Z", False),
+    (is_valid_datetime, parse_datetime, "2012-06-15T25:20:30Z", False),
+    (is_valid_datetime, parse_datetime, "2012-06-15 10:20:30", False),
+    (is_valid_datetime, parse_datetime, "2012-06-15TT10:20", False),
+    (is_valid_duration, parse_duration, "P1Y2M3DT4H5M6.5S", True),
+    (is_valid_duration, parse_duration, "-P3W", True),
+    (is_valid_duration, parse_duration, "PT", True),
+    (is_valid_duration, parse_duration, "P", False),
+    (is_valid_duration, parse_duration, "P1D2H", False),
+    (is_valid_duration, parse_duration, "P999999999DT23H59M59.999999S", True),
+    (is_valid_duration, parse_duration, "-P999999999DT23H59M59.999999S", False),
+    (is_valid_duration, parse_duration, "P1000000000D", False),
+    (is_valid_duration, parse_duration, "P" + "9" * 400 + "D", False),
+    (is_valid_duration, parse_duration, "P0018-09-04T11:09:00", True),
+    (is_valid_duration, parse_duration, "P0000-09-04T11:09:00", False),
+    (is_valid_duration, parse_duration, "P0018-13-04T11:09:00", False),
+]
+
+
+@pytest.mark.parametrize("validator, parser, value, expected", TEST_CASES)
+def test_valid(
+    validator: Callable[[str], bool], parser: Callable[[str], Any], value: str, expected: bool
+):
+    """The validators accept exactly the strings the parse functions accept."""
+    assert validator(value) is expected
+    if expected:
+        parser(value)
+    else:
+        with pytest.raises((ValueError, OverflowError)):
+            parser(value)
+
+
+@pytest.mark.parametrize(
+    "validator", [is_valid_date, is_valid_time, is_valid_datetime, is_valid_duration]
+)
+def test_not_a_string(validator: Callable[[Any], bool]):
+    """Values which are not strings are invalid."""
+    assert validator(None) is False
+    assert validator(20120615) is False
+
+
+def test_options():
+    """is_valid_date takes the options of parse_date."""
+    assert is_valid_date("+002012-06-15", yeardigits=6)
+    assert not is_valid_date("-002012-06-15", yeardigits=6)
+    assert is_valid_date("+2012-06-15", expanded=True)
+    assert not is_valid_date("2012", defaultmonth=2, defaultday=30)
+
+
+def test_valid_mask():
+    """valid_mask checks each value with the validator."""
+    values = ["2012-06-15T10:20:30Z", "2012-06-15", "2012-06-15T24:00", None]
+    assert valid_mask(values) == [True, False, False, False]
+    assert valid_mask(values[:3], is_valid_date) == [False, True, False]
+    assert valid_mask(["+002012-06-15", "2012-06-15"], is_valid_date, yeardigits=6) == [
+        True,
+        False,
+    ]
+    assert valid_mask(iter(["P1D", "1D"]), is_valid_duration) == [True, False]
+
+
+# the following list contains tuples of a try_parse function, the parse
+# function it mirrors, the string to parse and the expected error code (None
+# if the string can be parsed).
+TRY_PARSE_CASES: list[tuple[Callable[..., Any], Callable[[str], Any], Any, Any]] = [
+    (try_parse_date, parse_date, "1985-04-12", None),
+    (try_parse_date, parse_date, "1985-W15-5", None),
+    (try_parse_date, parse_date, "1985-04-31", ERROR_RANGE),
+    (try_parse_date, parse_date, "1985-4-12", ERROR_FORMAT),
+    (try_parse_date, parse_date, 19850412, ERROR_TYPE),
+    (try_parse_time, parse_time, "23:20:50.5+01:00", None),
+    (try_parse_time, parse_time, "24:00", ERROR_RANGE),
+    (try_parse_time, parse_time, "23:59." + "9" * 30, ERROR_RANGE),
+    (try_parse_time, parse_time, "10:20:30:40", ERROR_FORMAT),
+    (try_parse_time, parse_time, None, ERROR_TYPE),
+    (try_parse_datetime, parse_datetime, "2012-06-15T10:20:30Z", None),
+    (try_parse_datetime, parse_datetime, "2012-06-31T10:20:30:40", ERROR_RANGE),
+    (try_parse_datetime, parse_datetime, "2012-06-15T25:20", ERROR_RANGE),
+    (try_parse_datetime, parse_datetime, "2012-06-15T10:20:30:40", ERROR_FORMAT),
+    (try_parse_datetime, parse_datetime, "2012-06-15", ERROR_FORMAT),
+    (try_parse_datetime, parse_datetime, b"2012-06-15T10:20", ERROR_TYPE),
+    (try_parse_duration, parse_duration, "P1Y2M3DT4H5M6.5S", None),
+    (try_parse_duration, parse_duration, "-P3W", None),
+    (try_parse_duration, parse_duration, "P0018-09-04T11:09:00", None),
+    (try_parse_duration, parse_duration, "P0018-13-04T11:09:00", ERROR_RANGE),
+    (try_parse_duration, parse_duration, "P1000000000D", ERROR_RANGE),
+    (try_parse_duration, parse_duration, "P1D2H", ERROR_FORMAT),
+    (try_parse_duration, parse_duration, "P0018-09-04", ERROR_FORMAT),
+    (try_parse_duration, parse_duration, 1, ERROR_TYPE),
+]
+
+
+@pytest.mark.parametrize("try_parse, parser, value, code", TRY_PARSE_CASES)
+def test_try_parse(
+    try_parse: Callable[..., Any], parser: Callable[[Any], Any], value: Any, code: Any
+):
+    """The try_parse functions return what the parse functions return or raise."""
+    errors: list[str] = []
+    if code is None:
+        assert try_parse(value, errors=errors) == parser(value)
+        assert errors == []
+        return
+    sentinel = object()
+    assert try_parse(value, sentinel, errors=errors) is sentinel
+    assert errors == [code]
+    assert try_parse(value) is None
+    if code == ERROR_FORMAT:
+        with pytest.raises(ISO8601Error):
+            parser(value)
+    elif code == ERROR_RANGE:
+        with pytest.raises((ValueError, OverflowError)) as excinfo:
+            parser(value)
+        assert not isinstance(excinfo.value, ISO8601Error)
+
+
+def test_try_parse_options():
+    """The try_parse functions take the options of the parse functions."""
+    assert try_parse_date("+002012-06", yeardigits=6, defaultday=15) == date(2012, 6, 15)
+    assert try_parse_date("+2012-06-15", expanded=True) == date(2012, 6, 15)
+    assert try_parse_time("10:20+01:00", to_utc=True) == time(9, 20, tzinfo=UTC)
+    assert try_parse_datetime("2012-06-15T01:20+02", to_utc=True) == datetime(
+        2012, 6, 14, 23, 20, tzinfo=UTC
+    )
+    assert try_parse_duration("P1Y", as_timedelta_if_possible=False) == Duration(years=1)
+    assert try_parse_duration("P1D", as_timedelta_if_possible=False) == Duration(days=1)
+    assert try_parse_duration("P1D") == timedelta(days=1)
+
+
+def test_try_parse_utc_range():
+    """The conversion to UTC can leave the range of datetime."""
+    errors: list[str] = []
+    assert try_parse_datetime("0001-01-01T00:30+01:00", errors=errors) is not None
+    assert try_parse_datetime("0001-01-01T00:30+01:00", to_utc=True, errors=errors) is None
+    assert try_parse_datetime("9999-12-31T23:30-01:00", to_utc=True, errors=errors) is None
+    assert errors == [ERROR_RANGE, ERROR_RANGE]
+    assert try_parse_datetime("0001-01-01T01:30+01:00", to_utc=True) == datetime(
+        1, 1, 1, 0, 30, tzinfo=UTC
+    )
+
+
+def test_try_parse_time_local():
+    """Times without date can not be converted from LOCAL to UTC."""
+    errors: list[str] = []
+    assert try_parse_time("10:00", "none", to_utc=True, default_tz=LOCAL, errors=errors) == "none"
+    assert errors == [ERROR_RANGE]
+    assert try_parse_time("10:00+01", to_utc=True, default_tz=LOCAL) == time(9, tzinfo=UTC)